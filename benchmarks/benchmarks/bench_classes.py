@@ -0,0 +1,64 @@
+"""Building, copying and viewing the core graph classes."""
+import networkx as nx
+
+from .common import edge_list, families, make_graph, sizes
+
+
+class GraphBuild:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.nodes = list(range(n))
+        self.edges = edge_list(family, n)
+        self.weighted = edge_list(family, n, weighted=True)
+
+    def time_add_nodes_from(self, family, n):
+        nx.Graph().add_nodes_from(self.nodes)
+
+    def time_add_edges_from(self, family, n):
+        nx.Graph().add_edges_from(self.edges)
+
+    def time_add_weighted_edges_from(self, family, n):
+        nx.Graph().add_edges_from(self.weighted)
+
+    def time_add_edges_from_digraph(self, family, n):
+        nx.DiGraph().add_edges_from(self.edges)
+
+    def time_add_edges_from_multigraph(self, family, n):
+        nx.MultiGraph().add_edges_from(self.edges)
+
+    def peakmem_add_edges_from(self, family, n):
+        nx.Graph().add_edges_from(self.weighted)
+
+    def mem_graph(self, family, n):
+        G = nx.Graph()
+        G.add_edges_from(self.weighted)
+        return G
+
+
+class GraphCopy:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.half = list(self.G)[:n // 2]
+
+    def time_copy(self, family, n):
+        self.G.copy()
+
+    def time_copy_as_view(self, family, n):
+        self.G.copy(as_view=True)
+
+    def time_to_directed(self, family, n):
+        self.G.to_directed()
+
+    def time_subgraph(self, family, n):
+        self.G.subgraph(self.half).copy()
+
+    def time_remove_nodes_from(self, family, n):
+        self.G.copy().remove_nodes_from(self.half)
+
+    def peakmem_to_directed(self, family, n):
+        self.G.to_directed()
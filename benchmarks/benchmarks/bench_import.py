@@ -0,0 +1,10 @@
+"""Time taken by ``import networkx`` in a fresh interpreter."""
+
+
+class ImportSuite:
+    def timeraw_import_networkx(self):
+        return "import networkx"
+
+    def timeraw_first_algorithm_lookup(self):
+        # the subpackages are only imported on the first lookup
+        return "networkx.pagerank", "import networkx"
@@ -0,0 +1,66 @@
+"""Reading and writing edge lists and GraphML."""
+import os
+import shutil
+import tempfile
+
+import networkx as nx
+
+from .common import families, make_graph, sizes
+
+
+class EdgeList:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph.edgelist')
+        nx.write_edgelist(self.G, self.path)
+        self.plain = os.path.join(self.dir, 'plain.edgelist')
+        nx.write_edgelist(self.G, self.plain, data=False)
+        self.weighted = os.path.join(self.dir, 'weighted.edgelist')
+        nx.write_weighted_edgelist(self.G, self.weighted)
+
+    def teardown(self, family, n):
+        shutil.rmtree(self.dir)
+
+    def time_read_edgelist(self, family, n):
+        nx.read_edgelist(self.path, nodetype=int)
+
+    def time_read_edgelist_no_data(self, family, n):
+        nx.read_edgelist(self.plain, nodetype=int, data=False)
+
+    def time_read_weighted_edgelist(self, family, n):
+        nx.read_weighted_edgelist(self.weighted, nodetype=int)
+
+    def time_write_edgelist(self, family, n):
+        nx.write_edgelist(self.G, os.path.join(self.dir, 'out.edgelist'))
+
+    def peakmem_read_edgelist(self, family, n):
+        nx.read_edgelist(self.path, nodetype=int)
+
+
+class GraphML:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph.graphml')
+        nx.write_graphml(self.G, self.path)
+
+    def teardown(self, family, n):
+        shutil.rmtree(self.dir)
+
+    def time_generate_graphml(self, family, n):
+        for _ in nx.generate_graphml(self.G):
+            pass
+
+    def time_read_graphml(self, family, n):
+        nx.read_graphml(self.path)
+
+    def peakmem_generate_graphml(self, family, n):
+        for _ in nx.generate_graphml(self.G):
+            pass
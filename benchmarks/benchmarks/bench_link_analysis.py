@@ -0,0 +1,52 @@
+"""PageRank and HITS."""
+import numpy as np
+
+import networkx as nx
+
+from .common import families, make_graph, sizes
+
+
+class LinkAnalysis:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.D = self.G.to_directed()
+        self.pagerank = nx.pagerank_scipy(self.D)
+        # a few changes since the last computation
+        nodes = list(self.D)
+        for u, v in zip(nodes[::97], nodes[13::89]):
+            self.D.add_edge(u, v, weight=1.0)
+
+    def time_pagerank(self, family, n):
+        nx.pagerank(self.D)
+
+    def time_pagerank_scipy(self, family, n):
+        nx.pagerank_scipy(self.D)
+
+    def time_pagerank_scipy_float32(self, family, n):
+        nx.pagerank_scipy(self.D, dtype=np.float32)
+
+    def time_pagerank_scipy_quadratic(self, family, n):
+        nx.pagerank_scipy(self.D, alpha=0.95, acceleration='quadratic')
+
+    def time_pagerank_scipy_warm_start(self, family, n):
+        nx.pagerank_scipy(self.D, nstart=self.pagerank)
+
+
+class HITS:
+    # The largest singular values of grids and of large random geometric
+    # graphs are tied or nearly tied, so the power iteration of HITS does
+    # not converge on them.
+    params = [['gnp', 'barabasi_albert'], sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.D = make_graph(family, n, weighted=True).to_directed()
+
+    def time_hits(self, family, n):
+        nx.hits(self.D)
+
+    def time_hits_scipy(self, family, n):
+        nx.hits_scipy(self.D)
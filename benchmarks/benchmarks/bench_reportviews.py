@@ -0,0 +1,49 @@
+"""Iteration over the node, edge, degree and adjacency views."""
+from .common import families, make_graph, sizes
+
+
+class ReportViews:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.D = self.G.to_directed()
+
+    def time_nodes_data(self, family, n):
+        for _ in self.G.nodes(data=True):
+            pass
+
+    def time_edges(self, family, n):
+        for _ in self.G.edges:
+            pass
+
+    def time_edges_data(self, family, n):
+        for _ in self.G.edges(data='weight'):
+            pass
+
+    def time_out_edges(self, family, n):
+        for _ in self.D.edges:
+            pass
+
+    def time_in_edges(self, family, n):
+        for _ in self.D.in_edges:
+            pass
+
+    def time_degree(self, family, n):
+        for _ in self.G.degree:
+            pass
+
+    def time_weighted_degree(self, family, n):
+        for _ in self.G.degree(weight='weight'):
+            pass
+
+    def time_adjacency(self, family, n):
+        for _, nbrs in self.G.adjacency():
+            for _ in nbrs:
+                pass
+
+    def time_edge_lookup(self, family, n):
+        edges = self.G.edges
+        for e in self.G.edges:
+            e in edges
@@ -0,0 +1,121 @@
+"""Weighted shortest paths and betweenness centrality."""
+from itertools import islice
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import (
+    _dijkstra_multisource, _weight_function)
+
+from .common import families, make_graph, sizes
+
+
+class Dijkstra:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        for u, v, d in self.G.edges(data=True):
+            d['hops'] = int(d['weight'] * 10)
+        self.weight = _weight_function(self.G, 'weight')
+        self.sources = list(self.G)[:8]
+
+    def time_dijkstra_multisource(self, family, n):
+        _dijkstra_multisource(self.G, self.sources, self.weight)
+
+    def time_dijkstra_multisource_paths(self, family, n):
+        paths = {s: [s] for s in self.sources}
+        _dijkstra_multisource(self.G, self.sources, self.weight, paths=paths)
+
+    def time_single_source_dijkstra(self, family, n):
+        nx.single_source_dijkstra(self.G, 0)
+
+    def time_single_source_dial(self, family, n):
+        nx.single_source_dial(self.G, 0, weight='hops')
+
+    def time_single_source_dijkstra_integer(self, family, n):
+        nx.single_source_dijkstra(self.G, 0, weight='hops')
+
+    def time_delta_stepping_path_length(self, family, n):
+        nx.delta_stepping_path_length(self.G, 0, weight='hops')
+
+    def time_single_source_shortest_path_length(self, family, n):
+        nx.single_source_shortest_path_length(self.G, 0)
+
+    def peakmem_single_source_dijkstra(self, family, n):
+        nx.single_source_dijkstra(self.G, 0)
+
+
+class Betweenness:
+    # exact betweenness is quadratic or worse; keep the graphs small
+    params = [families, [100, 500]]
+    param_names = ['family', 'n']
+    timeout = 300
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+
+    def time_betweenness_centrality(self, family, n):
+        nx.betweenness_centrality(self.G)
+
+    def time_weighted_betweenness_centrality(self, family, n):
+        nx.betweenness_centrality(self.G, weight='weight')
+
+    def time_edge_betweenness_centrality(self, family, n):
+        nx.edge_betweenness_centrality(self.G)
+
+    def peakmem_betweenness_centrality(self, family, n):
+        nx.betweenness_centrality(self.G)
+
+    def time_approximate_betweenness_centrality(self, family, n):
+        nx.approximate_betweenness_centrality(self.G, epsilon=0.05, seed=1)
+
+
+class AllPairsLengths:
+    # quadratic output; keep the graphs small
+    params = [families, [100, 500]]
+    param_names = ['family', 'n']
+    timeout = 300
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n)
+
+    def time_all_pairs_shortest_path_length(self, family, n):
+        for source, lengths in nx.all_pairs_shortest_path_length(self.G):
+            pass
+
+    def time_closeness_centrality(self, family, n):
+        nx.closeness_centrality(self.G)
+
+    def time_harmonic_centrality(self, family, n):
+        nx.harmonic_centrality(self.G)
+
+    def time_floyd_warshall_numpy(self, family, n):
+        nx.floyd_warshall_numpy(self.G)
+
+    def time_floyd_warshall_blocked_float32(self, family, n):
+        nx.floyd_warshall_blocked(self.G, dtype='float32')
+
+
+class ShortestSimplePaths:
+    params = [families, [100, 1000]]
+    param_names = ['family', 'n']
+    timeout = 300
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n, weighted=True)
+        self.source = 0
+        # the farthest node, as some graphs are not connected
+        lengths = nx.single_source_shortest_path_length(self.G, 0)
+        self.target = list(lengths)[-1]
+
+    def time_shortest_simple_paths(self, family, n):
+        paths = nx.shortest_simple_paths(self.G, self.source, self.target,
+                                         weight='weight')
+        for path in islice(paths, 100):
+            pass
+
+    def peakmem_shortest_simple_paths_bounded(self, family, n):
+        paths = nx.shortest_simple_paths(self.G, self.source, self.target,
+                                         weight='weight', max_candidates=100)
+        for path in islice(paths, 100):
+            pass
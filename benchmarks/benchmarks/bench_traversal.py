@@ -0,0 +1,46 @@
+"""Breadth-first and depth-first traversal."""
+import networkx as nx
+
+from .common import families, make_graph, sizes
+
+
+class Traversal:
+    params = [families, sizes]
+    param_names = ['family', 'n']
+
+    def setup(self, family, n):
+        self.G = make_graph(family, n)
+        self.D = self.G.to_directed()
+
+    def time_bfs_edges(self, family, n):
+        for _ in nx.bfs_edges(self.G, 0):
+            pass
+
+    def time_bfs_edges_reverse(self, family, n):
+        for _ in nx.bfs_edges(self.D, 0, reverse=True):
+            pass
+
+    def time_bfs_tree(self, family, n):
+        nx.bfs_tree(self.G, 0)
+
+    def time_bfs_tree_direction_optimizing(self, family, n):
+        nx.bfs_tree(self.G, 0, direction_optimizing=True)
+
+    def time_single_source_shortest_path_length(self, family, n):
+        nx.single_source_shortest_path_length(self.G, 0)
+
+    def time_single_source_shortest_path_length_direction_optimizing(
+            self, family, n):
+        nx.single_source_shortest_path_length(self.G, 0,
+                                              direction_optimizing=True)
+
+    def time_dfs_edges(self, family, n):
+        for _ in nx.dfs_edges(self.G, 0):
+            pass
+
+    def time_connected_components(self, family, n):
+        for _ in nx.connected_components(self.G):
+            pass
+
+    def peakmem_bfs_tree(self, family, n):
+        nx.bfs_tree(self.G, 0)
@@ -0,0 +1,57 @@
+"""Graphs shared by the benchmarks.
+
+The 'gnp', 'barabasi_albert' and 'random_geometric' families have an
+average degree of about eight, that is about ``4 * n`` edges, so that
+timings over `sizes` show how a function scales with the size of the
+graph rather than with its density.  The 'grid_2d' family is a square
+grid of ``int(sqrt(n)) ** 2`` nodes with at most four neighbors each,
+that is about ``2 * n`` edges.
+"""
+import math
+import random
+
+import networkx as nx
+
+families = ['gnp', 'barabasi_albert', 'grid_2d', 'random_geometric']
+sizes = [100, 1000, 10000]
+
+_cache = {}
+
+
+def make_graph(family, n, weighted=False, seed=42):
+    """Returns a new graph of `family` with about `n` nodes.
+
+    If `weighted` is True, each edge gets a random float 'weight' in
+    ``[1, 10)``.  Graphs are generated once per process and copied.
+    """
+    key = (family, n, weighted, seed)
+    if key not in _cache:
+        _cache[key] = _generate(family, n, weighted, seed)
+    return _cache[key].copy()
+
+
+def _generate(family, n, weighted, seed):
+    if family == 'gnp':
+        G = nx.fast_gnp_random_graph(n, 8 / n, seed=seed)
+    elif family == 'barabasi_albert':
+        G = nx.barabasi_albert_graph(n, 4, seed=seed)
+    elif family == 'grid_2d':
+        side = int(math.sqrt(n))
+        G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side, side))
+    elif family == 'random_geometric':
+        radius = math.sqrt(8 / (math.pi * n))
+        G = nx.random_geometric_graph(n, radius, seed=seed)
+        for _, data in G.nodes(data=True):
+            data.clear()
+    else:
+        raise ValueError("unknown graph family %r" % family)
+    if weighted:
+        rng = random.Random(seed)
+        for _, _, data in G.edges(data=True):
+            data['weight'] = rng.uniform(1, 10)
+    return G
+
+
+def edge_list(family, n, weighted=False):
+    """Returns the edges of `make_graph(family, n, weighted)` as a list."""
+    return list(make_graph(family, n, weighted).edges(data=weighted))
@@ -54,18 +54,81 @@ from networkx.convert_matrix import *
 import networkx.relabel
 from networkx.relabel import *
 
-import networkx.generators
-from networkx.generators import *
+import threading as _threading
+
+# The remaining subpackages import hundreds of modules, some of them
+# importing NumPy and SciPy.  They are imported, in this order, when one of
+# their names is first looked up on the `networkx` namespace, see
+# `__getattr__` below.  Module attribute lookup hooks need Python 3.7.
+_lazy_subpackages = ['generators', 'readwrite', 'algorithms', 'linalg',
+                     'drawing']
+_lazy_loading = []
+# Held while subpackages are loaded, so that lookups from other threads
+# wait for them.  Lookups made by the loading thread itself, during the
+# import of a subpackage, see `_lazy_loading` instead.
+_lazy_lock = _threading.RLock()
+
+
+def _load_next_subpackage():
+    """Imports the next lazily loaded subpackage and its public names.
+
+    Names are added to the `networkx` namespace as ``from ... import *``
+    would.  Returns False once all subpackages are loaded, or while one
+    is being imported by the calling thread.
+    """
+    import importlib
+    with _lazy_lock:
+        if not _lazy_subpackages or _lazy_loading:
+            return False
+        name = _lazy_subpackages[0]
+        _lazy_loading.append(name)
+        try:
+            module = importlib.import_module('networkx.' + name)
+        finally:
+            _lazy_loading.pop()
+        del _lazy_subpackages[0]
+        names = getattr(module, '__all__', None)
+        if names is None:
+            names = [k for k in vars(module) if not k.startswith('_')]
+        globals().update((k, getattr(module, k)) for k in names)
+        return True
+
+
+def _load_subpackages():
+    """Imports all lazily loaded subpackages."""
+    with _lazy_lock:
+        while _load_next_subpackage():
+            pass
 
-import networkx.readwrite
-from networkx.readwrite import *
 
-# Need to test with SciPy, when available
-import networkx.algorithms
-from networkx.algorithms import *
-import networkx.linalg
-
-from networkx.linalg import *
-
-import networkx.drawing
-from networkx.drawing import *
+import sys
+if sys.version_info[:2] < (3, 7):
+    _load_subpackages()
+else:
+    import types as _types
+
+    def __getattr__(name):
+        if name == '__all__':
+            # ``from networkx import *``
+            _load_subpackages()
+            return [k for k in globals() if not k.startswith('_')]
+        if name.startswith('__'):
+            raise AttributeError(name)
+        namespace = globals()
+        with _lazy_lock:
+            while name not in namespace and _load_next_subpackage():
+                pass
+            if isinstance(namespace.get(name), _types.ModuleType):
+                # a few submodule names (e.g. community) are used by
+                # several subpackages; the last one imported wins
+                _load_subpackages()
+        try:
+            return namespace[name]
+        except KeyError:
+            msg = "module 'networkx' has no attribute '%s'"
+            raise AttributeError(msg % name) from None
+
+    def __dir__():
+        _load_subpackages()
+        return list(globals())
+del sys
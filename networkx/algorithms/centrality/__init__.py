@@ -1,5 +1,7 @@
 from .betweenness import *
 from .betweenness_subset import *
+from .betweenness_approx import *
+from .betweenness_dynamic import *
 from .closeness import *
 from .subgraph_alg import *
 from .current_flow_closeness import *
@@ -1,18 +1,23 @@
 """Betweenness centrality measures."""
+from collections import deque
 from heapq import heappush, heappop
 from itertools import count
 
-from networkx.utils import py_random_state
+from networkx.utils import py_random_state, memoize_on_graph
 from networkx.utils.decorators import not_implemented_for
+from networkx.utils.parallel import (GraphSnapshot, effective_n_jobs,
+                                     map_over_sources)
 
 __all__ = ['betweenness_centrality', 'edge_betweenness_centrality',
            'edge_betweenness']
 
 
+@memoize_on_graph(cacheable=lambda args: args['k'] is None or
+                  isinstance(args['seed'], int))
 @py_random_state(5)
 @not_implemented_for('multigraph')
 def betweenness_centrality(G, k=None, normalized=True, weight=None,
-                           endpoints=False, seed=None):
+                           endpoints=False, seed=None, n_jobs=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node $v$ is the sum of the
@@ -55,6 +60,11 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        The number of processes computing the shortest paths from
+        different sources in parallel.  None or 1 compute them in this
+        process; -1 uses all CPUs.  See :mod:`networkx.utils.parallel`.
+
     Returns
     -------
     nodes : dictionary
@@ -87,6 +97,17 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     For betweenness_centrality we report the number of undirected
     paths when G is undirected.
 
+    Results can be reused for an unchanged graph once the result cache
+    is enabled, see :mod:`networkx.utils.cache`.  Sampled estimates
+    (`k` not None) are reused only for an integer `seed`.
+
+    With several jobs the sources, sampled in this process, are shared
+    out to worker processes, which read the graph from a memory mapped
+    snapshot keeping the order of the neighbors of each node.  The
+    dependencies of the nodes on each source are added in the same order
+    as by a single process, so that the results are identical.  Node
+    labels must then be picklable.
+
     For betweenness_centrality_subset the reporting is different.
     If the source and target subsets are the same, then we want
     to count undirected paths. But if the source and target subsets
@@ -119,7 +140,11 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     if k is None:
         nodes = G
     else:
-        nodes = seed.sample(G.nodes(), k)
+        nodes = seed.sample(list(G), k)
+    if effective_n_jobs(n_jobs) > 1:
+        betweenness = _parallel_betweenness(G, nodes, weight, n_jobs,
+                                            endpoints=endpoints)
+        nodes = ()
     for s in nodes:
         # single source shortest paths
         if weight is None:  # use BFS
@@ -139,7 +164,7 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
 
 @py_random_state(4)
 def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
-                                seed=None):
+                                seed=None, n_jobs=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge $e$ is the sum of the
@@ -177,6 +202,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        The number of processes computing the shortest paths from
+        different sources in parallel.  None or 1 compute them in this
+        process; -1 uses all CPUs.  See :mod:`networkx.utils.parallel`.
+
     Returns
     -------
     edges : dictionary
@@ -195,6 +225,9 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With several jobs the results are identical to those of a single
+    process, see :func:`betweenness_centrality`.
+
     References
     ----------
     .. [1]  A Faster Algorithm for Betweenness Centrality. Ulrik Brandes,
@@ -211,7 +244,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None,
     if k is None:
         nodes = G
     else:
-        nodes = seed.sample(G.nodes(), k)
+        nodes = seed.sample(list(G), k)
+    if effective_n_jobs(n_jobs) > 1:
+        betweenness = _parallel_betweenness(G, nodes, weight, n_jobs,
+                                            edges=True)
+        nodes = ()
     for s in nodes:
         # single source shortest paths
         if weight is None:  # use BFS
@@ -338,6 +375,124 @@ def _accumulate_edges(betweenness, S, P, sigma, s):
     return betweenness
 
 
+def _parallel_betweenness(G, sources, weight, n_jobs, endpoints=False,
+                          edges=False):
+    """Returns the sums of the dependencies on `sources`, computed on a
+    pool of processes.
+
+    The result has the keys of the betweenness dict before rescaling:
+    the nodes, then the edges if `edges` is True.  The dependencies are
+    added in the order of `sources`, as by the serial loop.
+    """
+    nodes = list(G)
+    betweenness = [0.0] * len(nodes)
+    if edges:
+        edge_index = {}
+        for e in G.edges():
+            edge_index.setdefault(e, len(edge_index))
+        # the edge of each slot of the snapshot
+        slot_edge = [edge_index[(u, v)] if (u, v) in edge_index
+                     else edge_index[(v, u)]
+                     for u, nbrs in G._adj.items() for v in nbrs]
+        edge_betweenness = [0.0] * len(edge_index)
+    if weight is not None:
+        name = weight
+
+        def weight(u, v, d):
+            return d.get(name, 1)
+    with GraphSnapshot(G, weight=weight, ordered=True) as snapshot:
+        args = (weight is not None, endpoints, edges)
+        for (targets, values), slots in map_over_sources(
+                snapshot, _dependency_task, sources, n_jobs, args):
+            for i, value in zip(targets, values):
+                betweenness[i] += value
+            if edges:
+                for k, value in zip(*slots):
+                    edge_betweenness[slot_edge[k]] += value
+    betweenness = dict(zip(nodes, betweenness))
+    if edges:
+        betweenness.update(zip(edge_index, edge_betweenness))
+    return betweenness
+
+
+def _dependency_task(arrays, nodes, s, weighted, endpoints, edges):
+    """Brandes' search and accumulation from `s` on the arrays of a
+    snapshot.
+
+    This follows `_single_source_shortest_path_basic` or
+    `_single_source_dijkstra_path_basic` and the accumulation functions
+    step by step, with node numbers for nodes, so that the values are
+    computed with the same floating point operations.  Returns the nodes
+    and amounts added to their betweenness, and the slots of the edges
+    and the amounts added to their edge betweenness if `edges` is True.
+    """
+    indptr, indices, weights = arrays
+    n = len(nodes)
+    S = []
+    P = [[] for _ in range(n)]
+    sigma = [0.0] * n
+    D = {}
+    sigma[s] = 1.0
+    if not weighted:
+        D[s] = 0
+        Q = deque([s])
+        while Q:   # use BFS to find shortest paths
+            v = Q.popleft()
+            S.append(v)
+            Dv = D[v]
+            sigmav = sigma[v]
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                if w not in D:
+                    Q.append(w)
+                    D[w] = Dv + 1
+                if D[w] == Dv + 1:   # this is a shortest path, count paths
+                    sigma[w] += sigmav
+                    P[w].append((v, k))  # predecessors
+    else:
+        seen = {s: 0}
+        c = count()
+        Q = [(0, next(c), s, s)]
+        while Q:
+            (dist, _, pred, v) = heappop(Q)
+            if v in D:
+                continue  # already searched this node.
+            sigma[v] += sigma[pred]  # count paths
+            S.append(v)
+            D[v] = dist
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                vw_dist = dist + weights[k]
+                if w not in D and (w not in seen or vw_dist < seen[w]):
+                    seen[w] = vw_dist
+                    heappush(Q, (vw_dist, next(c), v, w))
+                    sigma[w] = 0.0
+                    P[w] = [(v, k)]
+                elif vw_dist == seen[w]:  # handle equal paths
+                    sigma[w] += sigma[v]
+                    P[w].append((v, k))
+    targets = []
+    values = []
+    slots = ([], [])
+    if endpoints:
+        targets.append(s)
+        values.append(len(S) - 1)
+    delta = dict.fromkeys(S, 0)
+    while S:
+        w = S.pop()
+        coeff = (1 + delta[w]) / sigma[w]
+        for v, k in P[w]:
+            c = sigma[v] * coeff
+            if edges:
+                slots[0].append(k)
+                slots[1].append(c)
+            delta[v] += c
+        if w != s:
+            targets.append(w)
+            values.append(delta[w] + 1 if endpoints else delta[w])
+    return (targets, values), slots
+
+
 def _rescale(betweenness, n, normalized,
              directed=False, k=None, endpoints=False):
     if normalized:
@@ -0,0 +1,342 @@
+"""Approximate betweenness centrality by sampling shortest paths."""
+from heapq import heappush, heappop
+from itertools import count
+from math import ceil, floor, log, log2, sqrt
+
+from networkx.utils import py_random_state
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+__all__ = ['approximate_betweenness_centrality']
+
+
+@py_random_state(6)
+def approximate_betweenness_centrality(G, epsilon=0.01, delta=0.1,
+                                       normalized=True, weight=None,
+                                       top_k=None, seed=None):
+    r"""Estimate the betweenness centrality of nodes within a given error.
+
+    Pairs of distinct nodes $s, t$ are drawn at random and a shortest
+    $(s, t)$-path is drawn at random among all of them.  The fraction of
+    the sampled paths passing through a node $v$ other than $s, t$ is an
+    unbiased estimate of
+
+    .. math::
+
+       b(v) = \frac{1}{n(n-1)} \sum_{s \neq t} \frac{\sigma(s, t|v)}{\sigma(s, t)}
+
+    where $n$ is the number of nodes, $\sigma(s, t)$ is the number of
+    shortest $(s, t)$-paths and $\sigma(s, t|v)$ the number of those
+    passing through $v$.  Paths are sampled until, with probability at
+    least ``1 - delta``, every estimate is within `epsilon` of $b(v)$.
+
+    The number of samples needed is at most that of Riondato and
+    Kornaropoulos [1]_, which depends on `epsilon`, `delta` and the
+    number of nodes of the longest shortest path, but not on the size of
+    the graph.  Sampling stops earlier once the confidence intervals of
+    all estimates, computed as by KADABRA [2]_, are small enough.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.
+
+    epsilon : float, optional (default=0.01)
+      The largest absolute error of the estimates of $b(v)$.
+
+    delta : float, optional (default=0.1)
+      The probability that some estimate misses the error bound.
+
+    normalized : bool, optional (default=True)
+      If True the estimates are scaled as the values of
+      :func:`betweenness_centrality` with ``normalized=True``, that is,
+      multiplied by $n/(n-2)$, otherwise as those with
+      ``normalized=False``.
+
+    weight : None, string or function, optional (default=None)
+      If None, all edge weights are considered equal.  Otherwise holds
+      the name of the edge attribute used as weight, or a function, as
+      for :func:`~networkx.dijkstra_path`.  Weights must be positive.
+
+    top_k : int, optional (default=None)
+      If not None, only estimate the `top_k` nodes of highest
+      betweenness.  Sampling stops as soon as the confidence intervals
+      of these nodes are separated from those of the other nodes, or
+      when all estimates are within `epsilon`.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with estimated betweenness centrality as the
+       value.  If `top_k` is not None, it holds the `top_k` nodes of
+       highest estimate, in decreasing order.
+
+    Raises
+    ------
+    ValueError
+        If `epsilon` or `delta` is not between 0 and 1, or `top_k` is
+        not between 1 and the number of nodes.
+
+    Examples
+    --------
+    >>> G = nx.barbell_graph(20, 3)
+    >>> bc = nx.approximate_betweenness_centrality(G, epsilon=0.02, seed=1)
+    >>> exact = nx.betweenness_centrality(G)
+    >>> max(abs(bc[v] - exact[v]) for v in G) < 0.02 * 43 / 41
+    True
+    >>> sorted(nx.approximate_betweenness_centrality(G, top_k=3, seed=1))
+    [20, 21, 22]
+
+    See Also
+    --------
+    betweenness_centrality
+
+    Notes
+    -----
+    With ``normalized=True`` the bound `epsilon` on $b(v)$ is a bound of
+    ``epsilon * n / (n - 2)`` on the normalized betweenness.
+
+    Shortest paths are found by a breadth-first search from both $s$ and
+    $t$, which stops at the level where they meet and usually visits a
+    small part of the graph, or by Dijkstra's algorithm from $s$ if a
+    weight is given.  The number of nodes of the longest shortest path
+    is bounded by two eccentricities for undirected unweighted graphs,
+    and by the number of nodes otherwise.
+
+    References
+    ----------
+    .. [1] Matteo Riondato and Evgenios M. Kornaropoulos:
+       Fast approximation of betweenness centrality through sampling.
+       Data Mining and Knowledge Discovery 30(2):438-475, 2016.
+    .. [2] Michele Borassi and Emanuele Natale:
+       KADABRA is an ADaptive Algorithm for Betweenness via Random
+       Approximation. ACM Journal of Experimental Algorithmics 24, 2019.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon must be between 0 and 1.")
+    if not 0 < delta < 1:
+        raise ValueError("delta must be between 0 and 1.")
+    nodes = list(G)
+    n = len(nodes)
+    if top_k is not None and not 1 <= top_k <= n:
+        raise ValueError("top_k must be between 1 and the number of nodes.")
+    counts = {}
+    samples = 0
+    diameter = _vertex_diameter_bound(G, weight) if n > 2 else 0
+    if diameter > 2:
+        # the fixed number of samples of Riondato and Kornaropoulos
+        # gets half of delta, the confidence intervals the other half
+        omega = 0.5 / epsilon ** 2 * (floor(log2(diameter - 2)) + 1 +
+                                      log(2 / delta))
+        log_delta = log(4 * n / delta)
+        succ = G._succ if G.is_directed() else G._adj
+        if weight is None:
+            pred = G._pred if G.is_directed() else G._adj
+
+            def sample(s, t):
+                return _sample_path_bfs(succ, pred, s, t, seed)
+        else:
+            weight = _weight_function(G, weight)
+
+            def sample(s, t):
+                return _sample_path_dijkstra(succ, weight, s, t, seed)
+        checkpoint = 100
+        while samples < omega:
+            i = seed.randrange(n)
+            j = seed.randrange(n - 1)
+            s, t = nodes[i], nodes[j + 1 if j >= i else j]
+            for v in sample(s, t):
+                counts[v] = counts.get(v, 0) + 1
+            samples += 1
+            if samples == checkpoint:
+                if _converged(counts, n, samples, omega, log_delta, epsilon,
+                              top_k):
+                    break
+                checkpoint = ceil(checkpoint * 1.2)
+
+    if normalized:
+        scale = n / (n - 2) if n > 2 else 1
+    else:
+        scale = n * (n - 1) if G.is_directed() else n * (n - 1) / 2
+    if samples:
+        scale /= samples
+    if top_k is not None:
+        position = {v: i for i, v in enumerate(nodes)}
+        ranked = sorted(counts, key=lambda v: (-counts[v], position[v]))
+        ranked.extend(v for v in nodes if v not in counts)
+        return {v: counts.get(v, 0) * scale for v in ranked[:top_k]}
+    return {v: counts.get(v, 0) * scale for v in nodes}
+
+
+def _vertex_diameter_bound(G, weight):
+    """Returns an upper bound of the number of nodes of shortest paths."""
+    if weight is not None or G.is_directed():
+        return len(G)
+    # in a connected component, twice the eccentricity of any node
+    # bounds the diameter
+    bound = 1
+    seen = set()
+    for v in G:
+        if v in seen:
+            continue
+        level = 0
+        thislevel = [v]
+        seen.add(v)
+        while thislevel:
+            nextlevel = []
+            for u in thislevel:
+                for w in G._adj[u]:
+                    if w not in seen:
+                        seen.add(w)
+                        nextlevel.append(w)
+            if nextlevel:
+                level += 1
+            thislevel = nextlevel
+        bound = max(bound, 2 * level + 1)
+    return min(bound, len(G))
+
+
+def _converged(counts, n, samples, omega, log_delta, epsilon, top_k):
+    """Returns True if the confidence intervals allow to stop sampling.
+
+    The lower and upper bounds of b(v) are the estimate minus f and plus
+    g, as in KADABRA, with the same probability of failure for each
+    node and bound.
+    """
+    a = omega / samples
+
+    def lower(b):
+        return b - log_delta / samples * (
+            1 / 3 - a + sqrt((1 / 3 - a) ** 2 + 2 * b * omega / log_delta))
+
+    def upper(b):
+        return b + log_delta / samples * (
+            1 / 3 + a + sqrt((1 / 3 + a) ** 2 + 2 * b * omega / log_delta))
+
+    estimates = {v: c / samples for v, c in counts.items()}
+    zero = len(counts) < n
+    if all(b - lower(b) <= epsilon and upper(b) - b <= epsilon
+           for b in estimates.values()) and \
+            (not zero or upper(0) <= epsilon):
+        return True
+    if top_k is None or top_k >= len(counts):
+        return False
+    ranked = sorted(estimates.values(), reverse=True)
+    return lower(ranked[top_k - 1]) > max(upper(ranked[top_k]),
+                                          upper(0) if zero else 0)
+
+
+def _sample_path_bfs(succ, pred, s, t, seed):
+    """Returns the inner nodes of a random shortest path from `s` to `t`.
+
+    A breadth-first search proceeds from `s` along `succ` and from `t`
+    along `pred`, a level at a time on the side with fewer edges to
+    scan, until the new level meets the other side.  The path goes
+    through a node of the meeting level drawn in proportion to the number
+    of paths through it, then back to `s` and on to `t` through nodes
+    drawn in proportion to their number of paths.
+    """
+    dist_s, sigma_s, front_s = {s: 0}, {s: 1}, [s]
+    dist_t, sigma_t, front_t = {t: 0}, {t: 1}, [t]
+    while front_s and front_t:
+        if sum(len(succ[u]) for u in front_s) <= \
+                sum(len(pred[u]) for u in front_t):
+            front_s = _next_level(succ, front_s, dist_s, sigma_s)
+            meet = [x for x in front_s if x in dist_t]
+        else:
+            front_t = _next_level(pred, front_t, dist_t, sigma_t)
+            meet = [x for x in front_t if x in dist_s]
+        if meet:
+            break
+    else:
+        return []
+    x = _draw(meet, [sigma_s[x] * sigma_t[x] for x in meet], seed)
+    path = []
+    v = x
+    while dist_s[v] > 0:
+        path.append(v)
+        v = _draw_next(pred[v], dist_s, sigma_s, v, seed)
+    path.reverse()
+    v = x
+    while dist_t[v] > 0:
+        v = _draw_next(succ[v], dist_t, sigma_t, v, seed)
+        path.append(v)
+    # inner nodes only
+    return path[:-1] if path and path[-1] == t else path
+
+
+def _next_level(adj, front, dist, sigma):
+    level = dist[front[0]] + 1
+    nextlevel = []
+    for u in front:
+        sigma_u = sigma[u]
+        for w in adj[u]:
+            d = dist.get(w)
+            if d is None:
+                dist[w] = level
+                sigma[w] = sigma_u
+                nextlevel.append(w)
+            elif d == level:
+                sigma[w] += sigma_u
+    return nextlevel
+
+
+def _draw(items, counts, seed):
+    r = seed.randrange(sum(counts))
+    for item, c in zip(items, counts):
+        r -= c
+        if r < 0:
+            return item
+
+
+def _draw_next(nbrs, dist, sigma, v, seed):
+    """Draws a neighbor one level closer, in proportion to its paths."""
+    d = dist[v] - 1
+    r = seed.randrange(sigma[v])
+    for w in nbrs:
+        if dist.get(w) == d:
+            r -= sigma[w]
+            if r < 0:
+                return w
+
+
+def _sample_path_dijkstra(succ, weight, s, t, seed):
+    """Returns the inner nodes of a random shortest weighted path from
+    `s` to `t`."""
+    dist = {}
+    seen = {s: 0}
+    sigma = {s: 1}
+    preds = {s: []}
+    c = count()
+    fringe = [(0, next(c), s)]
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        if v == t:
+            break
+        for w, e in succ[v].items():
+            cost = weight(v, w, e)
+            if cost is None or w in dist:
+                continue
+            vw_dist = d + cost
+            if w not in seen or vw_dist < seen[w]:
+                seen[w] = vw_dist
+                sigma[w] = sigma[v]
+                preds[w] = [v]
+                heappush(fringe, (vw_dist, next(c), w))
+            elif vw_dist == seen[w]:
+                sigma[w] += sigma[v]
+                preds[w].append(v)
+    if t not in dist:
+        return []
+    path = []
+    v = _draw(preds[t], [sigma[p] for p in preds[t]], seed)
+    while v != s:
+        path.append(v)
+        v = _draw(preds[v], [sigma[p] for p in preds[v]], seed)
+    return path
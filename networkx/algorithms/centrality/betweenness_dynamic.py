@@ -0,0 +1,395 @@
+"""Betweenness centrality kept up to date as the edges of the graph change."""
+from heapq import heapify, heappush, heappop
+from itertools import count
+
+import networkx as nx
+from networkx.utils import create_py_random_state
+from networkx.algorithms.centrality.betweenness import (
+    _single_source_shortest_path_basic, _accumulate_basic, _rescale)
+
+__all__ = ['DynamicBetweenness']
+
+
+class DynamicBetweenness(object):
+    """Betweenness centrality repaired after edge changes.
+
+    The shortest path counts and dependencies of Brandes' algorithm [1]_
+    are computed once for each source, as by
+    :func:`~networkx.betweenness_centrality`, and kept.  When edges of `G`
+    are then added or removed, only the sources whose shortest paths go
+    through a removed edge, or get shorter or more numerous through an
+    added one, are updated, in the manner of Green et al. [2]_ and
+    Kourtellis et al. [3]_:
+
+    - Distances are repaired as by :class:`~networkx.DynamicShortestPaths`.
+    - Path counts are found again for the nodes whose distance or
+      shortest path predecessors changed, and their descendants whose
+      count changes in turn.
+    - Dependencies are found again for these nodes and their ancestors,
+      before and after the change, and the difference is added to the
+      betweenness.
+
+    Tell the object which edges changed with :meth:`update_edge` or
+    :meth:`update_edges`, or let :meth:`sync` read them from the journal
+    of `G` (see :func:`~networkx.enable_journal`).
+
+    Parameters
+    ----------
+    G : graph
+        The graph, which is referenced, not copied.  Edge weights are
+        ignored.
+
+    k : int, optional (default=None)
+        If k is not None, keep the state of `k` sources drawn at random,
+        and estimate betweenness from them as
+        :func:`~networkx.betweenness_centrality` does.  Memory grows with
+        `k` times the number of nodes instead of its square.
+
+    normalized : bool, optional (default=True)
+        If True the betweenness values are normalized as by
+        :func:`~networkx.betweenness_centrality`.
+
+    endpoints : bool, optional (default=False)
+        If True include the endpoints in the shortest path counts.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+        Note that this is only used if k is not None.
+
+    Attributes
+    ----------
+    sources : list
+        The sources whose shortest paths are counted.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is a multigraph.
+
+    ValueError
+        If `k` is not between 1 and the number of nodes.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> bc = nx.DynamicBetweenness(G, normalized=False)
+    >>> bc.betweenness[2]
+    4.0
+    >>> G.add_edge(0, 4)
+    >>> bc.update_edge(0, 4)
+    >>> bc.betweenness[2]
+    1.0
+
+    With a journal, changes made through the graph methods are found by
+    :meth:`sync`:
+
+    >>> journal = nx.enable_journal(G)
+    >>> G.remove_edge(1, 2)
+    >>> bc.sync()
+    >>> bc.betweenness == nx.betweenness_centrality(G, normalized=False)
+    True
+
+    Notes
+    -----
+    The distance, number of shortest paths and dependency of every node
+    reachable from each source are stored, so the memory needed grows
+    with the number of sources times the number of nodes.  The cost of an
+    update grows with the number of sources affected and, for each of
+    them, with the number of nodes whose counts or dependencies change.
+
+    Adding or removing nodes recomputes everything, and so does
+    :meth:`sync` if the journal misses some changes.  In sampled mode,
+    this draws new sources.  After many updates, the values may differ
+    from those of :func:`~networkx.betweenness_centrality` by rounding;
+    :meth:`rebuild` computes them again from scratch.
+
+    See Also
+    --------
+    betweenness_centrality
+
+    References
+    ----------
+    .. [1] Ulrik Brandes:
+       A Faster Algorithm for Betweenness Centrality.
+       Journal of Mathematical Sociology 25(2):163-177, 2001.
+    .. [2] Oded Green, Robert McColl and David A. Bader:
+       A Fast Algorithm for Streaming Betweenness Centrality.
+       In Proceedings of SocialCom/PASSAT, pages 11-20, 2012.
+    .. [3] Nicolas Kourtellis, Gianmarco De Francisci Morales and
+       Francesco Bonchi: Scalable Online Betweenness Centrality in
+       Evolving Graphs. IEEE Transactions on Knowledge and Data
+       Engineering 27(9):2494-2506, 2015.
+    """
+
+    def __init__(self, G, k=None, normalized=True, endpoints=False,
+                 seed=None):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented("not implemented for "
+                                            "multigraph type")
+        if k is not None and not 1 <= k <= len(G):
+            raise ValueError("k must be between 1 and the number of nodes.")
+        self.G = G
+        self.k = k
+        self.normalized = normalized
+        self.endpoints = endpoints
+        self._seed = create_py_random_state(seed)
+        self.rebuild()
+
+    @property
+    def betweenness(self):
+        """Dictionary of nodes with betweenness centrality as the value."""
+        G = self.G
+        return _rescale(dict(self._betweenness), len(G),
+                        normalized=self.normalized,
+                        directed=G.is_directed(), k=self.k,
+                        endpoints=self.endpoints)
+
+    def rebuild(self):
+        """Recomputes the betweenness from scratch."""
+        G = self.G
+        self._version = nx.graph_version(G)
+        if self.k is None:
+            self.sources = list(G)
+        else:
+            self.sources = self._seed.sample(list(G), min(self.k, len(G)))
+        self._betweenness = betweenness = dict.fromkeys(G, 0.0)
+        self._dist = {}
+        self._sigma = {}
+        self._delta = {}
+        for s in self.sources:
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+            dist = {s: 0}
+            for w in S[1:]:
+                dist[w] = dist[P[w][0]] + 1
+            self._dist[s] = dist
+            self._sigma[s] = {w: sigma[w] for w in S}
+            if self.endpoints:
+                betweenness[s] += len(S) - 1
+            # the dependencies of the nodes other than s, added as by
+            # betweenness_centrality so that the sums are the same
+            delta = _accumulate_basic(dict.fromkeys(S, 0.0), S[:], P,
+                                      sigma, s)
+            for w in S:
+                if w != s:
+                    betweenness[w] += delta[w] + 1 if self.endpoints \
+                        else delta[w]
+            self._delta[s] = delta
+
+    def update_edge(self, u, v):
+        """Repairs the betweenness after edge `(u, v)` was added or
+        removed in the graph."""
+        self.update_edges([(u, v)])
+
+    def update_edges(self, edges):
+        """Repairs the betweenness after `edges` were added or removed in
+        the graph.
+
+        Parameters
+        ----------
+        edges : iterable of pairs
+            The changed edges ``(u, v)``.  Whether an edge was added or
+            removed is read from the graph.
+        """
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        changed = {}
+        for u, v in edges:
+            if u not in self._betweenness or v not in self._betweenness or \
+                    u not in G or v not in G:
+                self.rebuild()
+                return
+            changed[u, v] = v in succ[u]
+            if not G.is_directed():
+                changed[v, u] = changed[u, v]
+        if len(G) != len(self._betweenness):
+            self.rebuild()
+            return
+        for s in self.sources:
+            dist = self._dist[s]
+            for (u, v), present in changed.items():
+                du = dist.get(u)
+                if du is None:
+                    continue
+                dv = dist.get(v)
+                if present and (dv is None or du + 1 <= dv) or \
+                        not present and dv == du + 1:
+                    self._repair(s, changed)
+                    break
+
+    def sync(self):
+        """Repairs the betweenness after the changes in the journal of the
+        graph.
+
+        The edges added or removed by the graph methods since the last
+        call are read with :func:`~networkx.changes_since`.  If these
+        changes are not available, e.g. because the graph has no journal,
+        or if nodes were added or removed, the betweenness is computed
+        from scratch.
+        """
+        G = self.G
+        try:
+            changes = nx.changes_since(G, self._version)
+        except nx.NetworkXError:
+            self.rebuild()
+            return
+        if any(change[1] in ('add_node', 'remove_node') for change in changes):
+            self.rebuild()
+            return
+        self._version = nx.graph_version(G)
+        self.update_edges(change[2:4] for change in changes)
+
+    def _repair(self, s, changed):
+        """Updates the state of source `s` and its share of the
+        betweenness after the `changed` edges, a dict telling whether
+        each edge is now present."""
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        pred = G._pred if G.is_directed() else G._adj
+        dist = self._dist[s]
+        sigma = self._sigma[s]
+        delta = self._delta[s]
+        reached = len(dist)
+        # the previous distance of the nodes whose distance changed,
+        # None if they were not reachable
+        old = {}
+
+        def old_dist(x):
+            return old[x] if x in old else dist.get(x)
+
+        # nodes left without a shortest path predecessor, and their
+        # descendants in the same situation
+        orphans = []
+        for (u, v), present in changed.items():
+            if not present and v in dist and dist.get(u) == dist[v] - 1:
+                dv = dist[v]
+                if not any(dist.get(p) == dv - 1 for p in pred[v]):
+                    orphans.append(v)
+        lost = set()
+        while orphans:
+            x = orphans.pop()
+            if x in lost:
+                continue
+            lost.add(x)
+            dx = dist[x]
+            for y in succ[x]:
+                if y not in lost and dist.get(y) == dx + 1 and \
+                        all(p in lost for p in pred[y] if dist.get(p) == dx):
+                    orphans.append(y)
+        for x in lost:
+            old[x] = dist.pop(x)
+        c = count()
+        fringe = []
+        for x in lost:
+            ds = [dist[p] for p in pred[x] if p in dist]
+            if ds:
+                fringe.append((min(ds) + 1, next(c), x))
+        heapify(fringe)
+        while fringe:
+            d, _, x = heappop(fringe)
+            if x in dist:
+                continue
+            dist[x] = d
+            for y in succ[x]:
+                if y in lost and y not in dist:
+                    heappush(fringe, (d + 1, next(c), y))
+
+        # shorter paths through the added edges
+        def relax(u, v):
+            d = dist[u] + 1
+            if v not in dist or d < dist[v]:
+                if v not in old:
+                    old[v] = dist.get(v)
+                dist[v] = d
+                heappush(fringe, (d, next(c), v))
+
+        for (u, v), present in changed.items():
+            if present and u in dist:
+                relax(u, v)
+        # added edges may also have given shorter paths to the lost nodes
+        for x in lost:
+            if x in dist:
+                for y in succ[x]:
+                    relax(x, y)
+        while fringe:
+            d, _, x = heappop(fringe)
+            if d > dist[x]:
+                continue  # superseded by a shorter path
+            for y in succ[x]:
+                relax(x, y)
+        moved = {x for x, d in old.items() if dist.get(x) != d}
+
+        # path counts, by increasing distance, from the nodes whose
+        # distance or predecessors changed
+        touched = set(moved)
+        start = moved.union(v for u, v in changed)
+        for x in moved:
+            if x not in dist:
+                del sigma[x]
+            if old[x] is not None:
+                start.update(y for y in succ[x] if old_dist(y) == old[x] + 1)
+        fringe = [(dist[x], next(c), x) for x in start
+                  if x in dist and x != s]
+        heapify(fringe)
+        done = set()
+        while fringe:
+            d, _, x = heappop(fringe)
+            if x in done:
+                continue
+            done.add(x)
+            sx = 0.0
+            for p in pred[x]:
+                if dist.get(p) == d - 1:
+                    sx += sigma[p]
+            if x not in moved and sigma[x] == sx:
+                continue
+            sigma[x] = sx
+            touched.add(x)
+            for y in succ[x]:
+                if dist.get(y) == d + 1 and y not in done:
+                    heappush(fringe, (d + 1, next(c), y))
+
+        # dependencies of the touched nodes and of their ancestors before
+        # and after the changes, by decreasing distance
+        stack = list(touched)
+        for u, v in changed:
+            stack.append(u)
+            stack.append(v)
+        ancestors = set()
+        while stack:
+            x = stack.pop()
+            if x in ancestors:
+                continue
+            ancestors.add(x)
+            dx = dist.get(x)
+            ox = old_dist(x)
+            for p in pred[x]:
+                if p not in ancestors and (
+                        dx is not None and dist.get(p) == dx - 1 or
+                        ox is not None and old_dist(p) == ox - 1):
+                    stack.append(p)
+        new = {}
+        for x in sorted((x for x in ancestors if x in dist), key=dist.get,
+                        reverse=True):
+            dx = dist[x]
+            sx = sigma[x]
+            dep = 0.0
+            for w in succ[x]:
+                if dist.get(w) == dx + 1:
+                    dw = new[w] if w in new else delta[w]
+                    dep += sx * ((1 + dw) / sigma[w])
+            new[x] = dep
+
+        betweenness = self._betweenness
+        extra = 1 if self.endpoints else 0
+        for x in ancestors:
+            if x != s:
+                before = delta[x] + extra if x in delta else 0
+                after = new[x] + extra if x in new else 0
+                betweenness[x] += after - before
+            if x in new:
+                delta[x] = new[x]
+            else:
+                delta.pop(x, None)
+        if self.endpoints:
+            betweenness[s] += len(dist) - reached
@@ -80,6 +80,10 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
     The closeness centrality uses *inward* distance to a node, not outward.
     If you want to use outword distances apply the function to `G.reverse()`
 
+    Without `distance` and if NumPy is available, the distances for all
+    nodes are computed in batches by
+    :func:`~networkx.shortest_path_length_rows`.
+
     In NetworkX 2.2 and earlier a bug caused Dijkstra's algorithm to use the
     outward distance rather than the inward distance. If you use a 'distance'
     keyword and a DiGraph, your results will change between v2.2 and v2.3.
@@ -108,16 +112,14 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
     else:
         nodes = [u]
     closeness_centrality = {}
-    for n in nodes:
-        sp = path_length(G, n)
-        totsp = sum(sp.values())
+    for n, reached, totsp in _distance_sums(G, nodes, path_length):
         len_G = len(G)
         _closeness_centrality = 0.0
         if totsp > 0.0 and len_G > 1:
-            _closeness_centrality = (len(sp) - 1.0) / totsp
+            _closeness_centrality = (reached - 1.0) / totsp
             # normalize to number of nodes-1 in connected part
             if wf_improved:
-                s = (len(sp) - 1.0) / (len_G - 1)
+                s = (reached - 1.0) / (len_G - 1)
                 _closeness_centrality *= s
         closeness_centrality[n] = _closeness_centrality
     if u is not None:
@@ -126,6 +128,26 @@ def closeness_centrality(G, u=None, distance=None, wf_improved=True):
         return closeness_centrality
 
 
+def _distance_sums(G, nodes, path_length):
+    """Yields (node, number of nodes reached, sum of their distances)."""
+    if path_length is nx.single_source_shortest_path_length and \
+            len(nodes) > 1:
+        try:
+            rows = nx.shortest_path_length_rows(G, nodes)
+        except ImportError:
+            pass
+        else:
+            for batch, lengths in rows:
+                reached = (lengths >= 0).sum(axis=1).tolist()
+                totals = (lengths * (lengths > 0)).sum(axis=1).tolist()
+                for result in zip(batch, reached, totals):
+                    yield result
+            return
+    for n in nodes:
+        sp = path_length(G, n)
+        yield n, len(sp), sum(sp.values())
+
+
 @not_implemented_for('directed')
 def incremental_closeness_centrality(G,
                                      edge,
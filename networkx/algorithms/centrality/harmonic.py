@@ -47,7 +47,9 @@ def harmonic_centrality(G, nbunch=None, distance=None):
     -----
     If the 'distance' keyword is set to an edge attribute key then the
     shortest-path length will be computed using Dijkstra's algorithm with
-    that edge attribute as the edge weight.
+    that edge attribute as the edge weight.  Otherwise, if NumPy is
+    available, the distances are computed in batches by
+    :func:`~networkx.shortest_path_length_rows`.
 
     References
     ----------
@@ -56,6 +58,21 @@ def harmonic_centrality(G, nbunch=None, distance=None):
     """
     if G.is_directed():
         G = G.reverse()
+    if distance is None:
+        try:
+            rows = nx.shortest_path_length_rows(G, G.nbunch_iter(nbunch))
+        except ImportError:
+            pass
+        else:
+            import numpy as np
+            centrality = {}
+            for batch, lengths in rows:
+                for u, row in zip(batch, lengths):
+                    # add the terms in order of distance, as below
+                    d = np.sort(row[row > 0])
+                    centrality[u] = np.add.accumulate(1 / d)[-1].item() \
+                        if len(d) else 0
+            return centrality
     spl = partial(nx.shortest_path_length, G, weight=distance)
     return {u: sum(1 / d if d > 0 else 0 for v, d in spl(source=u).items())
             for u in G.nbunch_iter(nbunch)}
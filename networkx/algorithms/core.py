@@ -30,12 +30,13 @@ http://doi.org/10.1038/srep31708
 """
 import networkx as nx
 from networkx.exception import NetworkXError
-from networkx.utils import not_implemented_for
+from networkx.utils import not_implemented_for, memoize_on_graph
 
 __all__ = ['core_number', 'find_cores', 'k_core', 'k_shell',
            'k_crust', 'k_corona', 'k_truss', 'onion_layers']
 
 
+@memoize_on_graph()
 @not_implemented_for('multigraph')
 def core_number(G):
     """Returns the core number for each vertex.
@@ -68,6 +69,9 @@ def core_number(G):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
+    Results can be reused for an unchanged graph once the result cache
+    is enabled, see :mod:`networkx.utils.cache`.
+
     References
     ----------
     .. [1] An O(m) Algorithm for Cores Decomposition of Networks
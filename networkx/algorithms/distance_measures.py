@@ -204,6 +204,11 @@ def eccentricity(G, v=None, sp=None):
     -------
     ecc : dictionary
        A dictionary of eccentricity values keyed by node.
+
+    Notes
+    -----
+    Without `sp` and if NumPy is available, the distances are computed in
+    batches by :func:`~networkx.shortest_path_length_rows`.
     """
 #    if v is None:                # none, use entire graph
 #        nodes=G.nodes()
@@ -213,6 +218,22 @@ def eccentricity(G, v=None, sp=None):
 #        nodes=v
     order = G.order()
 
+    if sp is None:
+        try:
+            rows = nx.shortest_path_length_rows(G, G.nbunch_iter(v))
+        except ImportError:
+            pass
+        else:
+            e = {}
+            for batch, lengths in rows:
+                reached = (lengths >= 0).sum(axis=1).tolist()
+                longest = lengths.max(axis=1).tolist()
+                for n, L, ecc in zip(batch, reached, longest):
+                    if L != order:
+                        raise nx.NetworkXError(_infinite_path_message(G))
+                    e[n] = ecc
+            return e[v] if v in G else e
+
     e = {}
     for n in G.nbunch_iter(v):
         if sp is None:
@@ -225,13 +246,7 @@ def eccentricity(G, v=None, sp=None):
             except TypeError:
                 raise nx.NetworkXError('Format of "sp" is invalid.')
         if L != order:
-            if G.is_directed():
-                msg = ('Found infinite path length because the digraph is not'
-                       ' strongly connected')
-            else:
-                msg = ('Found infinite path length because the graph is not'
-                       ' connected')
-            raise nx.NetworkXError(msg)
+            raise nx.NetworkXError(_infinite_path_message(G))
 
         e[n] = max(length.values())
 
@@ -241,6 +256,13 @@ def eccentricity(G, v=None, sp=None):
         return e
 
 
+def _infinite_path_message(G):
+    if G.is_directed():
+        return ('Found infinite path length because the digraph is not'
+                ' strongly connected')
+    return 'Found infinite path length because the graph is not connected'
+
+
 def diameter(G, e=None, usebounds=False):
     """Returns the diameter of the graph G.
 
@@ -1,6 +1,7 @@
 """Hubs and authorities analysis of graph structure.
 """
 import networkx as nx
+from networkx.algorithms.link_analysis.pagerank_alg import _power_iteration
 
 __all__ = ['hits', 'hits_numpy', 'hits_scipy', 'authority_matrix', 'hub_matrix']
 
@@ -73,50 +74,53 @@ def hits(G, max_iter=100, tol=1.0e-8, nstart=None, normalized=True):
         raise Exception("hits() not defined for graphs with multiedges.")
     if len(G) == 0:
         return {}, {}
+    nodes = list(G)
+    N = len(nodes)
+    index = {n: i for i, n in enumerate(nodes)}
+    adj = [[(index[nbr], d.get('weight', 1)) for nbr, d in G._adj[n].items()]
+           for n in nodes]
     # choose fixed starting vector if not given
     if nstart is None:
-        h = dict.fromkeys(G, 1.0 / G.number_of_nodes())
+        h = [1.0 / N] * N
     else:
-        h = nstart
+        h = [nstart.get(n, 0) for n in nodes]
         # normalize starting vector
-        s = 1.0 / sum(h.values())
-        for k in h:
-            h[k] *= s
+        s = 1.0 / sum(nstart.values())
+        h = [v * s for v in h]
     for _ in range(max_iter):  # power iteration: make up to max_iter iterations
         hlast = h
-        h = dict.fromkeys(hlast.keys(), 0)
-        a = dict.fromkeys(hlast.keys(), 0)
+        h = [0] * N
+        a = [0] * N
         # this "matrix multiply" looks odd because it is
         # doing a left multiply a^T=hlast^T*G
-        for n in h:
-            for nbr in G[n]:
-                a[nbr] += hlast[n] * G[n][nbr].get('weight', 1)
+        for n in range(N):
+            hn = hlast[n]
+            for nbr, w in adj[n]:
+                a[nbr] += hn * w
         # now multiply h=Ga
-        for n in h:
-            for nbr in G[n]:
-                h[n] += a[nbr] * G[n][nbr].get('weight', 1)
+        for n in range(N):
+            hn = 0
+            for nbr, w in adj[n]:
+                hn += a[nbr] * w
+            h[n] = hn
         # normalize vector
-        s = 1.0 / max(h.values())
-        for n in h:
-            h[n] *= s
+        s = 1.0 / max(h)
+        h = [v * s for v in h]
         # normalize vector
-        s = 1.0 / max(a.values())
-        for n in a:
-            a[n] *= s
+        s = 1.0 / max(a)
+        a = [v * s for v in a]
         # check convergence, l1 norm
-        err = sum([abs(h[n] - hlast[n]) for n in h])
+        err = sum([abs(h[n] - hlast[n]) for n in range(N)])
         if err < tol:
             break
     else:
         raise nx.PowerIterationFailedConvergence(max_iter)
     if normalized:
-        s = 1.0 / sum(a.values())
-        for n in a:
-            a[n] *= s
-        s = 1.0 / sum(h.values())
-        for n in h:
-            h[n] *= s
-    return h, a
+        s = 1.0 / sum(a)
+        a = [v * s for v in a]
+        s = 1.0 / sum(h)
+        h = [v * s for v in h]
+    return dict(zip(nodes, h)), dict(zip(nodes, a))
 
 
 def authority_matrix(G, nodelist=None):
@@ -202,7 +206,8 @@ def hits_numpy(G, normalized=True):
     return hubs, authorities
 
 
-def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
+def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True, nstart=None,
+               dtype=None, acceleration=None):
     """Returns HITS hubs and authorities values for nodes.
 
     The HITS algorithm computes two numbers for a node.
@@ -220,12 +225,24 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
     tol : float, optional
       Error tolerance used to check convergence in power method iteration.
 
-    nstart : dictionary, optional
-      Starting value of each node for power method iteration.
-
     normalized : bool (default=True)
        Normalize results by the sum of all of the values.
 
+    nstart : dictionary, optional
+      Starting hub value of each node for power method iteration.
+      Passing the hubs of a previous call, e.g. before a few edges
+      changed, usually converges in a few iterations.
+
+    dtype : NumPy data-type, optional
+      The type of the matrix and vectors, e.g. ``numpy.float32`` to halve
+      the memory needed.  If None, it is inferred from the edge weights
+      and the vectors are floats.  With ``numpy.float32``, `tol` should
+      not be much smaller than ``1e-7 * len(G)``.
+
+    acceleration : None or 'quadratic', optional (default=None)
+      If 'quadratic', the quadratic extrapolation of Kamvar et al. is
+      applied to every fourth iterate, see :func:`pagerank_scipy`.
+
     Returns
     -------
     (hubs,authorities) : two-tuple of dictionaries
@@ -239,7 +256,11 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
 
     Notes
     -----
-    This implementation uses SciPy sparse matrices.
+    This implementation uses SciPy sparse matrices.  Each iteration
+    multiplies by the adjacency matrix and its transpose, whose structure
+    is the cached adjacency of `G` (see
+    :func:`~networkx.to_scipy_sparse_view`), instead of forming the
+    authority matrix.
 
     The eigenvector calculation is done by the power iteration method
     and has no guarantee of convergence.  The iteration will stop
@@ -257,6 +278,9 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
         within the specified number of iterations of the power iteration
         method.
 
+    ValueError
+        If `acceleration` is not None or 'quadratic'.
+
     References
     ----------
     .. [1] A. Langville and C. Meyer,
@@ -269,34 +293,32 @@ def hits_scipy(G, max_iter=100, tol=1.0e-6, normalized=True):
        http://www.cs.cornell.edu/home/kleinber/auth.pdf.
     """
     try:
-        import scipy.sparse
+        import scipy
         import numpy as np
     except ImportError:
         raise ImportError(
             "hits_scipy() requires SciPy: http://scipy.org/")
     if len(G) == 0:
         return {}, {}
-    M = nx.to_scipy_sparse_matrix(G, nodelist=list(G))
-    (n, m) = M.shape  # should be square
-    A = M.T * M  # authority matrix
-    x = scipy.ones((n, 1)) / n  # initial guess
+    M = nx.to_scipy_sparse_view(G, dtype=dtype)
+    MT = M.T
+    n = M.shape[0]
+    if dtype is None:
+        dtype = float
     # power iteration on authority matrix
-    i = 0
-    while True:
-        xlast = x
-        x = A * x
+    if nstart is None:
+        x = np.full(n, 1.0 / n, dtype=dtype)  # initial guess
+    else:
+        x = MT @ np.array([nstart.get(v, 0) for v in G], dtype=dtype)
         x = x / x.max()
-        # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < tol:
-            break
-        if i > max_iter:
-            raise nx.PowerIterationFailedConvergence(max_iter)
-        i += 1
 
-    a = np.asarray(x).flatten()
+    def step(x):
+        x = MT @ (M @ x)
+        return x / x.max()
+
+    a = _power_iteration(step, x, max_iter, tol, acceleration)
     # h=M*a
-    h = np.asarray(M * a).flatten()
+    h = M @ a
     if normalized:
         h = h / h.sum()
         a = a / a.sum()
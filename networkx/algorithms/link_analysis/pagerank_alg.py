@@ -1,10 +1,14 @@
 """PageRank analysis of graph structure. """
+from collections import deque
+
 import networkx as nx
-from networkx.utils import not_implemented_for
+from networkx.utils import not_implemented_for, memoize_on_graph
 
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix',
+           'batch_personalized_pagerank', 'approximate_personalized_pagerank']
 
 
+@memoize_on_graph()
 @not_implemented_for('multigraph')
 def pagerank(G, alpha=0.85, personalization=None,
              max_iter=100, tol=1.0e-6, nstart=None, weight='weight',
@@ -76,6 +80,9 @@ def pagerank(G, alpha=0.85, personalization=None,
     execute on undirected graphs by converting each edge in the
     directed graph to two edges.
 
+    Results can be reused for an unchanged graph once the result cache
+    is enabled, see :mod:`networkx.utils.cache`.
+
     See Also
     --------
     pagerank_numpy, pagerank_scipy, google_matrix
@@ -100,53 +107,66 @@ def pagerank(G, alpha=0.85, personalization=None,
     if len(G) == 0:
         return {}
 
-    if not G.is_directed():
-        D = G.to_directed()
-    else:
-        D = G
-
-    # Create a copy in (right) stochastic form
-    W = nx.stochastic_graph(D, weight=weight)
-    N = W.number_of_nodes()
+    nodes = list(G)
+    N = len(nodes)
+    index = {n: i for i, n in enumerate(nodes)}
+    succ = G._succ if G.is_directed() else G._adj
+    # the transition probabilities of the out-edges of each node, as set
+    # by stochastic_graph, without copying the graph
+    out_edges = []
+    dangling_nodes = []
+    for n in nodes:
+        nbrs = succ[n]
+        if weight is None:
+            weights = [1] * len(nbrs)
+        else:
+            weights = [d.get(weight, 1) for d in nbrs.values()]
+        degree = sum(weights)
+        if degree == 0:
+            dangling_nodes.append(index[n])
+            out_edges.append([])
+        else:
+            out_edges.append([(index[nbr], w / degree)
+                              for nbr, w in zip(nbrs, weights)])
 
     # Choose fixed starting vector if not given
     if nstart is None:
-        x = dict.fromkeys(W, 1.0 / N)
+        x = [1.0 / N] * N
     else:
         # Normalized nstart vector
         s = float(sum(nstart.values()))
-        x = dict((k, v / s) for k, v in nstart.items())
+        x = [nstart.get(n, 0) / s for n in nodes]
 
     if personalization is None:
         # Assign uniform personalization vector if not given
-        p = dict.fromkeys(W, 1.0 / N)
+        p = [1.0 / N] * N
     else:
         s = float(sum(personalization.values()))
-        p = dict((k, v / s) for k, v in personalization.items())
+        p = [personalization.get(n, 0) / s for n in nodes]
 
     if dangling is None:
         # Use personalization vector if dangling vector not specified
         dangling_weights = p
     else:
         s = float(sum(dangling.values()))
-        dangling_weights = dict((k, v / s) for k, v in dangling.items())
-    dangling_nodes = [n for n in W if W.out_degree(n, weight=weight) == 0.0]
+        dangling_weights = [dangling.get(n, 0) / s for n in nodes]
 
     # power iteration: make up to max_iter iterations
     for _ in range(max_iter):
         xlast = x
-        x = dict.fromkeys(xlast.keys(), 0)
+        x = [0] * N
         danglesum = alpha * sum(xlast[n] for n in dangling_nodes)
-        for n in x:
+        for n in range(N):
             # this matrix multiply looks odd because it is
             # doing a left multiply x^T=xlast^T*W
-            for nbr in W[n]:
-                x[nbr] += alpha * xlast[n] * W[n][nbr][weight]
-            x[n] += danglesum * dangling_weights.get(n, 0) + (1.0 - alpha) * p.get(n, 0)
+            xn = alpha * xlast[n]
+            for nbr, w in out_edges[n]:
+                x[nbr] += xn * w
+            x[n] += danglesum * dangling_weights[n] + (1.0 - alpha) * p[n]
         # check convergence, l1 norm
-        err = sum([abs(x[n] - xlast[n]) for n in x])
+        err = sum([abs(x[n] - xlast[n]) for n in range(N)])
         if err < N * tol:
-            return x
+            return dict(zip(nodes, x))
     raise nx.PowerIterationFailedConvergence(max_iter)
 
 
@@ -329,7 +349,7 @@ def pagerank_numpy(G, alpha=0.85, personalization=None, weight='weight',
 
 def pagerank_scipy(G, alpha=0.85, personalization=None,
                    max_iter=100, tol=1.0e-6, nstart=None, weight='weight',
-                   dangling=None):
+                   dangling=None, dtype=None, acceleration=None):
     """Returns the PageRank of the nodes in the graph.
 
     PageRank computes a ranking of the nodes in the graph G based on
@@ -359,7 +379,9 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
       Error tolerance used to check convergence in power method solver.
 
     nstart : dictionary, optional
-      Starting value of PageRank iteration for each node.
+      Starting value of PageRank iteration for each node.  Passing the
+      result of a previous call, e.g. before a few edges changed, usually
+      converges in a few iterations.
 
     weight : key, optional
       Edge data key to use as weight.  If None weights are set to 1.
@@ -373,6 +395,17 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
       matrix (see notes under google_matrix). It may be common to have the
       dangling dict to be the same as the personalization dict.
 
+    dtype : NumPy data-type, optional (default=float)
+      The floating point type of the matrix and vectors.  ``numpy.float32``
+      halves the memory needed and speeds up the iteration, at the cost
+      of precision: `tol` should not be much smaller than the rounding
+      error of each value, about ``1e-7 / len(G)``.
+
+    acceleration : None or 'quadratic', optional (default=None)
+      If 'quadratic', the quadratic extrapolation of Kamvar et al. [3]_
+      is applied to every fourth iterate, which reduces the number of
+      iterations when `alpha` is close to 1.
+
     Returns
     -------
     pagerank : dictionary
@@ -386,7 +419,9 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     Notes
     -----
     The eigenvector calculation uses power iteration with a SciPy
-    sparse matrix representation.
+    sparse matrix representation.  The structure of the matrix is the
+    cached adjacency of `G` (see :func:`~networkx.to_scipy_sparse_view`),
+    which is only built again when nodes or edges are added or removed.
 
     This implementation works with Multi(Di)Graphs. For multigraphs the
     weight between two nodes is set to be the sum of all edge weights
@@ -403,6 +438,9 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
         within the specified number of iterations of the power iteration
         method.
 
+    ValueError
+        If `acceleration` is not None or 'quadratic'.
+
     References
     ----------
     .. [1] A. Langville and C. Meyer,
@@ -411,52 +449,439 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
     .. [2] Page, Lawrence; Brin, Sergey; Motwani, Rajeev and Winograd, Terry,
        The PageRank citation ranking: Bringing order to the Web. 1999
        http://dbpubs.stanford.edu:8090/pub/showDoc.Fulltext?lang=en&doc=1999-66&format=pdf
+    .. [3] Sepandar D. Kamvar, Taher H. Haveliwala, Christopher D. Manning
+       and Gene H. Golub, "Extrapolation methods for accelerating PageRank
+       computations", Proceedings of the 12th International Conference on
+       World Wide Web, 2003.
     """
-    import scipy.sparse
+    import numpy as np
 
     N = len(G)
     if N == 0:
         return {}
+    if dtype is None:
+        dtype = float
 
     nodelist = list(G)
-    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  dtype=float)
-    S = scipy.array(M.sum(axis=1)).flatten()
-    S[S != 0] = 1.0 / S[S != 0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
+    PT, is_dangling = _transition_matrix(G, weight, dtype)
 
     # initial vector
     if nstart is None:
-        x = scipy.repeat(1.0 / N, N)
+        x = np.full(N, 1.0 / N, dtype=dtype)
     else:
-        x = scipy.array([nstart.get(n, 0) for n in nodelist], dtype=float)
-        x = x / x.sum()
+        x = _node_vector(np, nstart, nodelist, dtype)
 
     # Personalization vector
     if personalization is None:
-        p = scipy.repeat(1.0 / N, N)
+        p = np.full(N, 1.0 / N, dtype=dtype)
     else:
-        p = scipy.array([personalization.get(n, 0) for n in nodelist], dtype=float)
-        p = p / p.sum()
+        p = _node_vector(np, personalization, nodelist, dtype)
 
     # Dangling nodes
     if dangling is None:
         dangling_weights = p
     else:
-        # Convert the dangling dictionary into an array in nodelist order
-        dangling_weights = scipy.array([dangling.get(n, 0) for n in nodelist],
-                                       dtype=float)
-        dangling_weights /= dangling_weights.sum()
-    is_dangling = scipy.where(S == 0)[0]
+        dangling_weights = _node_vector(np, dangling, nodelist, dtype)
 
-    # power iteration: make up to max_iter iterations
+    def step(x):
+        return alpha * (PT @ x + x[is_dangling].sum() * dangling_weights) + \
+            (1 - alpha) * p
+
+    x = _power_iteration(step, x, max_iter, N * tol, acceleration)
+    return dict(zip(nodelist, map(float, x)))
+
+
+def batch_personalized_pagerank(G, personalization, alpha=0.85,
+                                max_iter=100, tol=1.0e-6, nstart=None,
+                                weight='weight', dangling=None, dtype=None):
+    """Returns the personalized PageRank of the nodes for many
+    personalization vectors at once.
+
+    The PageRank vectors of all personalization vectors are computed by
+    the same power iteration, each step multiplying the sparse transition
+    matrix by the dense matrix of the current vectors.  This is much
+    faster than calling :func:`pagerank_scipy` for each of them.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    personalization : array_like or SciPy sparse matrix
+      The personalization vectors, one per row, with one column per node
+      in the order of ``list(G)``.  Each row must have a positive sum.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    max_iter : integer, optional
+      Maximum number of iterations in power method eigenvalue solver.
+
+    tol : float, optional
+      Error tolerance used to check convergence in power method solver,
+      for each vector.
+
+    nstart : array_like, optional
+      Starting values of the PageRank iteration, with the shape of
+      `personalization`.  By default, every node starts at ``1 / len(G)``.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, as for
+      :func:`pagerank`, for all vectors.  By default, dangling nodes are
+      given outedges according to each personalization vector.
+
+    dtype : NumPy data-type, optional (default=float)
+      The floating point type of the matrices, e.g. ``numpy.float32`` to
+      halve the memory needed.
+
+    Returns
+    -------
+    pagerank : NumPy ndarray
+       The PageRank vectors, with the shape of `personalization`: row `i`
+       is the PageRank for row `i` of `personalization`.
+
+    Raises
+    ------
+    ValueError
+        If `personalization` does not have one column per node or a row
+        does not have a positive sum.
+
+    PowerIterationFailedConvergence
+        If some vector fails to converge to the specified tolerance
+        within the specified number of iterations of the power iteration
+        method.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> P = np.eye(4)[[0, 3]]
+    >>> pr = nx.batch_personalized_pagerank(G, P)
+    >>> pr.shape
+    (2, 4)
+    >>> expected = nx.pagerank_scipy(G, personalization={3: 1})
+    >>> np.allclose(pr[1], list(expected.values()))
+    True
+
+    Notes
+    -----
+    The vectors are iterated in blocks of a few megabytes, which make
+    better use of the processor caches than a single large matrix.
+    Vectors that have converged are dropped from their block, so that the
+    others go on with a smaller matrix.  The memory needed for the result
+    grows with the number of nodes times the number of vectors.
+
+    See Also
+    --------
+    pagerank_scipy, approximate_personalized_pagerank
+    """
+    import numpy as np
+    from scipy import sparse
+
+    N = len(G)
+    if dtype is None:
+        dtype = float
+    # one column per vector, kept sparse since personalization vectors
+    # usually have few nonzero values
+    P = sparse.csc_matrix(personalization, dtype=dtype).T.tocsc()
+    if P.ndim != 2 or P.shape[0] != N:
+        raise ValueError("personalization must have one column per node.")
+    k = P.shape[1]
+    if N == 0:
+        return np.zeros((k, 0), dtype=dtype)
+    sums = np.asarray(P.sum(axis=0)).ravel()
+    if not (sums > 0).all():
+        raise ValueError("Each personalization vector must have a positive "
+                         "sum.")
+    P = P @ sparse.diags(1 / sums)
+
+    PT, is_dangling = _transition_matrix(G, weight, dtype)
+    PT = (alpha * PT).tocsr()
+    is_dangling = is_dangling.astype(dtype)
+
+    # initial vectors
+    if nstart is not None:
+        X = np.array(nstart, dtype=dtype, ndmin=2)
+        if X.shape != (k, N):
+            raise ValueError("nstart must have the shape of "
+                             "personalization.")
+        nstart = (X / X.sum(axis=1)[:, None]).T
+
+    # Dangling nodes
+    if dangling is not None:
+        dangling = _node_vector(np, dangling, list(G), dtype)
+
+    pagerank = np.empty((k, N), dtype=dtype)
+    # blocks of vectors of a few megabytes are iterated faster than one
+    # large matrix
+    block = max(8, (1 << 22) // (N * np.dtype(dtype).itemsize))
+    for i in range(0, k, block):
+        columns = slice(i, i + block)
+        if nstart is None:
+            X = np.full((N, len(range(k)[columns])), 1.0 / N, dtype=dtype)
+        else:
+            X = np.ascontiguousarray(nstart[:, columns])
+        pagerank[columns] = _batch_power_iteration(
+            np, sparse, PT, is_dangling, P[:, columns], X, alpha, dangling,
+            max_iter, N * tol)
+    return pagerank
+
+
+def _batch_power_iteration(np, sparse, PT, is_dangling, P, X, alpha,
+                           dangling_weights, max_iter, tol):
+    """Returns the PageRank vectors for the personalization vectors in the
+    columns of `P`, as rows, starting from the columns of `X`.
+
+    `PT` is the transposed transition matrix multiplied by `alpha` and
+    `is_dangling` is 1 for dangling nodes, 0 for the others.  Dangling
+    nodes link according to `dangling_weights`, or to the personalization
+    vectors if it is None.
+    """
+    pagerank = np.empty(X.shape[::-1], dtype=X.dtype)
+    # the vectors of the columns of X, and those not converged yet
+    active = np.arange(X.shape[1])
+    pending = np.ones(X.shape[1], dtype=bool)
+    rows, cols, values = sparse.find(P)
+    for _ in range(max_iter):
+        dangling_sum = alpha * (is_dangling @ X)
+        Xlast = X
+        X = PT @ X
+        if dangling_weights is None:
+            # teleport and dangling nodes both follow the personalization
+            X[rows, cols] += values * (1 - alpha + dangling_sum[cols])
+        else:
+            X += np.outer(dangling_weights, dangling_sum)
+            X[rows, cols] += (1 - alpha) * values
+        # check convergence of each vector, l1 norm
+        np.subtract(Xlast, X, out=Xlast)
+        err = np.absolute(Xlast, out=Xlast).sum(axis=0)
+        done = (err < tol) & pending
+        if done.any():
+            pagerank[active[done]] = X[:, done].T
+            pending &= ~done
+            if not pending.any():
+                return pagerank
+            if 4 * pending.sum() <= 3 * len(pending):
+                # drop the converged columns
+                X = X[:, pending]
+                P = P[:, pending]
+                active = active[pending]
+                pending = pending[pending]
+                rows, cols, values = sparse.find(P)
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+@not_implemented_for('multigraph')
+def approximate_personalized_pagerank(G, personalization, alpha=0.85,
+                                      epsilon=1.0e-6, weight='weight'):
+    """Returns an approximation of the personalized PageRank of the nodes
+    near the personalization nodes.
+
+    The forward push of Andersen, Chung and Lang [1]_ keeps an estimate
+    and a residual value for each node, starting with the residual of
+    each personalization node set to its personalization value.  A push
+    adds ``1 - alpha`` of the residual of a node to its estimate and
+    spreads the rest to the residuals of its successors, in proportion to
+    the weights of the edges.  Nodes are pushed until every residual is
+    below `epsilon` times the weighted out-degree of its node, so only
+    nodes near the personalization nodes are visited and the cost does
+    not depend on the size of the graph.  The residuals of dangling nodes
+    are not pushed but accounted for exactly at the end.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    personalization : dict
+      The personalization value of some nodes, as for :func:`pagerank`.
+      At least one value must be positive.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    epsilon : float, optional
+      The largest residual left per unit of out-degree.  It must be
+      positive.  Smaller values are more accurate and visit more nodes.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    Returns
+    -------
+    pagerank : dictionary
+       Dictionary of the nodes reached with their estimated PageRank as
+       value.  The estimates of other nodes are zero.
+
+    Raises
+    ------
+    NodeNotFound
+        If a node with a positive personalization value is not in `G`.
+
+    ValueError
+        If no personalization value is positive or if `epsilon` is not
+        positive.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(1000)
+    >>> ppr = nx.approximate_personalized_pagerank(G, {0: 1}, epsilon=1e-4)
+    >>> len(ppr) < 100
+    True
+    >>> exact = nx.pagerank_scipy(G, personalization={0: 1}, tol=1e-10,
+    ...                           max_iter=500)
+    >>> max(exact[n] - ppr.get(n, 0) for n in G) < 2e-4
+    True
+
+    Notes
+    -----
+    The estimates are lower bounds of the personalized PageRank computed
+    by :func:`pagerank` with the same `personalization` and `alpha`; the
+    outedges of dangling nodes are given according to the personalization
+    vector.  For undirected graphs, the estimate of each node is within
+    `epsilon` times its weighted degree of the PageRank, and isolated
+    nodes get their exact PageRank.
+
+    See Also
+    --------
+    pagerank, batch_personalized_pagerank
+
+    References
+    ----------
+    .. [1] Reid Andersen, Fan Chung and Kevin Lang,
+       "Local graph partitioning using PageRank vectors",
+       47th Annual IEEE Symposium on Foundations of Computer Science, 2006.
+    """
+    if not epsilon > 0:
+        raise ValueError("epsilon must be positive.")
+    total = float(sum(personalization.values()))
+    if not total > 0:
+        raise ValueError("personalization must have a positive value.")
+    seeds = {}
+    for n, v in personalization.items():
+        if v:
+            if n not in G:
+                raise nx.NodeNotFound("Node {} not in G".format(n))
+            seeds[n] = v / total
+    succ = G._succ if G.is_directed() else G._adj
+    degree = {}
+
+    def out_degree(n):
+        d = degree.get(n)
+        if d is None:
+            if weight is None:
+                d = len(succ[n])
+            else:
+                d = sum(e.get(weight, 1) for e in succ[n].values())
+            degree[n] = d
+        return d
+
+    # Dangling nodes are not pushed.  A residual r at a dangling node
+    # stands for (1 - alpha) * r of its own PageRank plus alpha * r times
+    # the PageRank itself, which is solved for at the end.  In undirected
+    # graphs only the dangling personalization nodes hold such residuals,
+    # so the bound on the error is kept by lowering the threshold.
+    dangling = {n for n in seeds if out_degree(n) == 0}
+    threshold = epsilon * (1 - alpha * sum(seeds[n] for n in dangling))
+    pagerank = {}
+    residual = dict(seeds)
+    queue = deque(n for n, r in residual.items()
+                  if r > threshold * out_degree(n) and n not in dangling)
+    queued = set(queue)
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        r = residual[u]
+        residual[u] = 0
+        pagerank[u] = pagerank.get(u, 0) + (1 - alpha) * r
+        d = out_degree(u)
+        push = alpha * r
+        if weight is None:
+            targets = ((v, 1 / d) for v in succ[u])
+        else:
+            targets = ((v, e.get(weight, 1) / d) for v, e in succ[u].items())
+        for v, w in targets:
+            rv = residual.get(v, 0) + push * w
+            residual[v] = rv
+            if v in queued or v in dangling:
+                continue
+            dv = out_degree(v)
+            if dv == 0:
+                dangling.add(v)
+            elif rv > threshold * dv:
+                queue.append(v)
+                queued.add(v)
+    for n in dangling:
+        pagerank[n] = pagerank.get(n, 0) + (1 - alpha) * residual[n]
+    scale = 1 - alpha * sum(residual[n] for n in dangling)
+    return {n: p / scale for n, p in pagerank.items()}
+
+
+def _node_vector(np, values, nodelist, dtype):
+    """Returns the values of a dict keyed by node as an array in the order
+    of `nodelist`, scaled to sum to one."""
+    x = np.array([values.get(n, 0) for n in nodelist], dtype=dtype)
+    return x / x.sum()
+
+
+def _transition_matrix(G, weight, dtype):
+    """Returns the transpose of the transition matrix of the random walk
+    on `G` and a boolean array telling which nodes are dangling.
+
+    The structure of the matrix is that of the cached adjacency of `G`;
+    only the entries are computed on each call.
+    """
+    import numpy as np
+    from scipy import sparse
+    M = nx.to_scipy_sparse_view(G, weight=weight, dtype=dtype)
+    S = np.asarray(M.sum(axis=1)).ravel()
+    is_dangling = S == 0
+    scale = np.zeros(len(S), dtype=M.dtype)
+    np.divide(1, S, out=scale, where=~is_dangling)
+    data = M.data * np.repeat(scale, np.diff(M.indptr))
+    P = sparse.csr_matrix((data, M.indices, M.indptr), shape=M.shape,
+                          copy=False)
+    return P.T, is_dangling
+
+
+def _power_iteration(step, x, max_iter, tol, acceleration=None):
+    """Returns the limit of ``x = step(x)``, reached when the l1 norm of
+    the change is below `tol`.
+
+    With ``acceleration='quadratic'``, each fourth iterate is replaced by
+    the quadratic extrapolation of the last four.
+    """
+    import numpy as np
+    if acceleration not in (None, 'quadratic'):
+        raise ValueError("acceleration must be None or 'quadratic'.")
+    last = []
     for _ in range(max_iter):
         xlast = x
-        x = alpha * (x * M + sum(x[is_dangling]) * dangling_weights) + \
-            (1 - alpha) * p
+        x = step(x)
         # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < N * tol:
-            return dict(zip(nodelist, map(float, x)))
+        err = np.absolute(x - xlast).sum()
+        if err < tol:
+            return x
+        if acceleration is not None:
+            last.append(x)
+            if len(last) == 4:
+                x = _quadratic_extrapolation(np, *last)
+                last = []
     raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _quadratic_extrapolation(np, x0, x1, x2, x3):
+    """Returns the quadratic extrapolation of four successive iterates of
+    the power method, scaled to the sum of the last one."""
+    Y = np.column_stack((x1 - x0, x2 - x0))
+    g1, g2 = np.linalg.lstsq(Y, x0 - x3, rcond=None)[0]
+    x = (g1 + g2 + 1) * x1 + (g2 + 1) * x2 + x3
+    total = x.sum()
+    if not np.isfinite(total) or total == 0:
+        return x3
+    return x * (x3.sum() / total)
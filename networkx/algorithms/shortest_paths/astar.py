@@ -1,12 +1,16 @@
 """Shortest paths and path lengths using the A* ("A star") algorithm.
 """
+from array import array
 from heapq import heappush, heappop
 from itertools import count
 
 import networkx as nx
-from networkx.utils import not_implemented_for
+from networkx.utils import not_implemented_for, py_random_state
 
-__all__ = ['astar_path', 'astar_path_length']
+__all__ = ['astar_path', 'astar_path_length', 'landmark_heuristic',
+           'LandmarkHeuristic']
+
+_INF = float('inf')
 
 
 @not_implemented_for('multigraph')
@@ -30,6 +34,8 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
        A function to evaluate the estimate of the distance
        from the a node to the target.  The function takes
        two nodes arguments and must return a number.
+       Graphs without coordinates can use the heuristic returned by
+       :func:`landmark_heuristic`.
 
     weight: string, optional (default='weight')
        Edge data key corresponding to the edge weight.
@@ -56,7 +62,7 @@ def astar_path(G, source, target, heuristic=None, weight='weight'):
 
     See Also
     --------
-    shortest_path, dijkstra_path
+    shortest_path, dijkstra_path, landmark_heuristic
 
     """
     if source not in G or target not in G:
@@ -164,3 +170,176 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
 
     path = astar_path(G, source, target, heuristic, weight)
     return sum(G[u][v].get(weight, 1) for u, v in zip(path[:-1], path[1:]))
+
+
+@py_random_state(4)
+def landmark_heuristic(G, k=8, strategy='farthest', weight='weight',
+                       seed=None):
+    """Returns an A* heuristic computed from distances to landmarks.
+
+    The ALT method [1]_ (A*, landmarks and triangle inequality) picks a
+    few *landmark* nodes and stores the distances from every node to and
+    from each of them.  By the triangle inequality, the distance from `u`
+    to `v` is at least ``d(L, v) - d(L, u)`` and ``d(u, L) - d(v, L)`` for
+    every landmark `L`.  The largest of these bounds is an admissible and
+    consistent heuristic for :func:`astar_path` on any graph with
+    non-negative weights, and guides the search much better than no
+    heuristic when landmarks lie behind the source or the target.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    k : int, optional (default=8)
+       The number of landmarks.  More landmarks give tighter bounds, but
+       take more memory and make each evaluation of the heuristic slower.
+
+    strategy : 'farthest', 'random', 'degree' or list of nodes
+       How landmarks are picked:
+
+       - 'farthest' starts from a random node and repeatedly adds the node
+         farthest from the landmarks picked so far, so that landmarks lie
+         on the border of the graph (the default),
+       - 'random' picks random nodes,
+       - 'degree' picks the nodes of largest degree,
+       - a list of nodes gives the landmarks.
+
+    weight : string or function, optional (default='weight')
+       The edge weights, as for :func:`~networkx.dijkstra_path`.  They
+       must be the ones used in the A* search.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    heuristic : LandmarkHeuristic
+       A function of two nodes `u` and `v` returning a lower bound of the
+       distance from `u` to `v`.  It is only valid as long as no edge is
+       added to `G` and no edge weight decreases.
+
+    Raises
+    ------
+    ValueError
+       If `strategy` is not known.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> h = nx.landmark_heuristic(G, k=4, seed=1)
+    >>> h((0, 0), (9, 9)) <= nx.shortest_path_length(G, (0, 0), (9, 9))
+    True
+    >>> len(nx.astar_path(G, (0, 0), (9, 9), heuristic=h))
+    19
+
+    Notes
+    -----
+    Building the heuristic runs Dijkstra's algorithm twice from each
+    landmark for directed graphs, once for undirected graphs.  The
+    distances are stored as ``k`` arrays of floats per direction.
+
+    References
+    ----------
+    .. [1] Goldberg, A. V. and Harrelson, C.
+       "Computing the shortest path: A* search meets graph theory."
+       In *Proceedings of the 16th ACM-SIAM Symposium on Discrete
+       Algorithms (SODA)*, pp. 156--165, 2005.
+    """
+    nodes = list(G)
+    index = {n: i for i, n in enumerate(nodes)}
+    k = min(k, len(nodes))
+    reverse = G.reverse(copy=False) if G.is_directed() else None
+    landmarks = []
+    forward = []
+    backward = []
+
+    def add(landmark):
+        landmarks.append(landmark)
+        forward.append(_distances(G, landmark, index, weight))
+        if reverse is None:
+            backward.append(forward[-1])
+        else:
+            backward.append(_distances(reverse, landmark, index, weight))
+
+    if strategy == 'farthest':
+        # distance to the closest landmark, inf for nodes none reaches
+        closest = array('d', [_INF]) * len(nodes)
+        if k:
+            add(seed.choice(nodes))
+        while len(landmarks) < k:
+            closest = array('d', map(min, closest, forward[-1]))
+            for n in landmarks:
+                closest[index[n]] = -1
+            add(nodes[max(range(len(nodes)), key=closest.__getitem__)])
+    elif strategy == 'random':
+        for landmark in seed.sample(nodes, k):
+            add(landmark)
+    elif strategy == 'degree':
+        degree = dict(G.degree)
+        for landmark in sorted(nodes, key=degree.__getitem__,
+                               reverse=True)[:k]:
+            add(landmark)
+    elif isinstance(strategy, str):
+        raise ValueError("Unknown landmark strategy %r." % (strategy,))
+    else:
+        for landmark in strategy:
+            if landmark not in index:
+                raise nx.NodeNotFound("Landmark %s not in G" % (landmark,))
+            add(landmark)
+    return LandmarkHeuristic(landmarks, index, forward, backward)
+
+
+def _distances(G, source, index, weight):
+    """Returns an array of the distances from source, inf if unreachable."""
+    dist = array('d', [_INF]) * len(index)
+    lengths = nx.single_source_dijkstra_path_length(G, source, weight=weight)
+    for n, d in lengths.items():
+        dist[index[n]] = d
+    return dist
+
+
+class LandmarkHeuristic(object):
+    """Lower bounds of distances from distances to and from landmarks.
+
+    Use :func:`landmark_heuristic` to build one.  Calling it with two
+    nodes `u` and `v` returns a lower bound of the distance from `u` to
+    `v`, which may be ``inf`` if `v` is not reachable from `u`.
+
+    Parameters
+    ----------
+    landmarks : list
+       The landmark nodes.
+    index : dict
+       Maps each node to its position in the distance arrays.
+    forward, backward : lists of arrays
+       ``forward[i][index[n]]`` is the distance from landmark `i` to `n`,
+       ``backward[i][index[n]]`` from `n` to landmark `i`, ``inf`` if
+       there is no path.
+
+    Attributes
+    ----------
+    landmarks : list
+       The landmark nodes.
+    """
+
+    def __init__(self, landmarks, index, forward, backward):
+        self.landmarks = landmarks
+        self._index = index
+        self._forward = forward
+        self._backward = backward
+        self._bounds = list(zip(forward, backward))
+
+    def __call__(self, u, v):
+        i = self._index[u]
+        j = self._index[v]
+        if i == j:
+            return 0
+        bound = 0
+        for to, back in self._bounds:
+            # d(L, v) <= d(L, u) + d(u, v) and d(u, L) <= d(u, v) + d(v, L)
+            if to[i] != _INF and to[j] - to[i] > bound:
+                bound = to[j] - to[i]
+            if back[j] != _INF and back[i] - back[j] > bound:
+                bound = back[i] - back[j]
+        return bound
@@ -0,0 +1,382 @@
+"""
+Shortest path algorithms with bucket priority queues.
+
+Graphs whose edge weights are small non-negative integers have few
+distinct path lengths.  Instead of a binary heap of nodes, these
+algorithms keep the nodes to search in buckets of equal (or nearby)
+distance from the source.
+"""
+from heapq import heappush, heappop
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+__all__ = ['single_source_dial', 'delta_stepping_path_length']
+
+
+def single_source_dial(G, source, target=None, cutoff=None, weight='weight'):
+    """Find shortest weighted paths and lengths from a source node.
+
+    This is :func:`~networkx.single_source_dijkstra` with Dial's bucket
+    queue in place of a binary heap: nodes to search are appended to a
+    list per tentative distance, and only the distinct distances are kept
+    in a heap.  It is faster for small integer weights, where many nodes
+    share a distance, and returns the same paths.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node label
+        Starting node for path
+
+    target : node label, optional
+        Ending node for path
+
+    cutoff : integer or float, optional
+        Depth to stop the search. Only return paths with length <= cutoff.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to hide the edge.
+
+    Returns
+    -------
+    distance, path : pair of dictionaries, or numeric and list.
+        If target is None, paths and lengths to all nodes are computed.
+        The return value is a tuple of two dictionaries keyed by target nodes.
+        The first dictionary stores distance to each target node.
+        The second stores the path to each target node.
+        If target is not None, returns a tuple (distance, path), where
+        distance is the distance from source to target and path is a list
+        representing the path from source to target.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXNoPath
+        If `target` is not reachable from `source`.
+
+    ValueError
+        If a negative weight makes a shorter path to a node already
+        searched.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> nx.add_path(G, [0, 5, 4], weight=3)
+    >>> length, path = nx.single_source_dial(G, 0)
+    >>> length[4]
+    4
+    >>> path[4]
+    [0, 1, 2, 3, 4]
+    >>> nx.single_source_dial(G, 0, 5)
+    (3, [0, 5])
+
+    Notes
+    -----
+    Nodes at the same distance are searched in the order in which they
+    were reached, as by the heap of :func:`~networkx.single_source_dijkstra`,
+    so both functions return the same dictionaries.  With real-valued
+    weights most distances differ and the bucket queue gives no benefit.
+
+    See Also
+    --------
+    single_source_dijkstra, delta_stepping_path_length
+    """
+    if source not in G:
+        raise nx.NodeNotFound("Source {} not in G".format(source))
+    if target == source:
+        return (0, [source])
+    weight = _weight_function(G, weight)
+    paths = {source: [source]}
+    dist = _dial_multisource(G, [source], weight, paths=paths, cutoff=cutoff,
+                             target=target)
+    if target is None:
+        return (dist, paths)
+    try:
+        return (dist[target], paths[target])
+    except KeyError:
+        raise nx.NetworkXNoPath("No path to {}.".format(target))
+
+
+def _dial_multisource(G, sources, weight, pred=None, paths=None,
+                      cutoff=None, target=None):
+    """Dijkstra's algorithm with a bucket queue.
+
+    Takes the same arguments and returns the same distances as
+    :func:`~networkx.algorithms.shortest_paths.weighted._dijkstra_multisource`.
+    `buckets` maps each tentative distance to the nodes reached at that
+    distance, in order, and `keys` is a heap of these distances.
+    """
+    G_succ = G._succ if G.is_directed() else G._adj
+
+    dist = {}  # dictionary of final distances
+    seen = {}
+    buckets = {}
+    keys = []
+    for source in sources:
+        if source not in G:
+            raise nx.NodeNotFound("Source {} not in G".format(source))
+        seen[source] = 0
+        if buckets:
+            buckets[0].append(source)
+        else:
+            buckets[0] = [source]
+            keys.append(0)
+    while keys:
+        d = heappop(keys)
+        for v in buckets.pop(d):
+            if v in dist:
+                continue  # already searched this node.
+            dist[v] = d
+            if v == target:
+                return dist
+            for u, e in G_succ[v].items():
+                cost = weight(v, u, e)
+                if cost is None:
+                    continue
+                vu_dist = d + cost
+                if cutoff is not None and vu_dist > cutoff:
+                    continue
+                if u in dist:
+                    if vu_dist < dist[u]:
+                        raise ValueError('Contradictory paths found:',
+                                         'negative weights?')
+                elif u not in seen or vu_dist < seen[u]:
+                    seen[u] = vu_dist
+                    bucket = buckets.get(vu_dist)
+                    if bucket is None:
+                        buckets[vu_dist] = [u]
+                        heappush(keys, vu_dist)
+                    else:
+                        bucket.append(u)
+                    if paths is not None:
+                        paths[u] = paths[v] + [u]
+                    if pred is not None:
+                        pred[u] = [v]
+                elif vu_dist == seen[u]:
+                    if pred is not None:
+                        pred[u].append(v)
+    return dist
+
+
+def delta_stepping_path_length(G, source, delta=None, cutoff=None,
+                               weight='weight'):
+    """Compute shortest path lengths from a source by delta-stepping.
+
+    Delta-stepping [1]_ keeps the nodes to search in buckets of
+    distances ``[i * delta, (i + 1) * delta)``.  All the nodes of the
+    first non-empty bucket are searched at once: their light edges
+    (of weight at most `delta`) are relaxed together, repeatedly, while
+    this refills the bucket, then their heavy edges.  Each round of
+    relaxations is a single NumPy operation over the edges of many
+    nodes, which is much faster than searching one node at a time.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node label
+        Starting node for path
+
+    delta : number, optional
+        The width of the buckets.  By default the largest weight divided
+        by the mean out-degree.  Small values give more, smaller rounds;
+        large ones relax some edges several times.
+
+    cutoff : integer or float, optional
+        Depth to stop the search. Only return paths with length <= cutoff.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to hide the edge.
+
+    Returns
+    -------
+    length : dict
+        Dict keyed by node to shortest path length from source, listed
+        by increasing length.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    ValueError
+        If a weight is negative or `delta` is not positive.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> nx.add_path(G, [0, 5, 4], weight=3)
+    >>> length = nx.delta_stepping_path_length(G, 0)
+    >>> length[4], length[5]
+    (4, 3)
+
+    Notes
+    -----
+    Integer weights give integer lengths; other weights are converted to
+    floats.  Real-valued lengths may differ from those of
+    :func:`~networkx.single_source_dijkstra_path_length` by rounding.
+    NumPy is required.
+
+    Each bucket costs a few NumPy operations whatever its size, so this
+    is faster than Dijkstra's algorithm when there are few buckets of
+    many nodes, on graphs of small weighted diameter such as random or
+    social graphs.  On long paths or grids most buckets hold a few nodes
+    and Dijkstra's algorithm is much faster.
+
+    See Also
+    --------
+    single_source_dijkstra_path_length, single_source_dial
+
+    References
+    ----------
+    .. [1] Meyer, Ulrich, and Peter Sanders.
+       "Δ-stepping: a parallelizable shortest path algorithm."
+       Journal of Algorithms 49.1 (2003): 114-152.
+    """
+    import numpy as np
+    if source not in G:
+        raise nx.NodeNotFound("Source {} not in G".format(source))
+    nodes, number, tails, heads, weights = _weighted_edges(np, G, weight)
+    n = len(nodes)
+    if len(weights) and weights.min() < 0:
+        raise ValueError("delta_stepping_path_length requires non-negative "
+                         "weights.")
+    if delta is None:
+        delta = weights.max() * n / len(weights) if len(weights) else 1
+        if delta <= 0:
+            delta = 1
+    elif not delta > 0:
+        raise ValueError("delta must be positive.")
+    light = weights <= delta
+    light_edges = _csr(np, n, tails[light], heads[light], weights[light])
+    heavy_edges = _csr(np, n, tails[~light], heads[~light], weights[~light])
+    if weights.dtype.kind == 'f':
+        unreached = np.inf
+    else:
+        unreached = np.iinfo(weights.dtype).max
+    dist = np.full(n, unreached, dtype=weights.dtype)
+    done = np.zeros(n, dtype=bool)
+    dist[number[source]] = 0
+    # the nodes reached but not searched yet
+    pending = np.array([number[source]], dtype=np.intp)
+    while len(pending):
+        # the nodes of the first non-empty bucket; members are found by
+        # the same floor division as the bucket number, so that rounding
+        # cannot leave the bucket empty
+        index = dist[pending] // delta
+        i = index.min()
+        inside = index == i
+        bucket = pending[inside]
+        reached = [pending[~inside]]
+        searched = [bucket]
+        while len(bucket) and len(light_edges[1]):
+            improved = _relax(np, light_edges, dist, bucket, cutoff)
+            inside = dist[improved] // delta == i
+            bucket = improved[inside]
+            reached.append(improved[~inside])
+            if len(bucket):
+                searched.append(bucket)
+        if len(searched) > 1:
+            searched = np.unique(np.concatenate(searched))
+        else:
+            searched = searched[0]
+        if len(heavy_edges[1]):
+            reached.append(_relax(np, heavy_edges, dist, searched, cutoff))
+        done[searched] = True
+        pending = np.concatenate(reached)
+        pending = np.unique(pending[~done[pending]])
+    reached = np.flatnonzero(done)
+    reached = reached[np.argsort(dist[reached], kind='stable')]
+    return dict(zip([nodes[i] for i in reached.tolist()],
+                    dist[reached].tolist()))
+
+
+def _weighted_edges(np, G, weight):
+    """Returns the nodes, their numbers and arrays of tails, heads and weights.
+
+    Tails and heads are node numbers, with tails in increasing order.
+    Edges whose weight is None are left out.
+    """
+    if isinstance(weight, str):
+        index = nx.node_index(G)
+        values = index.edge_values(weight)
+        tails = index.rows()
+        heads = index.indices
+        if None in values:
+            keep = np.array([w is not None for w in values], dtype=bool)
+            tails, heads = tails[keep], heads[keep]
+            values = [w for w in values if w is not None]
+        return (index.nodes, index.index, tails, heads,
+                _weight_array(np, values))
+    weight = _weight_function(G, weight)
+    nodes = list(G)
+    number = {u: i for i, u in enumerate(nodes)}
+    G_succ = G._succ if G.is_directed() else G._adj
+    tails = []
+    heads = []
+    values = []
+    for u, nbrs in G_succ.items():
+        i = number[u]
+        for v, e in nbrs.items():
+            w = weight(u, v, e)
+            if w is not None:
+                tails.append(i)
+                heads.append(number[v])
+                values.append(w)
+    return (nodes, number, np.array(tails, dtype=np.intp),
+            np.array(heads, dtype=np.intp), _weight_array(np, values))
+
+
+def _weight_array(np, values):
+    weights = np.array(values)
+    if weights.dtype.kind in 'iub' or len(values) == 0:
+        return weights.astype(np.int64)
+    return weights.astype(float)
+
+
+def _csr(np, n, tails, heads, weights):
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+    return indptr, heads, weights
+
+
+def _relax(np, edges, dist, bucket, cutoff):
+    """Relaxes the edges out of `bucket`; returns the nodes improved."""
+    indptr, heads, weights = edges
+    starts = indptr[bucket]
+    counts = indptr[bucket + 1] - starts
+    ends = np.cumsum(counts)
+    slots = np.arange(ends[-1] if len(ends) else 0) + \
+        np.repeat(starts - ends + counts, counts)
+    targets = heads[slots]
+    lengths = np.repeat(dist[bucket], counts) + weights[slots]
+    shorter = lengths < dist[targets]
+    if cutoff is not None:
+        shorter &= lengths <= cutoff
+    targets = targets[shorter]
+    np.minimum.at(dist, targets, lengths[shorter])
+    return np.unique(targets)
@@ -0,0 +1,413 @@
+"""Shortest path queries answered from a contraction hierarchy.
+
+A contraction hierarchy [1]_ is built once from a weighted graph by
+contracting its nodes one at a time, from the least to the most
+important.  Contracting a node removes it and adds a *shortcut* edge
+between each pair of its neighbors whose shortest path went through it.
+Afterwards, a shortest path between any two nodes can be found by a
+bidirectional Dijkstra search that only follows edges and shortcuts
+towards more important nodes.  Such a search settles a few hundred nodes
+on road networks of millions of nodes, instead of a large part of the
+graph.
+
+The hierarchy is stored as a directed *overlay graph*.  It can be
+written to disk with :func:`write_contraction_hierarchy` and read back,
+memory mapped, with :func:`read_contraction_hierarchy`, so that it does
+not have to be built again.
+
+References
+----------
+.. [1] Geisberger, R., Sanders, P., Schultes, D. and Delling, D.
+   "Contraction Hierarchies: Faster and Simpler Hierarchical Routing in
+   Road Networks." In *Experimental Algorithms (WEA 2008)*, LNCS 5038,
+   pp. 319--333. Springer, 2008.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+from networkx.utils import open_file
+
+__all__ = ['ContractionHierarchy', 'contraction_hierarchy',
+           'write_contraction_hierarchy', 'read_contraction_hierarchy']
+
+# the number of nodes a witness search settles before giving up and
+# adding a (possibly unnecessary) shortcut
+_WITNESS_LIMIT = 200
+
+
+def contraction_hierarchy(G, weight='weight'):
+    """Builds a contraction hierarchy of `G` for shortest path queries.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : string or function
+       If this is a string, then edge weights will be accessed via the
+       edge attribute with this key (that is, the weight of the edge
+       joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+       such edge attribute exists, the weight of the edge is assumed to
+       be one.
+
+       If this is a function, the weight of an edge is the value
+       returned by the function. The function must accept exactly three
+       positional arguments: the two endpoints of an edge and the
+       dictionary of edge attributes for that edge. The function must
+       return a number or None to hide the edge.
+
+    Returns
+    -------
+    hierarchy : ContractionHierarchy
+       The hierarchy.  Later changes to `G` are not reflected in it.
+
+    Raises
+    ------
+    ValueError
+       If an edge has a negative weight.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(4, 4)
+    >>> nx.set_edge_attributes(G, 2, 'weight')
+    >>> ch = nx.contraction_hierarchy(G)
+    >>> ch.shortest_path_length((0, 0), (3, 3))
+    12
+    >>> length, path = ch.query((0, 0), (0, 3))
+    >>> length, path
+    (6, [(0, 0), (0, 1), (0, 2), (0, 3)])
+
+    Notes
+    -----
+    Nodes are contracted in the order of their *edge difference*, the
+    number of shortcuts their contraction adds minus the number of edges
+    it removes, plus the number of their neighbors already contracted,
+    which spreads the contraction evenly over the graph.  Whether a
+    shortcut is needed is decided by a *witness search*, a Dijkstra
+    search for another path that is not longer.  Witness searches are
+    bounded, so that a few unneeded shortcuts may be added.
+
+    Contraction hierarchies work best on graphs with a low highway
+    dimension like road networks.  On other graphs, e.g. social networks,
+    the number of shortcuts may grow quickly.
+
+    See Also
+    --------
+    ContractionHierarchy
+    bidirectional_dijkstra
+    """
+    weight = _weight_function(G, weight)
+    directed = G.is_directed()
+    # the remaining graph: succ[u][v] = (weight, node shortcut u->v skips)
+    succ = {u: {} for u in G}
+    pred = {u: {} for u in G} if directed else succ
+    for u, nbrs in G._adj.items():
+        for v, d in nbrs.items():
+            if u == v:
+                continue
+            w = weight(u, v, d)
+            if w is None:
+                continue
+            if w < 0:
+                raise ValueError('Contraction hierarchies require '
+                                 'non-negative weights.')
+            if v not in succ[u] or w < succ[u][v][0]:
+                succ[u][v] = (w, None)
+                pred[v][u] = (w, None)
+
+    overlay = nx.DiGraph(directed=directed)
+    overlay.add_nodes_from(G)
+    contracted = {u: 0 for u in G}  # number of contracted neighbors
+
+    def shortcuts(v):
+        """Returns the shortcuts ``(u, w, length)`` contracting v needs."""
+        needed = []
+        outs = [(w, d[0]) for w, d in succ[v].items()]
+        for u, (uv, _) in pred[v].items():
+            targets = {w: uv + vw for w, vw in outs if w != u}
+            if not directed:
+                # pairs are symmetric; search each once
+                targets = {w: l for w, l in targets.items()
+                           if (u, w) not in seen_pairs}
+                seen_pairs.update((w, u) for w in targets)
+            if targets:
+                dist = _witness_search(succ, u, v, targets)
+                needed.extend((u, w, l) for w, l in targets.items()
+                              if dist.get(w, l + 1) > l)
+        return needed
+
+    def priority(v):
+        seen_pairs.clear()
+        removed = len(succ[v]) + (len(pred[v]) if directed else 0)
+        return len(shortcuts(v)) - removed + contracted[v]
+
+    seen_pairs = set()
+    c = count()
+    queue = [(priority(v), next(c), v) for v in G]
+    queue.sort()
+    while queue:
+        _, _, v = heappop(queue)
+        p = priority(v)
+        if queue and p > queue[0][0]:
+            # lazy update: v got less attractive since it was queued
+            heappush(queue, (p, next(c), v))
+            continue
+        seen_pairs.clear()
+        new = shortcuts(v)
+        # every remaining edge of v leads to a more important node
+        for w, (vw, via) in succ[v].items():
+            _add_overlay_edge(overlay, v, w, 'up', vw, via)
+        for u, (uv, via) in pred[v].items():
+            _add_overlay_edge(overlay, v, u, 'down', uv, via)
+        for u, w, length in new:
+            for a, b in ((u, w), (w, u)) if not directed else ((u, w),):
+                if b not in succ[a] or length < succ[a][b][0]:
+                    succ[a][b] = (length, v)
+                    pred[b][a] = (length, v)
+        for u in pred[v]:
+            del succ[u][v]
+            contracted[u] += 1
+        if directed:
+            for w in succ[v]:
+                del pred[w][v]
+                contracted[w] += 1
+        del succ[v]
+        if directed:
+            del pred[v]
+    return ContractionHierarchy(overlay)
+
+
+def _witness_search(succ, source, avoid, targets):
+    """Returns distances from `source` avoiding `avoid` up to the targets.
+
+    The search stops once it has settled every target, passed the
+    longest length in `targets` or settled `_WITNESS_LIMIT` nodes.
+    """
+    limit = max(targets.values())
+    remaining = len(targets)
+    dist = {}
+    seen = {source: 0}
+    c = count()
+    fringe = [(0, next(c), source)]
+    while fringe and len(dist) < _WITNESS_LIMIT:
+        d, _, u = heappop(fringe)
+        if u in dist:
+            continue
+        dist[u] = d
+        if u in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for w, (uw, _) in succ[u].items():
+            l = d + uw
+            if w == avoid or l > limit:
+                continue
+            if w not in seen or l < seen[w]:
+                seen[w] = l
+                heappush(fringe, (l, next(c), w))
+    return seen
+
+
+def _add_overlay_edge(overlay, low, high, direction, length, via):
+    # The edge low -> high holds the weight of the edge from `low` to
+    # `high` as 'up' and of the edge from `high` to `low` as 'down', and
+    # the nodes these shortcuts skip as 'up_via' and 'down_via'.
+    data = {direction: length}
+    if via is not None:
+        data[direction + '_via'] = via
+    overlay.add_edge(low, high, **data)
+
+
+class ContractionHierarchy(object):
+    """Shortest path index of a weighted graph.
+
+    Use :func:`contraction_hierarchy` to build the hierarchy of a graph
+    and :func:`read_contraction_hierarchy` to read one from disk.
+
+    Parameters
+    ----------
+    overlay : DiGraph
+       The overlay graph of the hierarchy, as built by
+       :func:`contraction_hierarchy`.  It has an edge from each node to
+       each more important node it is joined to by an edge or shortcut.
+       Edge attribute ``'up'`` is the length of the edge or shortcut
+       in this direction and ``'down'`` in the reverse direction;
+       ``'up_via'`` and ``'down_via'`` are the nodes shortcuts skip.
+
+    Attributes
+    ----------
+    overlay : DiGraph
+       The overlay graph.
+    """
+
+    def __init__(self, overlay):
+        self.overlay = overlay
+
+    def __contains__(self, n):
+        return n in self.overlay
+
+    def __len__(self):
+        return len(self.overlay)
+
+    def query(self, source, target):
+        """Returns the length and a shortest path from source to target.
+
+        Parameters
+        ----------
+        source, target : nodes
+
+        Returns
+        -------
+        length, path : number and list
+           The distance from source to target and the list of nodes of a
+           shortest path.
+
+        Raises
+        ------
+        NodeNotFound
+           If `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+           If no path exists between source and target.
+        """
+        succ = self.overlay._succ
+        for n in (source, target):
+            if n not in succ:
+                raise nx.NodeNotFound('Node %s not in graph' % (n,))
+        if source == target:
+            return (0, [source])
+        keys = ('up', 'down')
+        dists = [{}, {}]
+        seen = [{source: 0}, {target: 0}]
+        preds = [{source: None}, {target: None}]
+        c = count()
+        fringe = [[(0, next(c), source)], [(0, next(c), target)]]
+        best = None
+        meet = None
+        direction = 1
+        while fringe[0] or fringe[1]:
+            # alternate directions while both have nodes worth settling
+            if not fringe[1 - direction]:
+                pass
+            elif not fringe[direction] or fringe[1 - direction][0][0] \
+                    <= fringe[direction][0][0]:
+                direction = 1 - direction
+            d, _, v = heappop(fringe[direction])
+            if best is not None and d >= best:
+                # neither direction can find a shorter path in this heap
+                fringe[direction] = []
+                continue
+            dist = dists[direction]
+            if v in dist:
+                continue
+            dist[v] = d
+            key = keys[direction]
+            this_seen = seen[direction]
+            other_seen = seen[1 - direction]
+            for w, data in succ[v].items():
+                cost = data.get(key)
+                if cost is None:
+                    continue
+                vw = d + cost
+                if w not in this_seen or vw < this_seen[w]:
+                    this_seen[w] = vw
+                    preds[direction][w] = v
+                    heappush(fringe[direction], (vw, next(c), w))
+                    if w in other_seen:
+                        total = vw + other_seen[w]
+                        if best is None or total < best:
+                            best, meet = total, w
+            if v in other_seen:
+                total = d + other_seen[v]
+                if best is None or total < best:
+                    best, meet = total, v
+        if best is None:
+            raise nx.NetworkXNoPath("No path between %s and %s." %
+                                    (source, target))
+        path = []
+        v = meet
+        while v is not None:
+            path.append(v)
+            v = preds[0][v]
+        path.reverse()
+        v = preds[1][meet]
+        while v is not None:
+            path.append(v)
+            v = preds[1][v]
+        return best, self._unpack(path)
+
+    def shortest_path(self, source, target):
+        """Returns a shortest path from source to target as a list."""
+        return self.query(source, target)[1]
+
+    def shortest_path_length(self, source, target):
+        """Returns the length of a shortest path from source to target."""
+        return self.query(source, target)[0]
+
+    def _unpack(self, path):
+        """Replaces the shortcuts of an overlay path by the nodes they skip.
+        """
+        succ = self.overlay._succ
+        result = [path[0]]
+        stack = list(reversed(list(zip(path, path[1:]))))
+        while stack:
+            a, b = stack.pop()
+            if b in succ[a]:
+                via = succ[a][b].get('up_via')
+            else:
+                via = succ[b][a].get('down_via')
+            if via is None:
+                result.append(b)
+            else:
+                stack.append((via, b))
+                stack.append((a, via))
+        return result
+
+
+@open_file(1, mode='wb')
+def write_contraction_hierarchy(hierarchy, path):
+    """Writes a contraction hierarchy in the binary graph format.
+
+    Parameters
+    ----------
+    hierarchy : ContractionHierarchy
+
+    path : file or string
+       File or filename to write.
+
+    Raises
+    ------
+    NetworkXError
+       If the nodes or edge lengths can not be stored in the binary
+       format, see :func:`~networkx.write_binary`.
+
+    Examples
+    --------
+    >>> ch = nx.contraction_hierarchy(nx.path_graph(4))
+    >>> nx.write_contraction_hierarchy(ch, 'test.nxb')
+    >>> ch = nx.read_contraction_hierarchy('test.nxb')
+    >>> ch.shortest_path(0, 3)
+    [0, 1, 2, 3]
+    """
+    nx.write_binary(hierarchy.overlay, path)
+
+
+def read_contraction_hierarchy(path, memory_map=True):
+    """Reads a contraction hierarchy written by
+    :func:`write_contraction_hierarchy`.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+
+    memory_map : bool, optional (default=True)
+       If True, the overlay graph is memory mapped, so that a hierarchy
+       is ready to answer queries as soon as it is read.
+
+    Returns
+    -------
+    hierarchy : ContractionHierarchy
+    """
+    return ContractionHierarchy(nx.read_binary(path, memory_map=memory_map))
@@ -5,7 +5,8 @@ import networkx as nx
 __all__ = ['floyd_warshall',
            'floyd_warshall_predecessor_and_distance',
            'reconstruct_path',
-           'floyd_warshall_numpy']
+           'floyd_warshall_numpy',
+           'floyd_warshall_blocked']
 
 
 def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
@@ -35,6 +36,10 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
     dense graphs or graphs with negative weights when Dijkstra's
     algorithm fails. This algorithm can still fail if there are negative
     cycles.  It has running time $O(n^3)$ with running space of $O(n^2)$.
+
+    See Also
+    --------
+    floyd_warshall_blocked
     """
     try:
         import numpy as np
@@ -48,11 +53,244 @@ def floyd_warshall_numpy(G, nodelist=None, weight='weight'):
                            weight=weight, nonedge=np.inf)
     n, m = A.shape
     A[np.identity(n) == 1] = 0  # diagonal elements should be zero
-    for i in range(n):
-        A = np.minimum(A, A[i, :] + A[:, i])
+    _floyd_warshall_blocked(np, A.view(np.ndarray))
     return A
 
 
+def floyd_warshall_blocked(G, nodelist=None, weight='weight', dtype=None,
+                           predecessors=False, out=None, pred_out=None,
+                           block_size=64):
+    """Find all-pairs shortest path lengths with a blocked Floyd algorithm.
+
+    The distance matrix is updated one block of `block_size` pivots at a
+    time.  The rows and then the columns of the pivots are updated first;
+    the rest of the matrix is then the min-plus product of these columns
+    and rows, which is computed a band of rows at a time while the band
+    stays in the CPU cache.  Each block reads and writes the matrix once,
+    instead of once per pivot, so that it can also be kept in a memory
+    mapped file larger than the available memory.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes().
+
+    weight: string, optional (default= 'weight')
+       Edge data key corresponding to the edge weight.  Edges without
+       this attribute have weight 1; parallel edges the smallest weight.
+
+    dtype : NumPy floating point data type, optional (default=float)
+       The type of the distances, e.g. ``numpy.float32`` to halve the
+       memory used at the cost of precision.
+
+    predecessors : bool, optional (default=False)
+       If True, also return the matrix of predecessors.
+
+    out : ndarray or string, optional
+       An array of shape ``(n, n)`` to store the distances, e.g. a
+       :class:`numpy.memmap`, or the name of a ``.npy`` file to create
+       and memory map with :func:`numpy.lib.format.open_memmap`.
+
+    pred_out : ndarray or string, optional
+       The same for the integer matrix of predecessors.
+
+    block_size : int, optional (default=64)
+       The number of pivots per block.
+
+    Returns
+    -------
+    distance : NumPy array
+        The matrix of shortest path distances between nodes, `out` if it
+        is given.  If there is no path between two nodes the corresponding
+        matrix entry is Inf.
+
+    predecessor, distance : NumPy arrays
+        If `predecessors` is True.  ``predecessor[i, j]`` is the number
+        of the node before node `j` on a shortest path from node `i`, or
+        -1 if `i` is `j` or there is no path.  Use :func:`reconstruct_path`
+        to follow them.
+
+    Raises
+    ------
+    NetworkXError
+        If `nodelist` contains duplicates.
+
+    ValueError
+        If `dtype` is not a floating point type or `out` does not have
+        the shape of the matrix.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_weighted_edges_from([('s', 'u', 10), ('s', 'x', 5),
+    ...     ('u', 'v', 1), ('u', 'x', 2), ('v', 'y', 1), ('x', 'u', 3),
+    ...     ('x', 'v', 5), ('x', 'y', 2), ('y', 's', 7), ('y', 'v', 6)])
+    >>> nodes = list(G)
+    >>> pred, dist = nx.floyd_warshall_blocked(G, predecessors=True)
+    >>> dist[nodes.index('s'), nodes.index('v')]
+    9.0
+    >>> path = nx.reconstruct_path(nodes.index('s'), nodes.index('v'), pred)
+    >>> [nodes[i] for i in path]
+    ['s', 'x', 'u', 'v']
+
+    Notes
+    -----
+    Floyd's algorithm is appropriate for finding shortest paths in
+    dense graphs or graphs with negative weights when Dijkstra's
+    algorithm fails. This algorithm can still fail if there are negative
+    cycles.  It has running time $O(n^3)$ with running space of $O(n^2)$.
+
+    The distances are those of :func:`floyd_warshall_numpy`, up to the
+    rounding of sums of floating point weights.
+
+    With `predecessors`, paths of equal length are compared by their
+    number of edges, which are counted in an additional matrix of 32-bit
+    integers kept in memory.  This keeps the predecessors free of cycles
+    when there are cycles of zero weight, and makes the computation about
+    twice as slow.
+
+    See Also
+    --------
+    floyd_warshall_numpy
+    floyd_warshall_predecessor_and_distance
+    reconstruct_path
+    """
+    import numpy as np
+    dtype = np.dtype(float if dtype is None else dtype)
+    if dtype.kind != 'f':
+        raise ValueError("dtype must be a floating point type.")
+    if block_size < 1:
+        raise ValueError("block_size must be positive.")
+    if nodelist is None:
+        nodelist = list(G)
+    n = len(nodelist)
+    index = dict(zip(nodelist, range(n)))
+    if len(index) != n:
+        msg = "Ambiguous ordering: `nodelist` contained duplicates."
+        raise nx.NetworkXError(msg)
+    rows = []
+    cols = []
+    values = []
+    for u, nbrs in G.adjacency():
+        i = index.get(u)
+        if i is None:
+            continue
+        for v, d in nbrs.items():
+            j = index.get(v)
+            if j is None:
+                continue
+            rows.append(i)
+            cols.append(j)
+            if G.is_multigraph():
+                values.append(min(e.get(weight, 1) for e in d.values()))
+            else:
+                values.append(d.get(weight, 1))
+
+    dist = _output_matrix(np, out, n, dtype)
+    dist.fill(np.inf)
+    rows = np.array(rows, dtype=np.intp)
+    cols = np.array(cols, dtype=np.intp)
+    dist[rows, cols] = np.array(values, dtype=dtype)
+    np.fill_diagonal(dist, 0)
+    pred = None
+    if predecessors:
+        pred = _output_matrix(np, pred_out, n, np.dtype(np.int32))
+        pred.fill(-1)
+        pred[rows, cols] = rows
+        np.fill_diagonal(pred, -1)
+    _floyd_warshall_blocked(np, dist, pred, block_size)
+    if predecessors:
+        return pred, dist
+    return dist
+
+
+def _output_matrix(np, out, n, dtype):
+    if out is None:
+        return np.empty((n, n), dtype=dtype)
+    if isinstance(out, str):
+        return np.lib.format.open_memmap(out, mode='w+', dtype=dtype,
+                                         shape=(n, n))
+    if out.shape != (n, n):
+        raise ValueError("out must have shape {}.".format((n, n)))
+    return out
+
+
+def _floyd_warshall_blocked(np, dist, pred=None, block_size=64):
+    """Runs Floyd's algorithm in place on the matrix `dist`.
+
+    If `pred` is not None, it is updated with the predecessors.  Blocks
+    of pivots are processed in order, and the pivots of a block in order
+    for the rows of the block, then for the columns of the block, then
+    for bands of the other rows, about a megabyte each.
+
+    With predecessors, paths are compared by length, then by number of
+    edges, the numbers of edges being kept in a matrix of hops.  The
+    predecessor of `j` on the path from `i` is then always strictly
+    closer to `i` in this order, whatever the order of the updates, so
+    that predecessors cannot form a cycle even along cycles of zero
+    weight.
+    """
+    n = len(dist)
+    band_rows = max(1, (1 << 20) // max(1, n * dist.itemsize))
+    scratch = np.empty((band_rows, n), dtype=dist.dtype)
+    if pred is not None:
+        hops = (np.asarray(pred) >= 0).astype(np.int32)
+        hop_scratch = np.empty((band_rows, n), dtype=np.int32)
+        mask = np.empty((band_rows, n), dtype=bool)
+        ties = np.empty((band_rows, n), dtype=bool)
+
+    def relax(rows, cols, k, copy=False):
+        # dist[i, j] = min(dist[i, j], dist[i, k] + dist[k, j]) for i in
+        # rows and j in cols, by bands of rows
+        row = dist[k].copy() if copy else dist[k]
+        if pred is not None:
+            hop_row = hops[k].copy() if copy else hops[k]
+            pred_row = pred[k].copy() if copy else pred[k]
+        for i0 in range(rows.start, rows.stop, band_rows):
+            i1 = min(i0 + band_rows, rows.stop)
+            D = dist[i0:i1, cols]
+            t = scratch[:i1 - i0, :D.shape[1]]
+            np.add(dist[i0:i1, k, None], row[cols], out=t)
+            if pred is None:
+                np.minimum(D, t, out=D)
+                continue
+            H = hops[i0:i1, cols]
+            th = hop_scratch[:i1 - i0, :D.shape[1]]
+            np.add(hops[i0:i1, k, None], hop_row[cols], out=th)
+            m = mask[:i1 - i0, :D.shape[1]]
+            tie = ties[:i1 - i0, :D.shape[1]]
+            # shorter, or as long with fewer edges
+            np.equal(t, D, out=tie)
+            np.less(th, H, out=m)
+            tie &= m
+            np.less(t, D, out=m)
+            m |= tie
+            np.copyto(D, t, where=m)
+            np.copyto(H, th, where=m)
+            np.copyto(pred[i0:i1, cols], pred_row[cols], where=m)
+
+    every = slice(0, n)
+    for k0 in range(0, n, block_size):
+        block = slice(k0, min(k0 + block_size, n))
+        # rows of the pivots, which are updated by the pivots themselves
+        for k in range(block.start, block.stop):
+            relax(block, every, k, copy=True)
+        # columns of the pivots, by bands of rows
+        for i0 in range(0, n, band_rows):
+            band = slice(i0, min(i0 + band_rows, n))
+            for k in range(block.start, block.stop):
+                relax(band, block, k)
+        # the other rows: min-plus product of the columns and rows
+        for rows in (slice(0, block.start), slice(block.stop, n)):
+            for i0 in range(rows.start, rows.stop, band_rows):
+                band = slice(i0, min(i0 + band_rows, rows.stop))
+                for k in range(block.start, block.stop):
+                    relax(band, every, k)
+
+
 def floyd_warshall_predecessor_and_distance(G, weight='weight'):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
 
@@ -135,9 +373,12 @@ def reconstruct_path(source, target, predecessors):
     target : node
        Ending node for path
 
-    predecessors: dictionary
+    predecessors: dictionary or NumPy array
        Dictionary, keyed by source and target, of predecessors in the
-       shortest path, as returned by floyd_warshall_predecessor_and_distance
+       shortest path, as returned by floyd_warshall_predecessor_and_distance,
+       or matrix of predecessors as returned by floyd_warshall_blocked.
+       With a matrix, `source`, `target` and the nodes of the path are
+       row and column numbers.
 
     Returns
     -------
@@ -146,6 +387,15 @@ def reconstruct_path(source, target, predecessors):
 
        If source and target are the same, an empty list is returned
 
+    Raises
+    ------
+    NetworkXNoPath
+       If `predecessors` is a matrix and there is no path from `source`
+       to `target`.
+
+    NetworkXError
+       If the predecessors form a cycle.
+
     Notes
     ------
     This function is meant to give more applicability to the
@@ -154,13 +404,26 @@ def reconstruct_path(source, target, predecessors):
     See Also
     --------
     floyd_warshall_predecessor_and_distance
+    floyd_warshall_blocked
     """
     if source == target:
         return []
-    prev = predecessors[source]
-    curr = prev[target]
+    if hasattr(predecessors, 'ndim'):
+        prev = predecessors[source].tolist()
+        curr = prev[target]
+        if curr < 0:
+            raise nx.NetworkXNoPath("No path between {} and {}."
+                                    .format(source, target))
+        n = len(prev)
+    else:
+        prev = predecessors[source]
+        curr = prev[target]
+        n = len(prev) + 1
     path = [target, curr]
     while curr != source:
+        if len(path) > n:
+            raise nx.NetworkXError("The predecessors of {} contain a cycle."
+                                   .format(source))
         curr = prev[curr]
         path.append(curr)
     return list(reversed(path))
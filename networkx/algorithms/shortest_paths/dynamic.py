@@ -0,0 +1,342 @@
+"""
+Shortest paths from a source kept up to date as the graph changes.
+"""
+from heapq import heappush, heappop
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+__all__ = ['DynamicShortestPaths']
+
+
+class DynamicShortestPaths(object):
+    """Shortest paths from a source, repaired after edge changes.
+
+    The distances and shortest path predecessors of the nodes reachable
+    from `source` are computed once by
+    :func:`~networkx.dijkstra_predecessor_and_distance`.  When edges of
+    `G` are then added, removed or given another weight, only the nodes
+    whose distance may have changed are searched again, in the manner of
+    Ramalingam and Reps [1]_:
+
+    - Nodes left without a predecessor on a shortest path, and their
+      descendants in the same situation, get new distances from a
+      Dijkstra search restricted to them.
+    - Edges that now give shorter paths start a Dijkstra search that
+      stops where distances no longer decrease.
+
+    Tell the object which edges changed with :meth:`update_edge` or
+    :meth:`update_edges`, or let :meth:`sync` read them from the journal
+    of `G` (see :func:`~networkx.enable_journal`).
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph, which is referenced, not copied.
+
+    source : node
+        The source of the paths.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to hide the edge.
+
+    Attributes
+    ----------
+    dist : dict
+        The distance from `source` of each node reachable from it.
+    pred : dict
+        The list of predecessors of each node reachable from `source` on
+        its shortest paths; empty for `source`.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    ValueError
+        If a weight is not positive.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> sp = nx.DynamicShortestPaths(G, 0)
+    >>> sp.dist[4]
+    4
+    >>> G.add_edge(0, 3)
+    >>> sp.update_edge(0, 3)
+    >>> sp.dist[4], sp.path(4)
+    (2, [0, 3, 4])
+    >>> G[0][3]['weight'] = 5
+    >>> sp.update_edge(0, 3)
+    >>> sp.path(4)
+    [0, 1, 2, 3, 4]
+
+    With a journal, changes made through the graph methods are found by
+    :meth:`sync`:
+
+    >>> journal = nx.enable_journal(G)
+    >>> G.remove_edge(1, 2)
+    >>> sp.sync()
+    >>> sp.path(4)
+    [0, 3, 4]
+
+    Notes
+    -----
+    Changes to edge attributes made outside the graph methods, e.g.
+    ``G[u][v]['weight'] = 5``, are not in the journal and must be passed
+    to :meth:`update_edge`.  The cost of a repair grows with the number
+    of nodes whose distance or predecessors change, not with the size of
+    the graph.  Weights must be positive so that the predecessors form an
+    acyclic graph.
+
+    References
+    ----------
+    .. [1] G. Ramalingam and T. Reps, "An incremental algorithm for a
+       generalization of the shortest-path problem", Journal of
+       Algorithms 21(2): 267-305, 1996.
+    """
+
+    def __init__(self, G, source, weight='weight'):
+        if source not in G:
+            raise nx.NodeNotFound("Source {} not in G".format(source))
+        self.G = G
+        self.source = source
+        self._weight = _weight_function(G, weight)
+        self.rebuild()
+
+    def rebuild(self):
+        """Recomputes all distances from scratch."""
+        G = self.G
+        self._version = nx.graph_version(G)
+        if self.source not in G:
+            self.pred, self.dist = {}, {}
+            return
+        succ = G._succ if G.is_directed() else G._adj
+        for u, nbrs in succ.items():
+            for v in nbrs:
+                self._edge_weight(u, v)
+        self.pred, self.dist = nx.dijkstra_predecessor_and_distance(
+            G, self.source, weight=self._weight)
+
+    def distance(self, target):
+        """Returns the length of a shortest path from the source to `target`.
+
+        Raises
+        ------
+        NetworkXNoPath
+            If `target` is not reachable from the source.
+        """
+        try:
+            return self.dist[target]
+        except KeyError:
+            raise nx.NetworkXNoPath("No path to {}.".format(target))
+
+    def path(self, target):
+        """Returns a shortest path from the source to `target` as a list.
+
+        Raises
+        ------
+        NetworkXNoPath
+            If `target` is not reachable from the source.
+        """
+        if target not in self.dist:
+            raise nx.NetworkXNoPath("No path to {}.".format(target))
+        pred = self.pred
+        path = [target]
+        while pred[target]:
+            target = pred[target][0]
+            path.append(target)
+        path.reverse()
+        return path
+
+    def update_edge(self, u, v):
+        """Repairs the paths after edge `(u, v)` was added, removed or
+        reweighted in the graph."""
+        self.update_edges([(u, v)])
+
+    def update_edges(self, edges):
+        """Repairs the paths after `edges` were added, removed or
+        reweighted in the graph.
+
+        Parameters
+        ----------
+        edges : iterable of pairs
+            The changed edges ``(u, v)``.  For multigraphs this stands
+            for all the edges joining `u` to `v`.  Nodes that are no
+            longer in the graph are allowed.
+        """
+        G = self.G
+        dist = self.dist
+        pred = self.pred
+        if self.source not in G:
+            dist.clear()
+            pred.clear()
+            return
+        changed = set()
+        for u, v in edges:
+            changed.add((u, v))
+            if not G.is_directed():
+                changed.add((v, u))
+        # predecessors that were lost or gained
+        orphans = []
+        for u, v in changed:
+            if v not in dist or v == self.source:
+                continue
+            w = self._edge_weight(u, v)
+            tight = w is not None and u in dist and dist[u] + w == dist[v]
+            if u in pred[v]:
+                if not tight:
+                    pred[v].remove(u)
+                    if not pred[v]:
+                        orphans.append(v)
+            elif tight:
+                pred[v].append(u)
+        affected = self._remove_orphans(orphans)
+        self._search_affected(affected)
+        succ = G._succ if G.is_directed() else G._adj
+        for u in affected:
+            if u in dist:
+                changed.update((u, v) for v in succ[u])
+        self._search_shorter(changed)
+
+    def sync(self):
+        """Repairs the paths after the changes in the journal of the graph.
+
+        The edges added, removed or updated by the graph methods since the
+        last call are read with :func:`~networkx.changes_since`.  If these
+        changes are not available, e.g. because the graph has no journal,
+        the distances are computed from scratch.
+        """
+        G = self.G
+        try:
+            changes = nx.changes_since(G, self._version)
+        except nx.NetworkXError:
+            self.rebuild()
+            return
+        self._version = nx.graph_version(G)
+        self.update_edges(change[2:4] for change in changes
+                          if change[1] in ('add_edge', 'remove_edge'))
+
+    def _edge_weight(self, u, v):
+        """Returns the weight of `(u, v)`, or None if there is no such
+        edge or it is hidden."""
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        try:
+            e = succ[u][v]
+        except KeyError:
+            return None
+        w = self._weight(u, v, e)
+        if w is not None and not w > 0:
+            raise ValueError("DynamicShortestPaths requires positive "
+                             "weights, edge ({}, {}) has weight {}."
+                             .format(u, v, w))
+        return w
+
+    def _remove_orphans(self, orphans):
+        """Returns the nodes whose shortest paths all went through a lost
+        edge, and removes them from `dist` and `pred`."""
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        pred = self.pred
+        affected = set()
+        while orphans:
+            x = orphans.pop()
+            if x in affected:
+                continue
+            affected.add(x)
+            for y in succ[x] if x in G else ():
+                py = pred.get(y)
+                if py and y not in affected and x in py:
+                    py.remove(x)
+                    if not py:
+                        orphans.append(y)
+        for x in affected:
+            del self.dist[x]
+            del pred[x]
+        return affected
+
+    def _search_affected(self, affected):
+        """Finds the new distances of `affected` with a Dijkstra search
+        from the other nodes."""
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        preds = G._pred if G.is_directed() else G._adj
+        dist = self.dist
+        pred = self.pred
+        weight = self._edge_weight
+        seen = {}
+        c = count()
+        fringe = []
+        for a in affected:
+            if a not in G:
+                continue
+            for p in preds[a]:
+                if p in dist:
+                    w = weight(p, a)
+                    if w is not None and (a not in seen or
+                                          dist[p] + w < seen[a]):
+                        seen[a] = dist[p] + w
+            if a in seen:
+                heappush(fringe, (seen[a], next(c), a))
+        while fringe:
+            d, _, a = heappop(fringe)
+            if a in dist:
+                continue
+            dist[a] = d
+            pred[a] = []
+            for p in preds[a]:
+                if p in dist and p != a:
+                    w = weight(p, a)
+                    if w is not None and dist[p] + w == d:
+                        pred[a].append(p)
+            for y in succ[a]:
+                if y in affected and y not in dist:
+                    w = weight(a, y)
+                    if w is not None and (y not in seen or d + w < seen[y]):
+                        seen[y] = d + w
+                        heappush(fringe, (d + w, next(c), y))
+
+    def _search_shorter(self, edges):
+        """Propagates the shorter paths given by `edges`."""
+        G = self.G
+        succ = G._succ if G.is_directed() else G._adj
+        dist = self.dist
+        pred = self.pred
+        weight = self._edge_weight
+        c = count()
+        fringe = []
+
+        def relax(u, v, w):
+            d = dist[u] + w
+            if v not in dist or d < dist[v]:
+                dist[v] = d
+                pred[v] = [u]
+                heappush(fringe, (d, next(c), v))
+            elif d == dist[v] and v != self.source and u not in pred[v]:
+                pred[v].append(u)
+
+        for u, v in edges:
+            if u in dist:
+                w = weight(u, v)
+                if w is not None:
+                    relax(u, v, w)
+        while fringe:
+            d, _, u = heappop(fringe)
+            if d > dist[u]:
+                continue  # superseded by a shorter path
+            for v in succ[u]:
+                w = weight(u, v)
+                if w is not None:
+                    relax(u, v, w)
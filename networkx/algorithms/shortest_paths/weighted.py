@@ -7,6 +7,8 @@ from heapq import heappush, heappop
 from itertools import count
 import networkx as nx
 from networkx.utils import generate_unique_node
+from networkx.utils.parallel import (GraphSnapshot, effective_n_jobs,
+                                     map_over_sources)
 
 
 __all__ = ['dijkstra_path',
@@ -615,6 +617,9 @@ def multi_source_dijkstra_path_length(G, sources, cutoff=None,
     """
     if not sources:
         raise ValueError('sources must not be empty')
+    indexed = _indexed_weights(G, weight)
+    if indexed is not None:
+        return _dijkstra_indexed(indexed, sources, cutoff)[0]
     weight = _weight_function(G, weight)
     return _dijkstra_multisource(G, sources, weight, cutoff=cutoff)
 
@@ -722,6 +727,10 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None,
         raise ValueError('sources must not be empty')
     if target in sources:
         return (0, [target])
+    if target is None:
+        indexed = _indexed_weights(G, weight)
+        if indexed is not None:
+            return _dijkstra_indexed(indexed, sources, cutoff, paths=True)
     weight = _weight_function(G, weight)
     paths = {source: [source] for source in sources}  # dictionary of paths
     dist = _dijkstra_multisource(G, sources, weight, paths=paths,
@@ -748,6 +757,105 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None,
                                  cutoff=cutoff, target=target)
 
 
+def _indexed_weights(G, weight, build=False):
+    """Returns ``(index, weights)`` for :func:`_dijkstra_indexed`, or None.
+
+    The array kernel is used for string weights on graphs (not views)
+    whose :func:`~networkx.node_index` is cached, or is built if `build`
+    is True, when NumPy is available.  `weights` holds the weight of each
+    edge slot of the index.
+    """
+    if not isinstance(weight, str) or hasattr(G, '_graph') or \
+            not hasattr(G, '_node_index'):
+        return None
+    if not build and getattr(G, '_csr', None) is None:
+        cached = G._node_index
+        if cached is None or cached[0] != G._version:
+            return None
+    try:
+        import numpy
+    except ImportError:
+        return None
+    index = nx.node_index(G)
+    return index, index.edge_values(weight)
+
+
+def _dijkstra_indexed(indexed, sources, cutoff=None, paths=False):
+    """Dijkstra's algorithm over the integer numbering of the nodes.
+
+    This is :func:`_dijkstra_multisource` for ``(index, weights)`` as
+    returned by :func:`_indexed_weights`: distances and predecessors are
+    kept in lists indexed by node number, edge weights are read from the
+    flat list of slot weights and the heap holds node numbers, stale
+    entries being skipped when popped (decrease-key by reinsertion as in
+    :class:`~networkx.utils.heaps.BinaryHeap`).  Nodes are settled in
+    the same order as by :func:`_dijkstra_multisource`.
+
+    Returns
+    -------
+    dist, paths : dicts
+        The distances and, if `paths` is True, the shortest paths (else
+        None) of the nodes reached, keyed by node.
+    """
+    index, weights = indexed
+    nodes = index.nodes
+    number = index.index
+    indptr, indices = index.adjacency_lists()
+    n = len(nodes)
+    dist = [None] * n
+    seen = [None] * n
+    pred = [-1] * n if paths else None
+    settled = []
+    # nodes in the order in which they are first reached, the order of
+    # the paths returned by _dijkstra_multisource
+    reached = []
+    c = count()
+    fringe = []
+    for source in sources:
+        if source not in number:
+            raise nx.NodeNotFound("Source {} not in G".format(source))
+        i = number[source]
+        if seen[i] is None:
+            reached.append(i)
+        seen[i] = 0
+        heappush(fringe, (0, next(c), i))
+    while fringe:
+        d, _, v = heappop(fringe)
+        if dist[v] is not None:
+            continue  # already searched this node.
+        dist[v] = d
+        settled.append(v)
+        start, stop = indptr[v], indptr[v + 1]
+        for u, cost in zip(indices[start:stop], weights[start:stop]):
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if cutoff is not None and vu_dist > cutoff:
+                continue
+            if dist[u] is not None:
+                if vu_dist < dist[u]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif seen[u] is None or vu_dist < seen[u]:
+                if seen[u] is None:
+                    reached.append(u)
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u))
+                if pred is not None:
+                    pred[u] = v
+    lengths = {nodes[v]: dist[v] for v in settled}
+    if pred is None:
+        return lengths, None
+    node_paths = [None] * n
+    for v in settled:
+        p = pred[v]
+        if p < 0:
+            node_paths[v] = [nodes[v]]
+        else:
+            node_paths[v] = node_paths[p] + [nodes[v]]
+    return lengths, {nodes[v]: node_paths[v] for v in reached}
+
+
 def _dijkstra_multisource(G, sources, weight, pred=None, paths=None,
                           cutoff=None, target=None):
     """Uses Dijkstra's algorithm to find shortest weighted paths
@@ -983,12 +1091,18 @@ def all_pairs_dijkstra(G, cutoff=None, weight='weight'):
 
     The yielded dicts only have keys for reachable nodes.
     """
+    indexed = _indexed_weights(G, weight, build=True)
     for n in G:
-        dist, path = single_source_dijkstra(G, n, cutoff=cutoff, weight=weight)
+        if indexed is not None:
+            dist, path = _dijkstra_indexed(indexed, [n], cutoff, paths=True)
+        else:
+            dist, path = single_source_dijkstra(G, n, cutoff=cutoff,
+                                                weight=weight)
         yield (n, (dist, path))
 
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
+def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight',
+                                   n_jobs=None):
     """Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -1011,6 +1125,11 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    n_jobs : int, optional (default=None)
+       The number of processes computing the lengths from different
+       sources in parallel.  None or 1 compute them in this process;
+       -1 uses all CPUs.  See :mod:`networkx.utils.parallel`.
+
     Returns
     -------
     distance : iterator
@@ -1039,12 +1158,68 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
     Distances are calculated as sums of weighted edges traversed.
 
     The dictionary returned only has keys for reachable node pairs.
+
+    With several jobs the weight of each edge is computed once and the
+    graph is shared with the worker processes through a memory mapped
+    snapshot.  Weight functions are then called once per edge of
+    undirected graphs and must be symmetric.  The results are yielded in
+    the order of ``list(G)`` as they arrive.
     """
+    if effective_n_jobs(n_jobs) > 1:
+        with GraphSnapshot(G, weight) as snapshot:
+            for result in map_over_sources(snapshot, _dijkstra_length_task,
+                                           G, n_jobs, (cutoff,)):
+                yield result
+        return
+    indexed = _indexed_weights(G, weight, build=True)
+    if indexed is not None:
+        for n in G:
+            yield (n, _dijkstra_indexed(indexed, [n], cutoff)[0])
+        return
     length = single_source_dijkstra_path_length
     for n in G:
         yield (n, length(G, n, cutoff=cutoff, weight=weight))
 
 
+def _csr_dijkstra(arrays, source, cutoff=None, pred=None):
+    """Dijkstra's algorithm over the CSR arrays of a graph snapshot.
+
+    Returns a dict of the distances of the nodes reached from `source`,
+    in the order in which they were settled.  If `pred` is a dict, the
+    predecessor of each node on its shortest path is stored in it.
+    See :class:`~networkx.utils.parallel.GraphSnapshot`.
+    """
+    indptr, indices, weights = arrays
+    dist = {}
+    seen = {source: 0}
+    fringe = [(0, source)]
+    while fringe:
+        d, u = heappop(fringe)
+        if u in dist:
+            continue
+        dist[u] = d
+        start, stop = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[start:stop], weights[start:stop]):
+            vu_dist = d + w
+            if cutoff is not None and vu_dist > cutoff:
+                continue
+            if v in dist:
+                if vu_dist < dist[v]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif v not in seen or vu_dist < seen[v]:
+                seen[v] = vu_dist
+                heappush(fringe, (vu_dist, v))
+                if pred is not None:
+                    pred[v] = u
+    return dist
+
+
+def _dijkstra_length_task(arrays, nodes, source, cutoff):
+    lengths = _csr_dijkstra(arrays, source, cutoff)
+    return nodes[source], {nodes[v]: d for v, d in lengths.items()}
+
+
 def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     """Compute shortest paths between all nodes in a weighted graph.
 
@@ -1090,6 +1265,11 @@ def all_pairs_dijkstra_path(G, cutoff=None, weight='weight'):
     floyd_warshall(), all_pairs_bellman_ford_path()
 
     """
+    indexed = _indexed_weights(G, weight, build=True)
+    if indexed is not None:
+        for n in G:
+            yield (n, _dijkstra_indexed(indexed, [n], cutoff, paths=True)[1])
+        return
     path = single_source_dijkstra_path
     # TODO This can be trivially parallelized.
     for n in G:
@@ -2072,7 +2252,7 @@ def bidirectional_dijkstra(G, source, target, weight='weight'):
     raise nx.NetworkXNoPath("No path between %s and %s." % (source, target))
 
 
-def johnson(G, weight='weight'):
+def johnson(G, weight='weight', n_jobs=None):
     r"""Uses Johnson's Algorithm to compute shortest paths.
 
     Johnson's Algorithm finds a shortest path between each pair of
@@ -2095,6 +2275,11 @@ def johnson(G, weight='weight'):
        dictionary of edge attributes for that edge. The function must
        return a number.
 
+    n_jobs : int, optional (default=None)
+       The number of processes running Dijkstra's algorithm from
+       different sources in parallel.  None or 1 run it in this process;
+       -1 uses all CPUs.  See :mod:`networkx.utils.parallel`.
+
     Returns
     -------
     distance : dictionary
@@ -2127,6 +2312,10 @@ def johnson(G, weight='weight'):
     graph. For dense graphs, this may be faster than the Floyd–Warshall
     algorithm.
 
+    With several jobs the Bellman–Ford step is run in this process and
+    the transformed graph is shared with the worker processes through a
+    memory mapped snapshot.
+
     See Also
     --------
     floyd_warshall_predecessor_and_distance
@@ -2154,9 +2343,24 @@ def johnson(G, weight='weight'):
     def new_weight(u, v, d):
         return weight(u, v, d) + dist_bellman[u] - dist_bellman[v]
 
+    if effective_n_jobs(n_jobs) > 1:
+        with GraphSnapshot(G, new_weight) as snapshot:
+            return dict(map_over_sources(snapshot, _johnson_task, G, n_jobs))
+
     def dist_path(v):
         paths = {v: [v]}
         _dijkstra(G, v, new_weight, paths=paths)
         return paths
 
     return {v: dist_path(v) for v in G}
+
+
+def _johnson_task(arrays, nodes, source):
+    pred = {}
+    paths = {}
+    for v in _csr_dijkstra(arrays, source, pred=pred):
+        if v == source:
+            paths[nodes[v]] = [nodes[v]]
+        else:
+            paths[nodes[v]] = paths[nodes[pred[v]]] + [nodes[v]]
+    return nodes[source], paths
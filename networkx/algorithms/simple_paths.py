@@ -1,10 +1,11 @@
 import collections
-from heapq import heappush, heappop
+from heapq import heappush, heappop, heapify
 from itertools import count
 
 import networkx as nx
 from networkx.utils import not_implemented_for
 from networkx.utils import pairwise
+from networkx.algorithms.shortest_paths.weighted import _weight_function
 
 __all__ = [
     'all_simple_paths',
@@ -293,7 +294,7 @@ def _all_simple_paths_multigraph(G, source, targets, cutoff):
 
 
 @not_implemented_for('multigraph')
-def shortest_simple_paths(G, source, target, weight=None):
+def shortest_simple_paths(G, source, target, weight=None, max_candidates=None):
     """Generate all simple paths in the graph G from source to target,
        starting from shortest ones.
 
@@ -312,9 +313,20 @@ def shortest_simple_paths(G, source, target, weight=None):
     target : node
        Ending node for path
 
-    weight : string
-        Name of the edge attribute to be used as a weight. If None all
-        edges are considered to have unit weight. Default value None.
+    weight : string or function
+        If None all edges are considered to have unit weight.  If this is
+        a string, then edge weights will be accessed via the edge
+        attribute with this key (that is, the weight of the edge joining
+        `u` to `v` will be ``G.edges[u, v][weight]``).  If no such edge
+        attribute exists, the weight of the edge is assumed to be one.
+        If this is a function, the weight of an edge is the value
+        returned by the function, as for :func:`~networkx.dijkstra_path`.
+        Default value None.
+
+    max_candidates : int, optional (default=None)
+        The largest number of candidate paths kept between two paths
+        generated.  If more are found, the longest ones are dropped and
+        will not be generated.  If None, all candidates are kept.
 
     Returns
     -------
@@ -333,6 +345,9 @@ def shortest_simple_paths(G, source, target, weight=None):
     NetworkXNotImplemented
        If the input graph is a Multi[Di]Graph.
 
+    ValueError
+       If `max_candidates` is less than one.
+
     Examples
     --------
 
@@ -352,11 +367,33 @@ def shortest_simple_paths(G, source, target, weight=None):
     [0, 1, 2, 3]
     [0, 6, 5, 4, 3]
 
+    Only the candidates that can still be among the first `k` paths need
+    to be kept, which bounds the memory used:
+
+    >>> G = nx.grid_2d_graph(4, 4)
+    >>> paths = nx.shortest_simple_paths(G, (0, 0), (3, 3), max_candidates=5)
+    >>> [len(path) for path in islice(paths, 6)]
+    [7, 7, 7, 7, 7, 7]
+
     Notes
     -----
     This procedure is based on algorithm by Jin Y. Yen [1]_.  Finding
     the first $K$ paths requires $O(KN^3)$ operations.
 
+    The distances to `target` and the tree of shortest paths leading to
+    it are computed once.  A candidate path branching from a previous
+    path at a spur node is searched with A*, using these distances as
+    the heuristic, and ends as soon as it reaches a node whose tree path
+    to `target` avoids the nodes and edges excluded at this spur node,
+    as in the node classification algorithm of Feng [2]_.  Most spur
+    searches only look at a few nodes.
+
+    A candidate dropped because of `max_candidates` is longer than
+    `max_candidates` others kept at that time, which are generated first,
+    so the first ``max_candidates + 1`` paths generated are always the
+    shortest ones.  Later paths are generated in order of length, but
+    some may be missing.
+
     See Also
     --------
     all_shortest_paths
@@ -368,6 +405,9 @@ def shortest_simple_paths(G, source, target, weight=None):
     .. [1] Jin Y. Yen, "Finding the K Shortest Loopless Paths in a
        Network", Management Science, Vol. 17, No. 11, Theory Series
        (Jul., 1971), pp. 712-716.
+    .. [2] Gang Feng, "Finding k shortest simple paths in directed graphs:
+       A node classification algorithm", Networks, Vol. 64, No. 1 (2014),
+       pp. 6-17.
 
     """
     if source not in G:
@@ -376,56 +416,162 @@ def shortest_simple_paths(G, source, target, weight=None):
     if target not in G:
         raise nx.NodeNotFound('target node %s not in graph' % target)
 
+    if max_candidates is not None and max_candidates < 1:
+        raise ValueError('max_candidates must be at least 1.')
+
     if weight is None:
-        length_func = len
-        shortest_path_func = _bidirectional_shortest_path
+        def weight(u, v, d):
+            return 1
     else:
-        def length_func(path):
-            return sum(G.adj[u][v][weight] for (u, v) in zip(path, path[1:]))
-        shortest_path_func = _bidirectional_dijkstra
-
-    listA = list()
-    listB = PathBuffer()
-    prev_path = None
-    while True:
-        if not prev_path:
-            length, path = shortest_path_func(G, source, target, weight=weight)
-            listB.push(length, path)
-        else:
-            ignore_nodes = set()
-            ignore_edges = set()
-            for i in range(1, len(prev_path)):
-                root = prev_path[:i]
-                root_length = length_func(root)
-                for path in listA:
-                    if path[:i] == root:
-                        ignore_edges.add((path[i - 1], path[i]))
-                try:
-                    length, spur = shortest_path_func(G, root[-1], target,
-                                                      ignore_nodes=ignore_nodes,
-                                                      ignore_edges=ignore_edges,
-                                                      weight=weight)
-                    path = root[:-1] + spur
-                    listB.push(root_length + length, path)
-                except nx.NetworkXNoPath:
-                    pass
-                ignore_nodes.add(root[-1])
-
-        if listB:
-            path = listB.pop()
-            yield path
-            listA.append(path)
-            prev_path = path
+        weight = _weight_function(G, weight)
+    G_succ = G._succ if G.is_directed() else G._adj
+
+    # distances to target and the next node on a shortest path to it
+    dist, succ = _reverse_shortest_path_tree(G, target, weight)
+    if source not in dist:
+        raise nx.NetworkXNoPath("No path between %s and %s." % (source, target))
+
+    # the paths generated, as a tree of prefixes: the keys of
+    # prefixes[p0][p1]...[pi] are the nodes following p0, ..., pi
+    prefixes = {}
+    listB = PathBuffer(max_candidates)
+    listB.push(dist[source], _tree_path(succ, source, target))
+    while listB:
+        prev_path = listB.pop()
+        yield prev_path
+        node = prefixes
+        for v in prev_path:
+            node = node.setdefault(v, {})
+        ignore_nodes = set()
+        root_length = 0
+        node = prefixes
+        for i in range(1, len(prev_path)):
+            spur_node = prev_path[i - 1]
+            node = node[spur_node]
+            result = _spur_path(G_succ, weight, dist, succ, spur_node, target,
+                                ignore_nodes, node)
+            if result is not None:
+                length, spur = result
+                listB.push(root_length + length, prev_path[:i - 1] + spur)
+            ignore_nodes.add(spur_node)
+            v = prev_path[i]
+            root_length += weight(spur_node, v, G_succ[spur_node][v])
+
+
+def _reverse_shortest_path_tree(G, target, weight):
+    """Returns the distances to `target` and the next node on a shortest
+    path to it, for each node that can reach `target`."""
+    G_pred = G._pred if G.is_directed() else G._adj
+    dist = {}
+    succ = {}
+    seen = {target: 0}
+    c = count()
+    fringe = [(0, next(c), target)]
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        for u, e in G_pred[v].items():
+            cost = weight(u, v, e)
+            if cost is None:
+                continue
+            if cost < 0:
+                raise ValueError('Contradictory paths found:',
+                                 'negative weights?')
+            uv_dist = d + cost
+            if u not in seen or uv_dist < seen[u]:
+                seen[u] = uv_dist
+                succ[u] = v
+                heappush(fringe, (uv_dist, next(c), u))
+    return dist, succ
+
+
+def _tree_path(succ, v, target):
+    path = [v]
+    while v != target:
+        v = succ[v]
+        path.append(v)
+    return path
+
+
+def _spur_path(G_succ, weight, dist, succ, spur_node, target, ignore_nodes,
+               ignore_succ):
+    """Returns the length and a shortest path from `spur_node` to `target`
+    that avoids `ignore_nodes` and the edges from `spur_node` to
+    `ignore_succ`, or None if there is no such path.
+
+    This is an A* search with the distances to `target` in the whole
+    graph as heuristic.  Nodes whose tree path to `target` avoids the
+    excluded nodes and edges are marked True in `free`; the first one
+    searched gives a shortest path.
+    """
+    free = {target: True}
+
+    def is_free(v):
+        chain = []
+        while v not in free:
+            chain.append(v)
+            if v in ignore_nodes or (v == spur_node and
+                                     succ[v] in ignore_succ):
+                result = False
+                break
+            v = succ[v]
         else:
-            break
+            result = free[v]
+        for u in chain:
+            free[u] = result
+        return result
+
+    pred = {spur_node: None}
+    seen = {spur_node: 0}
+    searched = set()
+    c = count()
+    fringe = [(dist[spur_node], next(c), spur_node)]
+    while fringe:
+        f, _, v = heappop(fringe)
+        if v in searched:
+            continue
+        if is_free(v):
+            path = []
+            u = v
+            while u is not None:
+                path.append(u)
+                u = pred[u]
+            path.reverse()
+            path.extend(_tree_path(succ, v, target)[1:])
+            return f, path
+        searched.add(v)
+        d = seen[v]
+        for u, e in G_succ[v].items():
+            if u in ignore_nodes or u not in dist or u in searched or \
+                    (v == spur_node and u in ignore_succ):
+                continue
+            cost = weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = d + cost
+            if u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                pred[u] = v
+                heappush(fringe, (vu_dist + dist[u], next(c), u))
+    return None
 
 
 class PathBuffer(object):
+    """Candidate paths, popped in order of increasing cost.
+
+    If there are more than `max_size` paths, the one of highest cost,
+    or the last one pushed among those of equal cost, is dropped.  The
+    number of paths dropped is kept in `evicted`.
+    """
 
-    def __init__(self):
+    def __init__(self, max_size=None):
         self.paths = set()
         self.sortedpaths = list()
         self.counter = count()
+        self.max_size = max_size
+        self.evicted = 0
 
     def __len__(self):
         return len(self.sortedpaths)
@@ -435,6 +581,19 @@ class PathBuffer(object):
         if hashable_path not in self.paths:
             heappush(self.sortedpaths, (cost, next(self.counter), path))
             self.paths.add(hashable_path)
+            if self.max_size is not None and \
+                    len(self.sortedpaths) > self.max_size:
+                # the largest item is a leaf of the heap
+                worst = max(range(len(self.sortedpaths) // 2,
+                                  len(self.sortedpaths)),
+                            key=lambda i: self.sortedpaths[i][:2])
+                item = self.sortedpaths[worst]
+                last = self.sortedpaths.pop()
+                if worst < len(self.sortedpaths):
+                    self.sortedpaths[worst] = last
+                    heapify(self.sortedpaths)
+                self.paths.remove(tuple(item[2]))
+                self.evicted += 1
 
     def pop(self):
         (cost, num, path) = heappop(self.sortedpaths)
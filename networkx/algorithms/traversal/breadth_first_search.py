@@ -149,7 +149,8 @@ def bfs_edges(G, source, reverse=False, depth_limit=None):
     yield from generic_bfs_edges(G, source, successors, depth_limit)
 
 
-def bfs_tree(G, source, reverse=False, depth_limit=None):
+def bfs_tree(G, source, reverse=False, depth_limit=None,
+             direction_optimizing=False):
     """Returns an oriented tree constructed from of a breadth-first-search
     starting at source.
 
@@ -166,6 +167,13 @@ def bfs_tree(G, source, reverse=False, depth_limit=None):
     depth_limit : int, optional(default=len(G))
         Specify the maximum search depth
 
+    direction_optimizing : bool, optional (default=False)
+        If True, levels of the search that reach most of the graph look
+        for a parent of each unvisited node instead of expanding the
+        frontier, see :func:`single_source_shortest_path_length`.  The
+        depth of each node in the tree is the same, but nodes reached
+        this way may get another parent.
+
     Returns
     -------
     T: NetworkX DiGraph
@@ -200,6 +208,13 @@ def bfs_tree(G, source, reverse=False, depth_limit=None):
     """
     T = nx.DiGraph()
     T.add_node(source)
+    if direction_optimizing:
+        levels = _direction_optimizing_bfs(G, source, depth_limit, reverse,
+                                           parents=True)
+        next(levels)
+        T.add_edges_from((parent, child) for level in levels
+                         for child, parent in level.items())
+        return T
     edges_gen = bfs_edges(G, source, reverse=reverse, depth_limit=depth_limit)
     T.add_edges_from(edges_gen)
     return T
@@ -321,7 +336,7 @@ def bfs_successors(G, source, depth_limit=None):
     yield (parent, children)
 
 
-def descendants_at_distance(G, source, distance):
+def descendants_at_distance(G, source, distance, direction_optimizing=False):
     """Returns all nodes at a fixed `distance` from `source` in `G`.
 
     Parameters
@@ -330,6 +345,10 @@ def descendants_at_distance(G, source, distance):
         A directed graph
     source : node in `G`
     distance : the distance of the wanted nodes from `source`
+    direction_optimizing : bool, optional (default=False)
+        If True, levels of the search that reach most of the graph look
+        for a parent of each unvisited node instead of expanding the
+        frontier, see :func:`single_source_shortest_path_length`.
 
     Returns
     -------
@@ -338,6 +357,12 @@ def descendants_at_distance(G, source, distance):
     """
     if not G.has_node(source):
         raise nx.NetworkXError("The node %s is not in the graph." % source)
+    if direction_optimizing:
+        levels = _direction_optimizing_bfs(G, source, distance)
+        for depth, level in enumerate(levels):
+            if depth == distance:
+                return set(level)
+        return set()
     current_distance = 0
     queue = {source}
     visited = {source}
@@ -360,3 +385,69 @@ def descendants_at_distance(G, source, distance):
         queue = next_vertices
 
     return set()
+
+
+def _direction_optimizing_bfs(G, source, depth_limit=None, reverse=False,
+                              parents=False, alpha=14, beta=24):
+    """Yields the levels of a direction-optimizing breadth-first search.
+
+    Each level is the set of nodes first reached at that depth, starting
+    with ``{source}``, or, if `parents` is True, a dict mapping them to
+    their parent in the search tree.  A top-down step scans the edges out
+    of the frontier.  A bottom-up step scans the edges into each
+    unvisited node until one comes from the frontier, which is cheaper
+    when the frontier is large.  Following [1]_, the search goes
+    bottom-up once the edges out of the frontier outnumber the edges into
+    unvisited nodes divided by `alpha`, and top-down again once the
+    frontier has fewer than ``len(G) / beta`` nodes.
+
+    References
+    ----------
+    .. [1] Beamer, Scott, Krste Asanović, and David Patterson.
+       "Direction-optimizing breadth-first search."
+       Scientific Programming 21.3-4 (2013): 137-148.
+    """
+    if G.is_directed():
+        succ, pred = (G._pred, G._succ) if reverse else (G._succ, G._pred)
+    else:
+        succ = pred = G._adj
+    n = len(G)
+    unvisited = set(G)
+    unvisited.remove(source)
+    # edges into unvisited nodes
+    unvisited_edges = sum(map(len, pred.values())) - len(pred[source])
+    frontier = {source: None} if parents else {source}
+    bottom_up = False
+    depth = 0
+    while True:
+        yield frontier
+        if not unvisited or (depth_limit is not None and depth >= depth_limit):
+            return
+        depth += 1
+        if bottom_up:
+            bottom_up = len(frontier) * beta >= n
+        else:
+            frontier_edges = sum(map(len, map(succ.__getitem__, frontier)))
+            bottom_up = frontier_edges * alpha > unvisited_edges
+        if bottom_up:
+            keys = frontier.keys() if parents else frontier
+            found = {u for u in unvisited if not keys.isdisjoint(pred[u])}
+            if parents:
+                found = {u: next(v for v in pred[u] if v in frontier)
+                         for u in found}
+        elif parents:
+            found = {}
+            for v in frontier:
+                for u in unvisited.intersection(succ[v]):
+                    found[u] = v
+                    unvisited.remove(u)
+        else:
+            found = set()
+            for v in frontier:
+                found.update(succ[v])
+            found &= unvisited
+        if not found:
+            return
+        unvisited.difference_update(found)
+        unvisited_edges -= sum(map(len, map(pred.__getitem__, found)))
+        frontier = found
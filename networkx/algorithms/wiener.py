@@ -5,6 +5,7 @@ from itertools import chain
 from .components import is_connected
 from .components import is_strongly_connected
 from .shortest_paths import shortest_path_length as spl
+from .shortest_paths import shortest_path_length_rows
 
 __all__ = ['wiener_index']
 
@@ -49,6 +50,9 @@ def wiener_index(G, weight=None):
     this function uses the natural generalization of the Wiener index to
     directed graphs.
 
+    Without `weight` and if NumPy is available, the distances are summed
+    in batches computed by :func:`networkx.shortest_path_length_rows`.
+
     Examples
     --------
     The Wiener index of the (unweighted) complete graph on *n* nodes
@@ -72,6 +76,15 @@ def wiener_index(G, weight=None):
     if (is_directed and not is_strongly_connected(G)) or \
             (not is_directed and not is_connected(G)):
         return float('inf')
-    total = sum(chaini(p.values() for v, p in spl(G, weight=weight)))
+    total = None
+    if weight is None:
+        try:
+            rows = shortest_path_length_rows(G)
+        except ImportError:
+            pass
+        else:
+            total = sum(int(lengths.sum()) for batch, lengths in rows)
+    if total is None:
+        total = sum(chaini(p.values() for v, p in spl(G, weight=weight)))
     # Need to account for double counting pairs of nodes in undirected graphs.
     return total if is_directed else total / 2
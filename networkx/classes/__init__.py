@@ -3,8 +3,12 @@ from .digraph import DiGraph
 from .multigraph import MultiGraph
 from .multidigraph import MultiDiGraph
 from .ordered import *
+from .columnar import *
 
 from .function import *
+from .csrgraph import *
+from .journal import *
+from .nodeindex import *
 
 import networkx.classes.filters
 
@@ -0,0 +1,105 @@
+"""
+Variants of the base graph classes with column-oriented edge attributes.
+
+The base graph classes create one attribute dict per edge, even when all
+edges hold a single float `weight`.  The Columnar (Di/Multi/MultiDi)
+Graphs store edge attributes in an :class:`~networkx.classes.columns.AttributeColumns`
+table instead: every attribute name maps to a typed array indexed by an
+edge number, and each edge holds only a small dict-like facade
+(:class:`~networkx.classes.columns.AttributeRow`) pointing at its row.
+
+The graphs behave exactly like the base classes, including
+``G[u][v]['weight'] = 3`` and ``G.edges[u, v].update(...)``.  Edge numbers
+freed by removed edges are reused.  The table is available as
+``G.edge_columns`` so that array-based code can fetch a whole attribute at
+once with :meth:`~networkx.classes.columns.AttributeColumns.gather`.
+
+Examples
+--------
+>>> G = nx.ColumnarGraph()
+>>> G.add_weighted_edges_from([(0, 1, 0.5), (1, 2, 2.0), (2, 0, 1.5)])
+>>> G[0][1]
+{'weight': 0.5}
+>>> G.edge_columns.typecode('weight')
+'d'
+>>> rows = [G[u][v].row for u, v in G.edges]
+>>> G.edge_columns.gather('weight', rows)
+array([0.5, 1.5, 2. ])
+"""
+from .graph import Graph
+from .multigraph import MultiGraph
+from .digraph import DiGraph
+from .multidigraph import MultiDiGraph
+from .columns import AttributeColumns, AttributeRow
+
+__all__ = []
+
+__all__.extend([
+    'ColumnarGraph',
+    'ColumnarDiGraph',
+    'ColumnarMultiGraph',
+    'ColumnarMultiDiGraph',
+])
+
+
+class EdgeAttributeRow(AttributeRow):
+    """Edge data facade owning one row of an `AttributeColumns` table.
+
+    A row is taken from the table when the facade is created and is given
+    back when the facade is garbage collected, i.e. when the edge has been
+    removed from the graph and nobody else holds its data dict.
+    """
+    __slots__ = ()
+
+    def __init__(self, columns):
+        AttributeRow.__init__(self, columns, columns.new_row())
+
+    def __del__(self):
+        try:
+            self._columns.release_row(self._row)
+        except Exception:  # during interpreter shutdown
+            pass
+
+
+class ColumnarGraph(Graph):
+    """Variant of :class:`~networkx.Graph` with columnar edge attributes."""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.edge_columns = AttributeColumns()
+        Graph.__init__(self, incoming_graph_data, **attr)
+
+    def edge_attr_dict_factory(self):
+        return EdgeAttributeRow(self.edge_columns)
+
+
+class ColumnarDiGraph(DiGraph):
+    """Variant of :class:`~networkx.DiGraph` with columnar edge attributes."""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.edge_columns = AttributeColumns()
+        DiGraph.__init__(self, incoming_graph_data, **attr)
+
+    def edge_attr_dict_factory(self):
+        return EdgeAttributeRow(self.edge_columns)
+
+
+class ColumnarMultiGraph(MultiGraph):
+    """Variant of :class:`~networkx.MultiGraph` with columnar edge attributes."""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.edge_columns = AttributeColumns()
+        MultiGraph.__init__(self, incoming_graph_data, **attr)
+
+    def edge_attr_dict_factory(self):
+        return EdgeAttributeRow(self.edge_columns)
+
+
+class ColumnarMultiDiGraph(MultiDiGraph):
+    """Variant of :class:`~networkx.MultiDiGraph` with columnar edge attributes."""
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        self.edge_columns = AttributeColumns()
+        MultiDiGraph.__init__(self, incoming_graph_data, **attr)
+
+    def edge_attr_dict_factory(self):
+        return EdgeAttributeRow(self.edge_columns)
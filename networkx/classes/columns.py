@@ -0,0 +1,494 @@
+"""Column-oriented storage for node and edge attributes.
+
+The base graph classes keep one attribute dict per node and per edge.
+For large graphs most of those dicts hold the same few keys (often just
+a single float ``weight``), so the per-dict overhead dominates memory use.
+
+`AttributeColumns` instead stores one column per attribute name.  Each
+column is indexed by an integer row id (a node or edge number) and holds
+its values in a typed :mod:`array` when all values are Python ints or all
+are Python floats, falling back to a plain list otherwise.  A byte mask
+per column records which rows actually have the attribute, so rows
+without an attribute are distinguished from rows holding e.g. ``0.0``.
+
+`AttributeRow` is a dict-like facade over a single row.  It is what the
+graph views hand out as "data dicts" for column-backed graphs, so that
+idioms such as ``G.edges[u, v]['weight']`` and
+``G.nodes[n].get('color', 'red')`` keep working.
+
+Examples
+--------
+>>> from networkx.classes.columns import AttributeColumns
+>>> cols = AttributeColumns()
+>>> cols.set(0, 'weight', 2.5)
+>>> cols.set(3, 'weight', 1.0)
+>>> cols.set(3, 'color', 'red')
+>>> cols.get(0, 'weight')
+2.5
+>>> dict(cols.row(3))
+{'weight': 1.0, 'color': 'red'}
+>>> cols.typecode('weight')
+'d'
+"""
+from array import array
+from collections.abc import MutableMapping
+from copy import copy, deepcopy
+
+__all__ = ['AttributeColumns', 'AttributeRow']
+
+# Smallest and largest values that fit a signed 64 bit ('q') column
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 63 - 1
+
+_MISSING = object()
+
+
+def _typecode_for(value):
+    """Returns the array typecode able to hold `value` or None."""
+    value_type = type(value)
+    if value_type is float:
+        return 'd'
+    if value_type is int and _INT_MIN <= value <= _INT_MAX:
+        return 'q'
+    return None
+
+
+class _Column(object):
+    """A single attribute column.
+
+    `values` is a typed array (typecode 'd' or 'q'), a list, or any other
+    indexable buffer (e.g. a NumPy array or a memory mapped memoryview)
+    installed in bulk.  `present` is a bytearray (or a read-only byte
+    buffer installed in bulk) with a nonzero entry for each row holding a
+    value, or None if every row of `values` holds a value.  Bulk-installed
+    buffers are copied into a typed array or a list before they are
+    modified.
+    """
+    __slots__ = ('values', 'present', 'typecode')
+
+    def __init__(self, values, present=None, typecode=None):
+        self.values = values
+        self.present = present
+        self.typecode = typecode
+
+    def __getstate__(self):
+        values = self.values
+        present = self.present
+        if not isinstance(values, (array, list)) and \
+                not hasattr(values, '__array__'):
+            values = self._own_values()
+        if present is not None and not isinstance(present, bytearray):
+            present = bytearray(present)
+        return {'values': values, 'present': present,
+                'typecode': self.typecode}
+
+    def __setstate__(self, state):
+        self.values = state['values']
+        self.present = state['present']
+        self.typecode = state['typecode']
+
+    def _own_values(self):
+        """Returns a typed array or list copy of bulk-installed values."""
+        if self.typecode is not None:
+            values = array(self.typecode)
+            values.frombytes(memoryview(self.values).cast('B'))
+            return values
+        return list(self.values)
+
+    def _own(self):
+        # bulk-installed buffers may be read-only or memory mapped
+        if not isinstance(self.values, (array, list)):
+            self.values = self._own_values()
+        if self.present is not None and not isinstance(self.present,
+                                                       bytearray):
+            self.present = bytearray(self.present)
+
+    def __len__(self):
+        return len(self.values)
+
+    def has(self, row):
+        if row >= len(self.values):
+            return False
+        present = self.present
+        return present is None or present[row] != 0
+
+    def get(self, row, default=None):
+        if row >= len(self.values):
+            return default
+        present = self.present
+        if present is None or present[row]:
+            return self.values[row]
+        return default
+
+    def _to_list(self):
+        # Any mismatch between value and column type ends up here: the
+        # column keeps exact Python values from now on.
+        self.values = list(self.values)
+        self.typecode = None
+
+    def _grow(self, size):
+        self._own()
+        values = self.values
+        extra = size - len(values)
+        if self.present is None:
+            self.present = bytearray(b'\x01') * len(values)
+        if isinstance(values, array):
+            values.frombytes(bytes(extra * values.itemsize))
+        else:
+            values.extend([None] * extra)
+        self.present.extend(bytes(extra))
+
+    def set(self, row, value):
+        self._own()
+        if self.typecode is not None and _typecode_for(value) != self.typecode:
+            self._to_list()
+        values = self.values
+        size = len(values)
+        if row == size and self.present is not None:
+            # appending is by far the most common case
+            values.append(value)
+            self.present.append(1)
+            return
+        if row >= size:
+            self._grow(row + 1)
+        values[row] = value
+        if self.present is not None:
+            self.present[row] = 1
+
+    def delete(self, row):
+        if not self.has(row):
+            raise KeyError(row)
+        self._own()
+        if self.present is None:
+            self.present = bytearray(b'\x01') * len(self.values)
+        self.present[row] = 0
+        if self.typecode is None:
+            # drop the reference so that the value can be collected
+            self.values[row] = None
+
+
+class AttributeColumns(object):
+    """Column-oriented table of attributes for integer numbered rows.
+
+    Rows are numbered ``0, 1, 2, ...`` and do not need to be declared:
+    setting an attribute on row `i` grows the column as needed.  A column
+    whose values are all Python floats (or all Python ints that fit in 64
+    bits) is stored in a typed :class:`array.array`; as soon as a value of
+    another type is stored the column switches to a plain list so that
+    values are always returned exactly as they were stored.
+
+    See Also
+    --------
+    AttributeRow
+    """
+    __slots__ = ('_columns', '_next_row', '_free_rows')
+
+    def __init__(self):
+        self._columns = {}
+        self._next_row = 0
+        self._free_rows = []
+
+    def __getstate__(self):
+        return {'_columns': self._columns, '_next_row': self._next_row,
+                '_free_rows': self._free_rows}
+
+    def __setstate__(self, state):
+        self._columns = state['_columns']
+        self._next_row = state.get('_next_row', 0)
+        self._free_rows = state.get('_free_rows', [])
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def copy(self):
+        """Returns an independent copy of the table."""
+        H = AttributeColumns()
+        for name, col in self._columns.items():
+            values = col.values
+            present = col.present
+            # buffers installed in bulk are copied on write and can be shared
+            if isinstance(values, (array, list)):
+                values = copy(values)
+            if isinstance(present, bytearray):
+                present = bytearray(present)
+            H._columns[name] = _Column(values, present, col.typecode)
+        H._next_row = self._next_row
+        H._free_rows = list(self._free_rows)
+        return H
+
+    def names(self):
+        """Returns a list of the attribute names with a column."""
+        return list(self._columns)
+
+    def typecode(self, name):
+        """Returns the array typecode of column `name`, or None.
+
+        None means that the column is stored as a list of Python objects.
+        """
+        return self._columns[name].typecode
+
+    def column(self, name):
+        """Returns the raw `(values, present)` pair of column `name`.
+
+        `values` is indexable by row id.  `present` is a bytearray with
+        nonzero entries for the rows having the attribute, or None if all
+        rows up to ``len(values)`` have it.  Both are live: they must be
+        treated as read-only.
+        """
+        col = self._columns[name]
+        return col.values, col.present
+
+    def set_column(self, name, values, present=None):
+        """Installs a whole column at once.
+
+        Parameters
+        ----------
+        name : hashable
+            The attribute name.
+        values : indexable sequence
+            Values for rows ``0 .. len(values) - 1``.  Typed arrays,
+            memoryviews and NumPy arrays are stored as given without
+            copying.
+        present : bytes-like or None (default)
+            Nonzero entries mark rows that have the attribute.
+            If None, all rows have it.  A memoryview is stored without
+            copying.
+        """
+        if isinstance(values, array):
+            typecode = values.typecode if values.typecode in 'dq' else None
+        elif isinstance(values, memoryview):
+            typecode = values.format if values.format in ('d', 'q') else None
+        else:
+            typecode = None
+        if present is not None and not isinstance(present, memoryview):
+            present = bytearray(present)
+        self._columns[name] = _Column(values, present, typecode)
+
+    def new_row(self):
+        """Returns an unused row id, reusing released rows first.
+
+        Rows handed out by `new_row` are never handed out again until
+        they are given back with `release_row`.
+        """
+        if self._free_rows:
+            return self._free_rows.pop()
+        row = self._next_row
+        self._next_row = row + 1
+        return row
+
+    def release_row(self, row):
+        """Clears `row` and makes it available to `new_row` again."""
+        self.clear_row(row)
+        self._free_rows.append(row)
+
+    def gather(self, name, rows, default=1, dtype=float):
+        """Returns a NumPy array with attribute `name` of each row in `rows`.
+
+        This is a bulk lookup: typed columns are read through a zero-copy
+        NumPy view of their buffer and indexed with `rows` in one step.
+
+        Parameters
+        ----------
+        name : hashable
+            The attribute name.
+        rows : sequence of int
+            The row ids to look up.
+        default : scalar (default 1)
+            Value used for rows without the attribute.
+        dtype : NumPy data-type (default float)
+            The data type of the returned array.
+
+        Returns
+        -------
+        values : NumPy ndarray
+            ``values[k]`` is attribute `name` of row ``rows[k]``.
+
+        Examples
+        --------
+        >>> cols = AttributeColumns()
+        >>> cols.set(0, 'weight', 0.5)
+        >>> cols.set(2, 'weight', 4.0)
+        >>> cols.gather('weight', [2, 1, 0, 7])
+        array([4. , 1. , 0.5, 1. ])
+        """
+        import numpy as np
+        rows = np.asarray(rows, dtype=np.intp)
+        result = np.full(len(rows), default, dtype=dtype)
+        try:
+            col = self._columns[name]
+        except KeyError:
+            return result
+        size = len(col.values)
+        if size == 0 or len(rows) == 0:
+            return result
+        if isinstance(col.values, (array, memoryview)):
+            values = np.asarray(col.values)
+        elif isinstance(col.values, list):
+            values = np.array([default if v is None else v
+                               for v in col.values], dtype=dtype)
+        else:
+            values = np.asarray(col.values)
+        valid = rows < size
+        if col.present is not None:
+            present = np.frombuffer(col.present, dtype=np.uint8)
+            valid[valid] = present[rows[valid]] != 0
+        result[valid] = values[rows[valid]]
+        return result
+
+    def get(self, row, name, default=None):
+        """Returns attribute `name` of `row`, or `default` if not set."""
+        try:
+            col = self._columns[name]
+        except KeyError:
+            return default
+        return col.get(row, default)
+
+    def set(self, row, name, value):
+        """Sets attribute `name` of `row` to `value`."""
+        try:
+            col = self._columns[name]
+        except KeyError:
+            typecode = _typecode_for(value)
+            values = array(typecode) if typecode is not None else []
+            col = self._columns[name] = _Column(values, bytearray(), typecode)
+        col.set(row, value)
+
+    def delete(self, row, name):
+        """Removes attribute `name` from `row`.
+
+        Raises KeyError if the row does not have the attribute.
+        """
+        try:
+            self._columns[name].delete(row)
+        except KeyError:
+            raise KeyError(name)
+
+    def clear_row(self, row):
+        """Removes all attributes of `row`."""
+        for col in self._columns.values():
+            if col.has(row):
+                col.delete(row)
+
+    def has(self, row, name):
+        """Returns True if `row` has attribute `name`."""
+        try:
+            return self._columns[name].has(row)
+        except KeyError:
+            return False
+
+    def keys(self, row):
+        """Returns a list of the attribute names set on `row`."""
+        return [name for name, col in self._columns.items() if col.has(row)]
+
+    def row(self, row):
+        """Returns a dict-like `AttributeRow` view of `row`."""
+        return AttributeRow(self, row)
+
+
+class AttributeRow(MutableMapping):
+    """Dict-like view of the attributes of one row of `AttributeColumns`.
+
+    Reading and writing go straight to the columns, so the view behaves
+    like the per-node and per-edge data dicts of the base graph classes.
+    `copy` returns a plain dict.
+
+    Parameters
+    ----------
+    columns : AttributeColumns
+        The table holding the data.
+    row : int
+        The row id (node or edge number) to view.
+    """
+    __slots__ = ('_columns', '_row')
+
+    def __getstate__(self):
+        return {'_columns': self._columns, '_row': self._row}
+
+    def __setstate__(self, state):
+        self._columns = state['_columns']
+        self._row = state['_row']
+
+    def __init__(self, columns, row):
+        self._columns = columns
+        self._row = row
+
+    @property
+    def row(self):
+        """The row number viewed in the attribute table."""
+        return self._row
+
+    def __getitem__(self, key):
+        try:
+            col = self._columns._columns[key]
+        except TypeError:
+            raise KeyError(key)
+        value = col.get(self._row, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            col = self._columns._columns[key]
+        except (KeyError, TypeError):
+            return default
+        return col.get(self._row, default)
+
+    def __contains__(self, key):
+        return self._columns.has(self._row, key)
+
+    def __setitem__(self, key, value):
+        self._columns.set(self._row, key, value)
+
+    def __delitem__(self, key):
+        self._columns.delete(self._row, key)
+
+    def __iter__(self):
+        row = self._row
+        return (name for name, col in self._columns._columns.items()
+                if col.has(row))
+
+    def __len__(self):
+        row = self._row
+        return sum(1 for col in self._columns._columns.values()
+                   if col.has(row))
+
+    def update(self, *args, **kwds):
+        # same semantics as MutableMapping.update, without the generic checks
+        columns = self._columns
+        row = self._row
+        if args:
+            other, = args
+            if hasattr(other, 'keys'):
+                for key in other.keys():
+                    columns.set(row, key, other[key])
+            else:
+                for key, value in other:
+                    columns.set(row, key, value)
+        for key, value in kwds.items():
+            columns.set(row, key, value)
+
+    def clear(self):
+        self._columns.clear_row(self._row)
+
+    def copy(self):
+        return {name: self[name] for name in self}
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # never deepcopy the whole table for a single row
+        return {name: deepcopy(value, memo) for name, value in self.items()}
+
+    def __str__(self):
+        return str(self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
@@ -0,0 +1,953 @@
+"""
+Compact, immutable variants of the base graph classes.
+
+The base graph classes store a graph as a dict-of-dict-of-dict so that
+nodes and edges can be added and removed cheaply.  Once a graph is built,
+that flexibility costs a lot of memory: every node and every edge owns a
+dict.  The CSR (compressed sparse row) classes store a finished graph in
+flat arrays instead:
+
+- nodes are numbered ``0 .. n-1`` in the order of the input graph,
+- the neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+  sorted by node number,
+- node and edge attributes are kept column-wise in typed arrays
+  (see :mod:`networkx.classes.columns`), indexed by node and edge number
+  and available as ``G.node_columns`` and ``G.edge_columns``.
+
+The classes are subclasses of the base classes and expose the same views
+(`G.adj`, `G[u]`, `G.nodes`, `G.edges`, `G.degree`, ...), so algorithms
+work on them unchanged.  The structure is frozen: adding or removing nodes
+or edges raises a :exc:`~networkx.NetworkXError` just like for graphs
+frozen with :func:`~networkx.freeze`.  Node and edge attribute values can
+still be changed through the data views.
+
+Examples
+--------
+>>> G = nx.CSRGraph(nx.path_graph(4))
+>>> list(G.edges)
+[(0, 1), (1, 2), (2, 3)]
+>>> G[1]
+AtlasView({0: {}, 2: {}})
+>>> nx.shortest_path(G, 0, 3)
+[0, 1, 2, 3]
+>>> G.add_edge(0, 3)
+Traceback (most recent call last):
+...
+networkx.exception.NetworkXError: Frozen graph can't be modified
+
+Any data accepted by the base classes can be used, and building from a
+graph of a different type converts it first:
+
+>>> D = nx.CSRDiGraph([(0, 1, {'weight': 3}), (1, 2, {'weight': 4})])
+>>> D.succ[0][1]['weight']
+3
+>>> sorted(D.pred[2])
+[1]
+
+Notes
+-----
+The order of neighbors follows node numbering, which in general is not
+the order in which the edges were added to the input graph.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, ItemsView
+
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.multidigraph import MultiDiGraph
+from networkx.classes.columns import AttributeColumns, AttributeRow
+from networkx.classes.function import frozen as _frozen
+
+__all__ = ['CSRGraph', 'CSRDiGraph', 'CSRMultiGraph', 'CSRMultiDiGraph']
+
+
+def _index_typecode(size):
+    """Returns the smallest signed array typecode able to index `size`."""
+    if size < 2 ** 31 and array('i').itemsize == 4:
+        return 'i'
+    return 'q'
+
+
+def _zeros(typecode, size):
+    a = array(typecode)
+    a.frombytes(bytes(size * a.itemsize))
+    return a
+
+
+def _from_numpy(values, typecode):
+    """Returns a copy of the NumPy array `values` as an array.array."""
+    import numpy as np
+    values = np.ascontiguousarray(values, dtype=typecode)
+    a = array(typecode)
+    a.frombytes(memoryview(values).cast('B'))
+    return a
+
+
+def _column_from_numpy(values):
+    """Returns the attribute column storage for the NumPy array `values`.
+
+    Float and integer arrays become typed arrays so that single values
+    are read back as Python floats and ints.  Other arrays become lists.
+    """
+    kind = values.dtype.kind
+    if kind == 'f':
+        return _from_numpy(values, 'd')
+    if kind == 'i' or (kind == 'u' and (len(values) == 0 or
+                                        values.max() < 2 ** 63)):
+        return _from_numpy(values, 'q')
+    return values.tolist()
+
+
+def _label_indices(nodes, values):
+    """Returns a NumPy array with the position in `nodes` of each label.
+
+    Raises NetworkXError if a label is not in `nodes` or if `nodes`
+    holds duplicates.
+    """
+    import numpy as np
+    if isinstance(nodes, range) and nodes.start == 0 and nodes.step == 1:
+        # the labels are the node numbers already
+        if values.dtype.kind not in 'iu':
+            values = values.astype(np.int64)
+        bad = (values < 0) | (values >= len(nodes))
+        if bad.any():
+            msg = "Node %r of the edge arrays is not in nodes"
+            raise nx.NetworkXError(msg % values[bad][0])
+        return values
+    labels = np.asarray(nodes)
+    if labels.ndim == 1 and labels.dtype != object and \
+            values.dtype != object:
+        order = np.argsort(labels, kind='stable')
+        labels = labels[order]
+        if len(labels) and (labels[1:] == labels[:-1]).any():
+            raise nx.NetworkXError("nodes contains duplicates")
+        pos = np.searchsorted(labels, values)
+        pos[pos == len(labels)] = 0
+        if len(labels):
+            found = labels[pos] == values
+        else:
+            found = np.zeros(len(values), dtype=bool)
+        if not found.all():
+            msg = "Node %r of the edge arrays is not in nodes"
+            raise nx.NetworkXError(msg % values[~found][0])
+        return order[pos]
+    index = {n: i for i, n in enumerate(nodes)}
+    if len(index) != len(nodes):
+        raise nx.NetworkXError("nodes contains duplicates")
+    try:
+        return np.fromiter((index[v] for v in values.tolist()),
+                           dtype=np.int64, count=len(values))
+    except KeyError as err:
+        msg = "Node %r of the edge arrays is not in nodes"
+        raise nx.NetworkXError(msg % err.args[0])
+
+
+def _argsort_pairs(first, second, n):
+    """Returns the stable sort order of pairs of node numbers below `n`."""
+    import numpy as np
+    if n * n < 2 ** 63:
+        # sorting a single combined key is much faster than lexsort
+        return np.argsort(first * n + second, kind='stable')
+    return np.lexsort((second, first))
+
+
+def _sorted_edges(rows, cols, n, directed, dedup):
+    """Orders the edges given by node number arrays `rows` and `cols`.
+
+    Node numbers are below `n`.  Edges are sorted by `(row, col)`,
+    undirected edges being stored with ``row <= col``.  Repeated edges
+    keep their input order; with `dedup` only the last of them is kept.
+    Returns ``(perm, rows, cols)`` where `perm` holds the input position
+    of each edge.
+    """
+    import numpy as np
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    if not directed:
+        rows, cols = np.minimum(rows, cols), np.maximum(rows, cols)
+    perm = _argsort_pairs(rows, cols, n)
+    rows = rows[perm]
+    cols = cols[perm]
+    if dedup:
+        last = np.ones(len(rows), dtype=bool)
+        last[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        perm, rows, cols = perm[last], rows[last], cols[last]
+    return perm, rows, cols
+
+
+def _indptr(rows, n, typecode):
+    import numpy as np
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return _from_numpy(indptr, typecode)
+
+
+def _own(buffer):
+    """Returns a typed array copy of a memoryview, other values as is."""
+    if not isinstance(buffer, memoryview):
+        return buffer
+    a = array(buffer.format)
+    a.frombytes(buffer.cast('B'))
+    return a
+
+
+class _RangeIndex(Mapping):
+    """Read-only Mapping of the nodes ``0 .. n-1`` to themselves.
+
+    Used as `G._index` when the nodes are the integers ``range(n)``, so
+    that no dict has to be built.
+    """
+    __slots__ = ('_range',)
+
+    def __getstate__(self):
+        return {'_range': self._range}
+
+    def __setstate__(self, state):
+        self._range = state['_range']
+
+    def __init__(self, n):
+        self._range = range(n)
+
+    def __len__(self):
+        return len(self._range)
+
+    def __iter__(self):
+        return iter(self._range)
+
+    def __contains__(self, n):
+        try:
+            return n in self._range
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n not in self:
+            raise KeyError(n)
+        return int(n)
+
+
+class _CSR(object):
+    """One direction of adjacency in compressed sparse row form.
+
+    `edge_ids` maps array slots to edge numbers; it is None when slot
+    `k` holds edge `k` (the out-adjacency of directed graphs).
+    """
+    __slots__ = ('indptr', 'indices', 'edge_ids')
+
+    def __init__(self, indptr, indices, edge_ids=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+
+    def __getstate__(self):
+        return {'indptr': _own(self.indptr), 'indices': _own(self.indices),
+                'edge_ids': _own(self.edge_ids)}
+
+    def __setstate__(self, state):
+        self.indptr = state['indptr']
+        self.indices = state['indices']
+        self.edge_ids = state['edge_ids']
+
+    def edge_id(self, slot):
+        if self.edge_ids is None:
+            return slot
+        return self.edge_ids[slot]
+
+
+class _NodeItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        nodemap = self._mapping
+        attrs = nodemap._attrs
+        for i, n in enumerate(nodemap._nodes):
+            yield n, AttributeRow(attrs, i)
+
+
+class _NodeMap(Mapping):
+    """Read-only Mapping of node to node data, used as `G._node`."""
+    __slots__ = ('_nodes', '_index', '_attrs')
+
+    def __getstate__(self):
+        return {'_nodes': self._nodes, '_index': self._index,
+                '_attrs': self._attrs}
+
+    def __setstate__(self, state):
+        self._nodes = state['_nodes']
+        self._index = state['_index']
+        self._attrs = state['_attrs']
+
+    def __init__(self, nodes, index, attrs):
+        self._nodes = nodes
+        self._index = index
+        self._attrs = attrs
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        return n in self._index
+
+    def __getitem__(self, n):
+        return AttributeRow(self._attrs, self._index[n])
+
+    def items(self):
+        return _NodeItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _AdjacencyItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        adj = self._mapping
+        inner = adj._inner
+        indptr = adj._csr.indptr
+        for i, n in enumerate(adj._nodes):
+            yield n, inner(adj, indptr[i], indptr[i + 1])
+
+
+class _Adjacency(Mapping):
+    """Read-only Mapping of node to neighbor mapping, used as `G._adj`.
+
+    The neighbor mappings are `_Neighbors` for graphs and
+    `_MultiNeighbors` for multigraphs.
+    """
+    __slots__ = ('_nodes', '_index', '_csr', '_attrs', '_keys', '_inner')
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __init__(self, nodes, index, csr, attrs, keys=None):
+        self._nodes = nodes
+        self._index = index
+        self._csr = csr
+        self._attrs = attrs
+        self._keys = keys
+        self._inner = _Neighbors if keys is None else _MultiNeighbors
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        return n in self._index
+
+    def __getitem__(self, n):
+        i = self._index[n]
+        indptr = self._csr.indptr
+        return self._inner(self, indptr[i], indptr[i + 1])
+
+    def items(self):
+        return _AdjacencyItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _NeighborItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        nbrs = self._mapping
+        adj = nbrs._adj
+        nodes = adj._nodes
+        attrs = adj._attrs
+        csr = adj._csr
+        indices = csr.indices
+        edge_ids = csr.edge_ids
+        if edge_ids is None:
+            for k in range(nbrs._lo, nbrs._hi):
+                yield nodes[indices[k]], AttributeRow(attrs, k)
+        else:
+            for k in range(nbrs._lo, nbrs._hi):
+                yield nodes[indices[k]], AttributeRow(attrs, edge_ids[k])
+
+
+class _Neighbors(Mapping):
+    """Read-only Mapping of neighbor to edge data for one node."""
+    __slots__ = ('_adj', '_lo', '_hi')
+
+    def __getstate__(self):
+        return {'_adj': self._adj, '_lo': self._lo, '_hi': self._hi}
+
+    def __setstate__(self, state):
+        self._adj = state['_adj']
+        self._lo = state['_lo']
+        self._hi = state['_hi']
+
+    def __init__(self, adj, lo, hi):
+        self._adj = adj
+        self._lo = lo
+        self._hi = hi
+
+    def __len__(self):
+        return self._hi - self._lo
+
+    def __iter__(self):
+        nodes = self._adj._nodes
+        indices = self._adj._csr.indices
+        return (nodes[indices[k]] for k in range(self._lo, self._hi))
+
+    def _slot(self, nbr):
+        j = self._adj._index[nbr]
+        indices = self._adj._csr.indices
+        k = bisect_left(indices, j, self._lo, self._hi)
+        if k == self._hi or indices[k] != j:
+            raise KeyError(nbr)
+        return k
+
+    def __contains__(self, nbr):
+        try:
+            self._slot(nbr)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, nbr):
+        adj = self._adj
+        return AttributeRow(adj._attrs, adj._csr.edge_id(self._slot(nbr)))
+
+    def items(self):
+        return _NeighborItems(self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _MultiNeighbors(_Neighbors):
+    """Read-only Mapping of neighbor to edge-key mapping for one node.
+
+    Parallel edges occupy consecutive slots of the row.
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return sum(1 for nbr in self)
+
+    def __iter__(self):
+        nodes = self._adj._nodes
+        indices = self._adj._csr.indices
+        last = -1
+        for k in range(self._lo, self._hi):
+            j = indices[k]
+            if j != last:
+                yield nodes[j]
+                last = j
+
+    def __getitem__(self, nbr):
+        lo = self._slot(nbr)
+        hi = bisect_right(self._adj._csr.indices, self._adj._csr.indices[lo],
+                          lo, self._hi)
+        return _KeyMap(self._adj, lo, hi)
+
+    def items(self):
+        return ItemsView(self)
+
+
+class _KeyMap(_Neighbors):
+    """Read-only Mapping of edge key to edge data for one node pair."""
+    __slots__ = ()
+
+    def __iter__(self):
+        keys = self._adj._keys
+        edge_id = self._adj._csr.edge_id
+        return (keys[edge_id(k)] for k in range(self._lo, self._hi))
+
+    def _slot(self, key):
+        keys = self._adj._keys
+        edge_id = self._adj._csr.edge_id
+        for k in range(self._lo, self._hi):
+            if keys[edge_id(k)] == key:
+                return k
+        raise KeyError(key)
+
+    def items(self):
+        return ItemsView(self)
+
+
+class _CSRBase(object):
+    """Construction and freezing shared by the CSR graph classes."""
+    frozen = True
+    add_node = _frozen
+    add_nodes_from = _frozen
+    remove_node = _frozen
+    remove_nodes_from = _frozen
+    add_edge = _frozen
+    add_edges_from = _frozen
+    add_weighted_edges_from = _frozen
+    remove_edge = _frozen
+    remove_edges_from = _frozen
+    update = _frozen
+    clear = _frozen
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        """Initialize a CSR graph from a graph or any graph input data.
+
+        Parameters
+        ----------
+        incoming_graph_data : input graph (optional, default: None)
+            Data to initialize the graph.  If None (default) an empty
+            graph is created.  Any input accepted by the corresponding
+            base class can be used; input that is not already a graph of
+            the same directedness and multiplicity is converted with
+            the base class first.
+
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+        """
+        self.graph = self.graph_attr_dict_factory()
+        if incoming_graph_data is None:
+            G = None
+        elif (hasattr(incoming_graph_data, 'adj') and
+              incoming_graph_data.is_directed() == self.is_directed() and
+              incoming_graph_data.is_multigraph() == self.is_multigraph()):
+            G = incoming_graph_data
+        else:
+            if self.is_directed():
+                G = self.to_directed_class()(incoming_graph_data)
+            else:
+                G = self.to_undirected_class()(incoming_graph_data)
+        if G is None:
+            self._set_storage([], {}, AttributeColumns(), _CSR(array('i', [0]),
+                              array('i')), AttributeColumns(), 0)
+        elif type(G) is type(self) and not hasattr(G, '_graph'):
+            # the structure is immutable and can be shared
+            self.graph.update(G.graph)
+            self._set_storage(G._nodelist, G._index, G.node_columns.copy(),
+                              G._csr, G.edge_columns.copy(),
+                              G._num_edges, G._edge_keys, G._pred_csr)
+        else:
+            self.graph.update(G.graph)
+            self._build(G)
+        self.graph.update(attr)
+
+    def _set_storage(self, nodes, index, node_attrs, csr, edge_attrs,
+                     num_edges, keys=None, pred_csr=None):
+        if self.is_multigraph() and keys is None:
+            keys = []
+        self._nodelist = nodes
+        self._index = index
+        self.node_columns = node_attrs
+        self._csr = csr
+        self.edge_columns = edge_attrs
+        self._edge_keys = keys
+        self._num_edges = num_edges
+        self._node = _NodeMap(nodes, index, node_attrs)
+        self._adj = _Adjacency(nodes, index, csr, edge_attrs, keys)
+        if self.is_directed():
+            if pred_csr is None:
+                pred_csr = self._transpose(csr, len(nodes))
+            self._pred_csr = pred_csr
+            self._succ = self._adj
+            self._pred = _Adjacency(nodes, index, pred_csr, edge_attrs, keys)
+        else:
+            self._pred_csr = None
+
+    @staticmethod
+    def _transpose(csr, n):
+        """Returns the CSR of the reversed edges, keeping edge numbers."""
+        indptr = csr.indptr
+        indices = csr.indices
+        typecode = indices.typecode
+        counts = [0] * (n + 1)
+        for j in indices:
+            counts[j + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        pred_indptr = array(typecode, counts)
+        pred_indices = _zeros(typecode, len(indices))
+        pred_edge_ids = _zeros(typecode, len(indices))
+        cursor = counts[:-1]
+        for i in range(n):
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                q = cursor[j]
+                pred_indices[q] = i
+                pred_edge_ids[q] = csr.edge_id(k)
+                cursor[j] = q + 1
+        return _CSR(pred_indptr, pred_indices, pred_edge_ids)
+
+    def _build(self, G):
+        directed = self.is_directed()
+        multi = self.is_multigraph()
+        nodes = list(G)
+        index = {n: i for i, n in enumerate(nodes)}
+        node_attrs = AttributeColumns()
+        nodedata = G.nodes
+        for i, n in enumerate(nodes):
+            for key, value in nodedata[n].items():
+                node_attrs.set(i, key, value)
+
+        adj = G.succ if directed else G.adj
+        if multi:
+            degrees = [sum(len(kd) for kd in adj[n].values()) for n in nodes]
+        else:
+            degrees = [len(adj[n]) for n in nodes]
+        nnz = sum(degrees)
+        typecode = _index_typecode(max(len(nodes), nnz) + 1)
+        indptr = array(typecode, [0])
+        total = 0
+        for d in degrees:
+            total += d
+            indptr.append(total)
+        del degrees
+        indices = _zeros(typecode, nnz)
+        edge_attrs = AttributeColumns()
+        keys = [] if multi else None
+        order = index.__getitem__
+
+        if directed:
+            p = 0
+            for i, u in enumerate(nodes):
+                nbrs = adj[u]
+                for v in sorted(nbrs, key=order):
+                    j = index[v]
+                    if multi:
+                        for key, dd in nbrs[v].items():
+                            indices[p] = j
+                            keys.append(key)
+                            for name, value in dd.items():
+                                edge_attrs.set(p, name, value)
+                            p += 1
+                    else:
+                        indices[p] = j
+                        for name, value in nbrs[v].items():
+                            edge_attrs.set(p, name, value)
+                        p += 1
+            csr = _CSR(indptr, indices)
+            num_edges = nnz
+        else:
+            # Each undirected edge gets one number and two slots (one for
+            # a self-loop).  Rows are filled left to right; when row i
+            # reaches neighbor j > i it also writes the mirrored slot of
+            # row j, whose entries smaller than j arrive in increasing order.
+            edge_ids = _zeros(typecode, nnz)
+            cursor = list(indptr[:-1])
+            eid = 0
+            for i, u in enumerate(nodes):
+                nbrs = adj[u]
+                p = cursor[i]
+                for v in sorted(nbrs, key=order):
+                    j = index[v]
+                    if j < i:
+                        continue
+                    if multi:
+                        items = nbrs[v].items()
+                    else:
+                        items = ((None, nbrs[v]),)
+                    for key, dd in items:
+                        indices[p] = j
+                        edge_ids[p] = eid
+                        p += 1
+                        if j != i:
+                            q = cursor[j]
+                            indices[q] = i
+                            edge_ids[q] = eid
+                            cursor[j] = q + 1
+                        if multi:
+                            keys.append(key)
+                        for name, value in dd.items():
+                            edge_attrs.set(eid, name, value)
+                        eid += 1
+            csr = _CSR(indptr, indices, edge_ids)
+            num_edges = eid
+        self._set_storage(nodes, index, node_attrs, csr, edge_attrs,
+                          num_edges, keys)
+
+    @classmethod
+    def from_edge_arrays(cls, src, dst, nodes=None, dedup=None,
+                         **attr_columns):
+        """Returns a graph built from arrays of edge endpoints.
+
+        The adjacency arrays are built with a few vectorized NumPy passes
+        (a sort and a cumulative count) instead of adding edges one by
+        one, so that no Python object is created per edge.  This is the
+        fastest way to load large edge lists.
+
+        Parameters
+        ----------
+        src, dst : array_like
+            One-dimensional arrays of the same length holding the source
+            and target node of each edge.
+
+        nodes : list, range or array_like, optional (default=None)
+            The nodes of the graph, in order.  It must contain every node
+            of `src` and `dst` and may contain isolated nodes.  If None,
+            the nodes are the distinct values of `src` and `dst` in
+            sorted order.  For ``range(n)`` the values of `src` and `dst`
+            are used as node numbers directly.
+
+        dedup : bool, optional (default=None)
+            If True, repeated edges are merged into one edge holding the
+            attributes of the last of them.  If False, each entry of the
+            arrays is its own edge, which is only valid for multigraphs or
+            when the arrays hold no repeated edges.  If None, repeated
+            edges are merged for graphs and kept for multigraphs.
+
+        attr_columns : keyword arguments, optional
+            Edge attributes as ``name=values`` where `values` is an array
+            with one entry per edge.  Float and integer arrays are stored
+            as typed columns.
+
+        Returns
+        -------
+        G : graph
+            A new graph of this class.
+
+        Notes
+        -----
+        For undirected graphs, ``(u, v)`` and ``(v, u)`` are the same
+        edge.  Edges of multigraphs get keys ``0, 1, ...`` per node pair
+        in input order, as with :meth:`MultiGraph.add_edges_from`.
+
+        See Also
+        --------
+        from_edge_arrays
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> src = np.array([0, 1, 2, 1])
+        >>> dst = np.array([1, 2, 0, 0])
+        >>> G = nx.CSRGraph.from_edge_arrays(src, dst,
+        ...                                  weight=[0.5, 1.5, 2.5, 3.5])
+        >>> sorted(G.edges(data='weight'))
+        [(0, 1, 3.5), (0, 2, 2.5), (1, 2, 1.5)]
+        >>> M = nx.CSRMultiDiGraph.from_edge_arrays(['a', 'a'], ['b', 'b'])
+        >>> list(M.edges(keys=True))
+        [('a', 'b', 0), ('a', 'b', 1)]
+        """
+        return cls._from_arrays(src, dst, nodes, dedup, attr_columns)
+
+    @classmethod
+    def _from_arrays(cls, src, dst, nodes, dedup, attr_columns):
+        # `attr_columns` is a dict so that names need not be strings
+        import numpy as np
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        if src.ndim != 1 or src.shape != dst.shape:
+            msg = "src and dst must be one-dimensional and of equal length"
+            raise nx.NetworkXError(msg)
+        columns = {}
+        for name, values in attr_columns.items():
+            values = np.asarray(values)
+            if values.shape != src.shape:
+                msg = "Edge attribute %r must have one value per edge"
+                raise nx.NetworkXError(msg % (name,))
+            columns[name] = values
+        m = len(src)
+        if nodes is None:
+            labels, inverse = np.unique(np.concatenate([src, dst]),
+                                        return_inverse=True)
+            nodes = labels.tolist()
+            rows, cols = inverse[:m], inverse[m:]
+        else:
+            rows = _label_indices(nodes, src)
+            cols = _label_indices(nodes, dst)
+            nodes = list(nodes)
+        G = cls()
+        G._build_arrays(nodes, rows, cols, columns, dedup)
+        return G
+
+    def _build_arrays(self, nodes, rows, cols, columns, dedup):
+        import numpy as np
+        n = len(nodes)
+        directed = self.is_directed()
+        multi = self.is_multigraph()
+        if dedup is None:
+            dedup = not multi
+        perm, rows, cols = _sorted_edges(rows, cols, n, directed, dedup)
+        m = len(rows)
+        typecode = _index_typecode(max(n, 2 * m) + 1)
+
+        keys = None
+        if multi:
+            # number the parallel edges of each node pair 0, 1, ...
+            first = np.ones(m, dtype=bool)
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            pos = np.arange(m)
+            keys = (pos - np.maximum.accumulate(np.where(first, pos, 0)))
+            keys = keys.tolist()
+
+        pred_csr = None
+        if directed:
+            csr = _CSR(_indptr(rows, n, typecode), _from_numpy(cols, typecode))
+            # a stable sort keeps parallel edges in slot order
+            order = _argsort_pairs(cols, rows, n)
+            pred_csr = _CSR(_indptr(cols, n, typecode),
+                            _from_numpy(rows[order], typecode),
+                            _from_numpy(order, typecode))
+        else:
+            # One slot per endpoint, one for a self-loop.  Parallel edges
+            # keep increasing edge numbers: the mirrored slots (row > col)
+            # never tie with the original ones.
+            loop = rows == cols
+            eids = np.arange(m)
+            r = np.concatenate([rows, cols[~loop]])
+            c = np.concatenate([cols, rows[~loop]])
+            e = np.concatenate([eids, eids[~loop]])
+            order = _argsort_pairs(r, c, n)
+            csr = _CSR(_indptr(r, n, typecode),
+                       _from_numpy(c[order], typecode),
+                       _from_numpy(e[order], typecode))
+
+        edge_attrs = AttributeColumns()
+        for name, values in columns.items():
+            edge_attrs.set_column(name, _column_from_numpy(values[perm]))
+        index = {node: i for i, node in enumerate(nodes)}
+        self._set_storage(nodes, index, AttributeColumns(), csr, edge_attrs,
+                          m, keys, pred_csr)
+
+    def copy(self, as_view=False):
+        """Returns a copy of the graph.
+
+        The copy shares the (immutable) array structure with the original
+        but has its own node and edge attribute columns.  If `as_view` is
+        True then a view is returned instead of a copy.
+        """
+        if as_view is True:
+            return nx.graphviews.generic_graph_view(self)
+        return self.__class__(self)
+
+    def number_of_edges(self, u=None, v=None):
+        """Returns the number of edges between two nodes.
+
+        See :meth:`Graph.number_of_edges`.  The total number of edges is
+        stored and does not require a pass over the graph.
+        """
+        if u is None:
+            return self._num_edges
+        return super(_CSRBase, self).number_of_edges(u, v)
+
+    def size(self, weight=None):
+        """Returns the number of edges or total of all edge weights.
+
+        See :meth:`Graph.size`.
+        """
+        if weight is None:
+            return self._num_edges
+        return super(_CSRBase, self).size(weight)
+
+
+class CSRGraph(_CSRBase, Graph):
+    """Immutable undirected graph stored in compressed sparse row arrays.
+
+    A memory-compact, frozen alternative to :class:`~networkx.Graph`.
+    Nodes are numbered in the order of the input graph, neighbors are
+    kept in sorted integer arrays and attributes are stored column-wise.
+    All reporting methods and views of :class:`~networkx.Graph` are
+    available; methods that add or remove nodes or edges raise
+    :exc:`~networkx.NetworkXError`.
+
+    Parameters
+    ----------
+    incoming_graph_data : input graph (optional, default: None)
+        Data to initialize the graph, either a graph or any input
+        accepted by :class:`~networkx.Graph`.
+
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRDiGraph
+    CSRMultiGraph
+    CSRMultiDiGraph
+    freeze
+
+    Examples
+    --------
+    >>> G = nx.CSRGraph(nx.cycle_graph(4), name='square')
+    >>> G.name
+    'square'
+    >>> G.degree[0]
+    2
+    >>> G.number_of_edges()
+    4
+
+    Attribute values can still be changed through the views:
+
+    >>> G.edges[0, 1]['weight'] = 2.5
+    >>> G[1][0]['weight']
+    2.5
+    """
+
+
+class CSRDiGraph(_CSRBase, DiGraph):
+    """Immutable directed graph stored in compressed sparse row arrays.
+
+    Both the successor and the predecessor adjacency are kept as CSR
+    arrays.  See :class:`CSRGraph` for details.
+
+    Examples
+    --------
+    >>> G = nx.CSRDiGraph(nx.DiGraph([(0, 1), (1, 2), (2, 0)]))
+    >>> list(G.successors(0)), list(G.predecessors(0))
+    ([1], [2])
+    """
+
+    def reverse(self, copy=True):
+        """Returns the reverse of the graph.
+
+        Parameters
+        ----------
+        copy : bool optional (default=True)
+            If True, return a new CSRDiGraph holding the reversed edges.
+            If False, the reverse graph is created using a view of
+            the original graph.
+        """
+        if copy:
+            return self.__class__(nx.graphviews.reverse_view(self))
+        return nx.graphviews.reverse_view(self)
+
+
+class CSRMultiGraph(_CSRBase, MultiGraph):
+    """Immutable undirected multigraph stored in compressed sparse row arrays.
+
+    Parallel edges occupy consecutive slots of the neighbor arrays and
+    their keys are stored per edge.  See :class:`CSRGraph` for details.
+
+    Examples
+    --------
+    >>> G = nx.CSRMultiGraph([(0, 1), (0, 1), (1, 2)])
+    >>> G.number_of_edges(0, 1)
+    2
+    >>> list(G.edges(keys=True))
+    [(0, 1, 0), (0, 1, 1), (1, 2, 0)]
+    """
+
+
+class CSRMultiDiGraph(_CSRBase, MultiDiGraph):
+    """Immutable directed multigraph stored in compressed sparse row arrays.
+
+    See :class:`CSRGraph` and :class:`CSRDiGraph` for details.
+    """
+
+    def reverse(self, copy=True):
+        """Returns the reverse of the graph.
+
+        Parameters
+        ----------
+        copy : bool optional (default=True)
+            If True, return a new CSRMultiDiGraph holding the reversed
+            edges.  If False, the reverse graph is created using a view
+            of the original graph.
+        """
+        if copy:
+            return self.__class__(nx.graphviews.reverse_view(self))
+        return nx.graphviews.reverse_view(self)
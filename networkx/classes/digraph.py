@@ -407,7 +407,10 @@ class DiGraph(Graph):
         NetworkX Graphs, though one should be careful that the hash
         doesn't change on mutables.
         """
+        self._version += 1
         if node_for_adding not in self._succ:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', node_for_adding)
             self._succ[node_for_adding] = self.adjlist_inner_dict_factory()
             self._pred[node_for_adding] = self.adjlist_inner_dict_factory()
             attr_dict = self._node[node_for_adding] = self.node_attr_dict_factory()
@@ -459,12 +462,15 @@ class DiGraph(Graph):
         11
 
         """
+        self._version += 1
         for n in nodes_for_adding:
             # keep all this inside try/except because
             # CPython throws TypeError on n not in self._succ,
             # while pre-2.7.5 ironpython throws on self._succ[n]
             try:
                 if n not in self._succ:
+                    if self._journal is not None:
+                        self._journal.record(self, 'add_node', n)
                     self._succ[n] = self.adjlist_inner_dict_factory()
                     self._pred[n] = self.adjlist_inner_dict_factory()
                     attr_dict = self._node[n] = self.node_attr_dict_factory()
@@ -474,6 +480,8 @@ class DiGraph(Graph):
             except TypeError:
                 nn, ndict = n
                 if nn not in self._succ:
+                    if self._journal is not None:
+                        self._journal.record(self, 'add_node', nn)
                     self._succ[nn] = self.adjlist_inner_dict_factory()
                     self._pred[nn] = self.adjlist_inner_dict_factory()
                     newdict = attr.copy()
@@ -515,6 +523,9 @@ class DiGraph(Graph):
         []
 
         """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record_node_removal(self, n)
         try:
             nbrs = self._succ[n]
             del self._node[n]
@@ -551,7 +562,10 @@ class DiGraph(Graph):
         []
 
         """
+        self._version += 1
         for n in nodes:
+            if self._journal is not None:
+                self._journal.record_node_removal(self, n)
             try:
                 succs = self._succ[n]
                 del self._node[n]
@@ -614,13 +628,18 @@ class DiGraph(Graph):
         >>> G[1][2].update({0: 5})
         >>> G.edges[1, 2].update({0: 5})
         """
+        self._version += 1
         u, v = u_of_edge, v_of_edge
         # add nodes
         if u not in self._succ:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', u)
             self._succ[u] = self.adjlist_inner_dict_factory()
             self._pred[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
         if v not in self._succ:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', v)
             self._succ[v] = self.adjlist_inner_dict_factory()
             self._pred[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
@@ -629,6 +648,8 @@ class DiGraph(Graph):
         datadict.update(attr)
         self._succ[u][v] = datadict
         self._pred[v][u] = datadict
+        if self._journal is not None:
+            self._journal.record(self, 'add_edge', u, v)
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add all the edges in ebunch_to_add.
@@ -668,6 +689,7 @@ class DiGraph(Graph):
         >>> G.add_edges_from([(1, 2), (2, 3)], weight=3)
         >>> G.add_edges_from([(3, 4), (1, 4)], label='WN2898')
         """
+        self._version += 1
         for e in ebunch_to_add:
             ne = len(e)
             if ne == 3:
@@ -679,10 +701,14 @@ class DiGraph(Graph):
                 raise NetworkXError(
                     "Edge tuple %s must be a 2-tuple or 3-tuple." % (e,))
             if u not in self._succ:
+                if self._journal is not None:
+                    self._journal.record(self, 'add_node', u)
                 self._succ[u] = self.adjlist_inner_dict_factory()
                 self._pred[u] = self.adjlist_inner_dict_factory()
                 self._node[u] = self.node_attr_dict_factory()
             if v not in self._succ:
+                if self._journal is not None:
+                    self._journal.record(self, 'add_node', v)
                 self._succ[v] = self.adjlist_inner_dict_factory()
                 self._pred[v] = self.adjlist_inner_dict_factory()
                 self._node[v] = self.node_attr_dict_factory()
@@ -691,6 +717,8 @@ class DiGraph(Graph):
             datadict.update(dd)
             self._succ[u][v] = datadict
             self._pred[v][u] = datadict
+            if self._journal is not None:
+                self._journal.record(self, 'add_edge', u, v)
 
     def remove_edge(self, u, v):
         """Remove the edge between u and v.
@@ -719,11 +747,14 @@ class DiGraph(Graph):
         >>> e = (2, 3, {'weight':7}) # an edge with attribute data
         >>> G.remove_edge(*e[:2]) # select first part of edge tuple
         """
+        self._version += 1
         try:
             del self._succ[u][v]
             del self._pred[v][u]
         except KeyError:
             raise NetworkXError("The edge %s-%s not in graph." % (u, v))
+        if self._journal is not None:
+            self._journal.record(self, 'remove_edge', u, v)
 
     def remove_edges_from(self, ebunch):
         """Remove all edges specified in ebunch.
@@ -751,11 +782,14 @@ class DiGraph(Graph):
         >>> ebunch = [(1, 2), (2, 3)]
         >>> G.remove_edges_from(ebunch)
         """
+        self._version += 1
         for e in ebunch:
             u, v = e[:2]  # ignore edge data
             if u in self._succ and v in self._succ[u]:
                 del self._succ[u][v]
                 del self._pred[v][u]
+                if self._journal is not None:
+                    self._journal.record(self, 'remove_edge', u, v)
 
     def has_successor(self, u, v):
         """Returns True if node u has successor v.
@@ -1080,6 +1114,9 @@ class DiGraph(Graph):
         >>> list(G.edges)
         []
         """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.truncate(self)
         self._succ.clear()
         self._pred.clear()
         self._node.clear()
@@ -268,6 +268,12 @@ class Graph(object):
     edge_attr_dict_factory = dict
     graph_attr_dict_factory = dict
 
+    # Mutation counter, optional change journal and cached NodeIndex,
+    # see networkx.classes.journal and networkx.classes.nodeindex
+    _version = 0
+    _journal = None
+    _node_index = None
+
     def to_directed_class(self):
         """Returns the class to use for empty directed copies.
 
@@ -500,7 +506,10 @@ class Graph(object):
         NetworkX Graphs, though one should be careful that the hash
         doesn't change on mutables.
         """
+        self._version += 1
         if node_for_adding not in self._node:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', node_for_adding)
             self._adj[node_for_adding] = self.adjlist_inner_dict_factory()
             attr_dict = self._node[node_for_adding] = self.node_attr_dict_factory()
             attr_dict.update(attr)
@@ -551,12 +560,15 @@ class Graph(object):
         11
 
         """
+        self._version += 1
         for n in nodes_for_adding:
             # keep all this inside try/except because
             # CPython throws TypeError on n not in self._node,
             # while pre-2.7.5 ironpython throws on self._adj[n]
             try:
                 if n not in self._node:
+                    if self._journal is not None:
+                        self._journal.record(self, 'add_node', n)
                     self._adj[n] = self.adjlist_inner_dict_factory()
                     attr_dict = self._node[n] = self.node_attr_dict_factory()
                     attr_dict.update(attr)
@@ -565,6 +577,8 @@ class Graph(object):
             except TypeError:
                 nn, ndict = n
                 if nn not in self._node:
+                    if self._journal is not None:
+                        self._journal.record(self, 'add_node', nn)
                     self._adj[nn] = self.adjlist_inner_dict_factory()
                     newdict = attr.copy()
                     newdict.update(ndict)
@@ -605,6 +619,9 @@ class Graph(object):
         []
 
         """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.record_node_removal(self, n)
         adj = self._adj
         try:
             nbrs = list(adj[n])  # list handles self-loops (allows mutation)
@@ -640,8 +657,11 @@ class Graph(object):
         []
 
         """
+        self._version += 1
         adj = self._adj
         for n in nodes:
+            if self._journal is not None:
+                self._journal.record_node_removal(self, n)
             try:
                 del self._node[n]
                 for u in list(adj[n]):   # list handles self-loops
@@ -864,12 +884,17 @@ class Graph(object):
         >>> G[1][2].update({0: 5})
         >>> G.edges[1, 2].update({0: 5})
         """
+        self._version += 1
         u, v = u_of_edge, v_of_edge
         # add nodes
         if u not in self._node:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', u)
             self._adj[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
         if v not in self._node:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', v)
             self._adj[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
         # add the edge
@@ -877,6 +902,8 @@ class Graph(object):
         datadict.update(attr)
         self._adj[u][v] = datadict
         self._adj[v][u] = datadict
+        if self._journal is not None:
+            self._journal.record(self, 'add_edge', u, v)
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add all the edges in ebunch_to_add.
@@ -916,6 +943,7 @@ class Graph(object):
         >>> G.add_edges_from([(1, 2), (2, 3)], weight=3)
         >>> G.add_edges_from([(3, 4), (1, 4)], label='WN2898')
         """
+        self._version += 1
         for e in ebunch_to_add:
             ne = len(e)
             if ne == 3:
@@ -927,9 +955,13 @@ class Graph(object):
                 raise NetworkXError(
                     "Edge tuple %s must be a 2-tuple or 3-tuple." % (e,))
             if u not in self._node:
+                if self._journal is not None:
+                    self._journal.record(self, 'add_node', u)
                 self._adj[u] = self.adjlist_inner_dict_factory()
                 self._node[u] = self.node_attr_dict_factory()
             if v not in self._node:
+                if self._journal is not None:
+                    self._journal.record(self, 'add_node', v)
                 self._adj[v] = self.adjlist_inner_dict_factory()
                 self._node[v] = self.node_attr_dict_factory()
             datadict = self._adj[u].get(v, self.edge_attr_dict_factory())
@@ -937,6 +969,8 @@ class Graph(object):
             datadict.update(dd)
             self._adj[u][v] = datadict
             self._adj[v][u] = datadict
+            if self._journal is not None:
+                self._journal.record(self, 'add_edge', u, v)
 
     def add_weighted_edges_from(self, ebunch_to_add, weight='weight', **attr):
         """Add weighted edges in `ebunch_to_add` with specified weight attr
@@ -997,12 +1031,15 @@ class Graph(object):
         >>> e = (2, 3, {'weight':7}) # an edge with attribute data
         >>> G.remove_edge(*e[:2]) # select first part of edge tuple
         """
+        self._version += 1
         try:
             del self._adj[u][v]
             if u != v:  # self-loop needs only one entry removed
                 del self._adj[v][u]
         except KeyError:
             raise NetworkXError("The edge %s-%s is not in the graph" % (u, v))
+        if self._journal is not None:
+            self._journal.record(self, 'remove_edge', u, v)
 
     def remove_edges_from(self, ebunch):
         """Remove all edges specified in ebunch.
@@ -1030,6 +1067,7 @@ class Graph(object):
         >>> ebunch=[(1, 2), (2, 3)]
         >>> G.remove_edges_from(ebunch)
         """
+        self._version += 1
         adj = self._adj
         for e in ebunch:
             u, v = e[:2]  # ignore edge data if present
@@ -1037,6 +1075,8 @@ class Graph(object):
                 del adj[u][v]
                 if u != v:  # self loop needs only one entry removed
                     del adj[v][u]
+                if self._journal is not None:
+                    self._journal.record(self, 'remove_edge', u, v)
 
     def update(self, edges=None, nodes=None):
         """Update the graph using nodes/edges/graphs as input.
@@ -1403,6 +1443,9 @@ class Graph(object):
         []
 
         """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.truncate(self)
         self._adj.clear()
         self._node.clear()
         self.graph.clear()
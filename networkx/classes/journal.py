@@ -0,0 +1,233 @@
+"""
+Version counter and change journal of the base graph classes.
+
+Every method of the base graph classes that adds or removes nodes or
+edges, or updates edge data through :meth:`~networkx.Graph.add_edge` and
+friends, increments a per-graph version number.  Comparing
+:func:`graph_version` before and after some code tells whether the graph
+was modified, which makes it a cheap key for result caches.
+
+A graph can in addition keep a bounded journal of its structural changes
+(see :func:`enable_journal`).  :func:`changes_since` returns what happened
+after a given version, so that results can be updated incrementally
+instead of being recomputed.
+
+Changes made directly to attribute dicts, e.g. ``G[u][v]['weight'] = 3``
+or :func:`~networkx.set_edge_attributes`, bypass the graph methods and
+are neither counted nor journaled.
+
+Examples
+--------
+>>> G = nx.path_graph(3)
+>>> journal = nx.enable_journal(G)
+>>> v = nx.graph_version(G)
+>>> G.add_edge(2, 3)
+>>> G.remove_node(0)
+>>> nx.graph_version(G) > v
+True
+>>> [change[1:] for change in nx.changes_since(G, v)]
+[('add_node', 3), ('add_edge', 2, 3), ('remove_edge', 0, 1), ('remove_node', 0)]
+"""
+from collections import deque
+
+import networkx as nx
+
+__all__ = ['GraphJournal', 'graph_version', 'enable_journal',
+           'disable_journal', 'changes_since']
+
+
+class GraphJournal(object):
+    """Bounded record of the node and edge changes of a graph.
+
+    Each entry is a tuple ``(version, change, *args)`` where `version` is
+    the graph version after the change and `change` is one of
+
+    - ``'add_node'``, with the node, for each node added,
+    - ``'remove_node'``, with the node, after the removal of its edges,
+    - ``'add_edge'``, with ``u, v`` (and the key for multigraphs), for
+      each edge added by, or whose data was updated by, the edge adding
+      methods,
+    - ``'remove_edge'``, with ``u, v`` (and the key for multigraphs).
+
+    Once `maxlen` entries are stored, the oldest ones are dropped.
+
+    Parameters
+    ----------
+    version : int
+        The graph version at which recording starts.
+    maxlen : int or None, optional (default=None)
+        The maximum number of entries kept.  None means no limit.
+    """
+
+    def __init__(self, version, maxlen=None):
+        self._entries = deque(maxlen=maxlen)
+        # every change made after version `_start` is still recorded
+        self._start = version
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    @property
+    def start(self):
+        """The oldest version that changes can be requested since."""
+        return self._start
+
+    def record(self, G, change, *args):
+        """Appends a change made by the current mutation of `G`."""
+        entries = self._entries
+        if len(entries) == entries.maxlen:
+            self._start = entries[0][0]
+        entries.append((G._version, change) + args)
+
+    def record_node_removal(self, G, n):
+        """Records the removal of node `n` and of its edges from `G`.
+
+        Must be called before the node is removed.  Does nothing if `n`
+        is not in `G`.
+        """
+        try:
+            if n not in G._node:
+                return
+        except TypeError:
+            return
+        multigraph = G.is_multigraph()
+        if G.is_directed():
+            edges = [(n, v, d) for v, d in G._succ[n].items()]
+            edges.extend((u, n, d) for u, d in G._pred[n].items() if u != n)
+        else:
+            edges = [(n, v, d) for v, d in G._adj[n].items()]
+        for u, v, d in edges:
+            if multigraph:
+                for key in d:
+                    self.record(G, 'remove_edge', u, v, key)
+            else:
+                self.record(G, 'remove_edge', u, v)
+        self.record(G, 'remove_node', n)
+
+    def truncate(self, G):
+        """Drops all entries: changes before the current version of `G`
+        are no longer available."""
+        self._entries.clear()
+        self._start = G._version
+
+    def since(self, version):
+        """Returns the list of entries recorded after `version`.
+
+        Raises
+        ------
+        NetworkXError
+            If changes made after `version` are no longer (or were never)
+            in the journal.
+        """
+        if version < self._start:
+            msg = "Changes since version %s are not in the journal."
+            raise nx.NetworkXError(msg % version)
+        return [e for e in self._entries if e[0] > version]
+
+
+def graph_version(G):
+    """Returns the version number of `G`.
+
+    The version increases each time nodes or edges are added to or
+    removed from `G` through its methods.  The version of a graph view
+    is the version of the graph it views.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph or graph view.
+
+    Returns
+    -------
+    version : int
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> v = nx.graph_version(G)
+    >>> G.add_edge(1, 2)
+    >>> nx.graph_version(G) > v
+    True
+    >>> v = nx.graph_version(G)
+    >>> G.nodes[1]['color'] = 'red'  # attribute changes are not counted
+    >>> nx.graph_version(G) == v
+    True
+    """
+    while hasattr(G, '_graph'):
+        G = G._graph
+    return G._version
+
+
+def enable_journal(G, maxlen=10000):
+    """Starts recording the structural changes of `G`.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph.  Graph views can not be journaled.
+    maxlen : int or None, optional (default=10000)
+        The maximum number of changes kept, the oldest being dropped
+        first.  None means no limit.
+
+    Returns
+    -------
+    journal : GraphJournal
+        The journal of `G`.  If `G` already had one, it is replaced.
+
+    See Also
+    --------
+    changes_since
+    disable_journal
+    """
+    if hasattr(G, '_graph'):
+        raise nx.NetworkXError("Graph views can not be journaled.")
+    G._journal = GraphJournal(G._version, maxlen)
+    return G._journal
+
+
+def disable_journal(G):
+    """Stops recording the changes of `G` and discards its journal."""
+    G._journal = None
+
+
+def changes_since(G, version):
+    """Returns the changes made to `G` after `version`.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph with a journal, see :func:`enable_journal`.
+    version : int
+        A version of `G` as returned by :func:`graph_version`.
+
+    Returns
+    -------
+    changes : list
+        The journal entries recorded after `version`, in order.
+        See :class:`GraphJournal` for their format.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` has no journal or if the changes made after `version` are
+        not all in the journal (e.g. because it was enabled later, its
+        size limit was reached or the graph was cleared).  The caller
+        should then start over from the current graph.
+
+    Examples
+    --------
+    >>> G = nx.MultiGraph()
+    >>> journal = nx.enable_journal(G)
+    >>> G.add_edges_from([(1, 2), (1, 2)])
+    [0, 1]
+    >>> v = nx.graph_version(G)
+    >>> G.remove_edge(1, 2, key=0)
+    >>> nx.changes_since(G, v)[0][1:]
+    ('remove_edge', 1, 2, 0)
+    """
+    if G._journal is None:
+        raise nx.NetworkXError("The graph has no journal.")
+    return G._journal.since(version)
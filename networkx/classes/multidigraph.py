@@ -417,13 +417,18 @@ class MultiDiGraph(MultiGraph, DiGraph):
         >>> G[1][2][0].update({0: 5})
         >>> G.edges[1, 2, 0].update({0: 5})
         """
+        self._version += 1
         u, v = u_for_edge, v_for_edge
         # add nodes
         if u not in self._succ:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', u)
             self._succ[u] = self.adjlist_inner_dict_factory()
             self._pred[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
         if v not in self._succ:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', v)
             self._succ[v] = self.adjlist_inner_dict_factory()
             self._pred[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
@@ -442,6 +447,8 @@ class MultiDiGraph(MultiGraph, DiGraph):
             keydict[key] = datadict
             self._succ[u][v] = keydict
             self._pred[v][u] = keydict
+        if self._journal is not None:
+            self._journal.record(self, 'add_edge', u, v, key)
         return key
 
     def remove_edge(self, u, v, key=None):
@@ -490,6 +497,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
         >>> G.remove_edge(1, 2, key='second')
 
         """
+        self._version += 1
         try:
             d = self._adj[u][v]
         except KeyError:
@@ -497,7 +505,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
                 "The edge %s-%s is not in the graph." % (u, v))
         # remove the edge with specified data
         if key is None:
-            d.popitem()
+            key = d.popitem()[0]
         else:
             try:
                 del d[key]
@@ -508,6 +516,8 @@ class MultiDiGraph(MultiGraph, DiGraph):
             # remove the key entries if last edge
             del self._succ[u][v]
             del self._pred[v][u]
+        if self._journal is not None:
+            self._journal.record(self, 'remove_edge', u, v, key)
 
     @property
     def edges(self):
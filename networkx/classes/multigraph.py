@@ -424,12 +424,17 @@ class MultiGraph(Graph):
         >>> G[1][2][0].update({0: 5})
         >>> G.edges[1, 2, 0].update({0: 5})
         """
+        self._version += 1
         u, v = u_for_edge, v_for_edge
         # add nodes
         if u not in self._adj:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', u)
             self._adj[u] = self.adjlist_inner_dict_factory()
             self._node[u] = self.node_attr_dict_factory()
         if v not in self._adj:
+            if self._journal is not None:
+                self._journal.record(self, 'add_node', v)
             self._adj[v] = self.adjlist_inner_dict_factory()
             self._node[v] = self.node_attr_dict_factory()
         if key is None:
@@ -447,6 +452,8 @@ class MultiGraph(Graph):
             keydict[key] = datadict
             self._adj[u][v] = keydict
             self._adj[v][u] = keydict
+        if self._journal is not None:
+            self._journal.record(self, 'add_edge', u, v, key)
         return key
 
     def add_edges_from(self, ebunch_to_add, **attr):
@@ -574,6 +581,7 @@ class MultiGraph(Graph):
         >>> G.remove_edge(1, 2, key='second')
 
         """
+        self._version += 1
         try:
             d = self._adj[u][v]
         except KeyError:
@@ -581,7 +589,7 @@ class MultiGraph(Graph):
                 "The edge %s-%s is not in the graph." % (u, v))
         # remove the edge with specified data
         if key is None:
-            d.popitem()
+            key = d.popitem()[0]
         else:
             try:
                 del d[key]
@@ -593,6 +601,8 @@ class MultiGraph(Graph):
             del self._adj[u][v]
             if u != v:  # check for selfloop
                 del self._adj[v][u]
+        if self._journal is not None:
+            self._journal.record(self, 'remove_edge', u, v, key)
 
     def remove_edges_from(self, ebunch):
         """Remove all edges specified in ebunch.
@@ -0,0 +1,349 @@
+"""
+Cached integer numbering of the nodes and edges of a graph.
+
+Array-based code (matrix conversion, spectral methods, link analysis)
+needs the nodes of a graph numbered ``0 .. n-1`` and its adjacency in
+compressed sparse row (CSR) form.  Building both requires a walk over the
+whole graph.  :func:`node_index` builds them once per graph and keeps them
+until the structure of the graph changes, as told by the graph version
+(see :func:`~networkx.graph_version`).
+
+Edge attribute values are not cached.  They are read from the edge data
+each time they are requested, so that changes made through
+``G[u][v]['weight'] = w`` are always seen.
+
+Examples
+--------
+>>> G = nx.Graph([('a', 'b', {'weight': 2}), ('b', 'c', {'weight': 3})])
+>>> idx = nx.node_index(G)
+>>> idx.nodes
+['a', 'b', 'c']
+>>> idx.index['c']
+2
+>>> nx.node_index(G) is idx
+True
+>>> print(idx.adjacency().todense())
+[[0 2 0]
+ [2 0 3]
+ [0 3 0]]
+>>> G.add_edge('c', 'd')
+>>> nx.node_index(G) is idx
+False
+"""
+
+__all__ = ['NodeIndex', 'node_index']
+
+
+class NodeIndex(object):
+    """Numbering of the nodes of a graph and its adjacency in CSR form.
+
+    Node ``i`` is ``nodes[i]``, in the order of ``list(G)``.  The edge
+    slots of node ``i`` are ``indptr[i]:indptr[i + 1]``; slot `k` holds an
+    edge to node ``indices[k]``.  Undirected edges have one slot in the
+    row of each endpoint (one slot for a self-loop), directed edges one
+    slot in the row of their source, and each edge of a multigraph has
+    its own slot.
+
+    Use :func:`node_index` to get the cached index of a graph instead
+    of creating one directly.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph.
+
+    Attributes
+    ----------
+    nodes : list or range
+        The nodes, so that ``nodes[i]`` is the node numbered `i`.
+    index : dict or mapping
+        Maps each node to its number.
+    indptr, indices : NumPy ndarray
+        The CSR structure of the adjacency.  They are shared by every
+        user of the index and must not be modified.
+    """
+
+    def __init__(self, G):
+        import numpy as np
+        self.directed = G.is_directed()
+        self.multigraph = G.is_multigraph()
+        self._edge_data = None
+        self._edge_columns = None
+        self._edge_rows = None
+        self._scipy_structure = None
+        self._lists = None
+        csr = getattr(G, '_csr', None)
+        if csr is not None and not hasattr(G, '_graph'):
+            # CSR graphs already store this structure
+            self.nodes = G._nodelist
+            self.index = G._index
+            # zero-copy views of typed arrays or memory mapped buffers
+            self.indptr = np.asarray(csr.indptr)
+            self.indices = np.asarray(csr.indices)
+            if csr.edge_ids is None:
+                self._edge_rows = np.arange(len(self.indices))
+            else:
+                self._edge_rows = np.asarray(csr.edge_ids)
+            self._edge_columns = G.edge_columns
+            return
+        self.nodes = nodes = list(G)
+        self.index = index = {n: i for i, n in enumerate(nodes)}
+        adj = G._adj
+        indptr = [0]
+        indices = []
+        data = []
+        for u in nodes:
+            for v, d in adj[u].items():
+                if self.multigraph:
+                    for dd in d.values():
+                        indices.append(index[v])
+                        data.append(dd)
+                else:
+                    indices.append(index[v])
+                    data.append(d)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.intp)
+        self.indices = np.array(indices, dtype=np.intp)
+        self._edge_data = data
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def nnz(self):
+        """The number of edge slots."""
+        return len(self.indices)
+
+    def rows(self):
+        """Returns a NumPy array with the source node number of each slot."""
+        import numpy as np
+        return np.repeat(np.arange(len(self.nodes)), np.diff(self.indptr))
+
+    def edge_weights(self, weight='weight', default=1, dtype=None):
+        """Returns a NumPy array with attribute `weight` of each edge slot.
+
+        Parameters
+        ----------
+        weight : string or None, optional (default='weight')
+            The edge attribute to read.  If None, every entry is `default`.
+        default : scalar, optional (default=1)
+            Value used for edges without the attribute.
+        dtype : NumPy data-type, optional
+            The data type of the result.  If None, it is inferred from
+            the values.
+
+        Returns
+        -------
+        values : NumPy ndarray
+            ``values[k]`` is the weight of the edge in slot `k`.
+        """
+        import numpy as np
+        if weight is None:
+            return np.full(self.nnz, default, dtype=dtype)
+        if self._edge_data is not None:
+            return np.array([d.get(weight, default) for d in self._edge_data],
+                            dtype=dtype)
+        columns = self._edge_columns
+        if weight not in columns:
+            return np.full(self.nnz, default, dtype=dtype)
+        if dtype is None:
+            dtype = {'d': float, 'q': np.int64}.get(columns.typecode(weight))
+        if dtype is None:
+            return np.array([columns.get(r, weight, default)
+                             for r in self._edge_rows.tolist()])
+        return columns.gather(weight, self._edge_rows, default, dtype)
+
+    def edge_values(self, weight='weight', default=1):
+        """Returns a list with attribute `weight` of each edge slot.
+
+        Unlike :meth:`edge_weights`, the values are the Python objects
+        held by the edges, not converted to a common NumPy type, for
+        pure Python algorithms.
+
+        Parameters
+        ----------
+        weight : string, optional (default='weight')
+            The edge attribute to read.
+        default : object, optional (default=1)
+            Value used for edges without the attribute.
+
+        Returns
+        -------
+        values : list
+            ``values[k]`` is the weight of the edge in slot `k`.
+        """
+        import numpy as np
+        if self._edge_data is not None:
+            return [d.get(weight, default) for d in self._edge_data]
+        columns = self._edge_columns
+        if weight not in columns:
+            return [default] * self.nnz
+        rows = self._edge_rows
+        values, present = columns.column(weight)
+        if columns.typecode(weight) is not None and present is None and \
+                (len(rows) == 0 or rows.max() < len(values)):
+            # every edge has a value of the column type
+            return np.asarray(values)[rows].tolist()
+        get = columns.get
+        return [get(r, weight, default) for r in rows.tolist()]
+
+    def adjacency_lists(self):
+        """Returns the CSR structure as Python lists ``(indptr, indices)``.
+
+        The lists are built once per index.  Pure Python loops read lists
+        much faster than NumPy arrays.  They must not be modified.
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist())
+        return self._lists
+
+    def adjacency(self, weight='weight', dtype=None):
+        """Returns the adjacency matrix as a new SciPy CSR matrix.
+
+        The entries of parallel edges of multigraphs are summed.
+        See :func:`~networkx.to_scipy_sparse_matrix` for the meaning
+        of the parameters.
+        """
+        from scipy import sparse
+        n = len(self.nodes)
+        data = self.edge_weights(weight, 1, dtype)
+        M = sparse.csr_matrix((data, self.indices.copy(), self.indptr.copy()),
+                              shape=(n, n), dtype=dtype)
+        M.sum_duplicates()
+        return M
+
+    def _structure(self):
+        """Returns the canonical CSR structure used by SciPy views.
+
+        Returns ``(indptr, indices, order, starts)``: the read-only index
+        arrays, with column numbers sorted within each row and parallel
+        edges merged; `order`, the edge slots in that sorted order, or
+        None if they already are; and `starts`, the first sorted slot of
+        each merged entry, or None if there are no parallel edges.
+        """
+        import numpy as np
+        from networkx.classes.csrgraph import _argsort_pairs
+        if self._scipy_structure is not None:
+            return self._scipy_structure
+        n = len(self.nodes)
+        # the index type SciPy would pick, so that it does not copy
+        if max(n, self.nnz) < 2 ** 31:
+            itype = np.int32
+        else:
+            itype = np.int64
+        rows = self.rows()
+        order = _argsort_pairs(rows, self.indices, n)
+        if np.array_equal(order, np.arange(self.nnz)):
+            order = None
+            indices = self.indices
+        else:
+            indices = self.indices[order]
+        starts = None
+        indptr = self.indptr
+        if self.multigraph and self.nnz:
+            rows = rows[order] if order is not None else rows
+            first = np.empty(self.nnz, dtype=bool)
+            first[0] = True
+            first[1:] = (rows[1:] != rows[:-1]) | (indices[1:] != indices[:-1])
+            if not first.all():
+                starts = np.flatnonzero(first)
+                indices = indices[starts]
+                counts = np.bincount(rows[starts], minlength=n)
+                indptr = np.concatenate(([0], np.cumsum(counts)))
+        indptr = np.asarray(indptr, dtype=itype)
+        indices = np.asarray(indices, dtype=itype)
+        indptr.flags.writeable = False
+        indices.flags.writeable = False
+        self._scipy_structure = (indptr, indices, order, starts)
+        return self._scipy_structure
+
+    def csr_view(self, weight='weight', dtype=None):
+        """Returns the adjacency matrix as a read-only SciPy CSR matrix.
+
+        The index arrays of the matrix are built once and shared by every
+        matrix returned for this index; only the entries are read anew
+        from the edge data.  The entries of parallel edges of multigraphs
+        are summed.  The arrays of the matrix are not writeable, so it
+        must be copied before being modified in place.
+
+        Parameters
+        ----------
+        weight : string or None, optional (default='weight')
+            The edge attribute holding the entries.  If None, every
+            entry is 1.
+        dtype : NumPy data-type, optional
+            The data type of the entries.  If None, it is inferred from
+            the values.
+
+        Returns
+        -------
+        M : SciPy csr_matrix
+            The adjacency matrix, in canonical format.
+        """
+        import numpy as np
+        from scipy import sparse
+        n = len(self.nodes)
+        indptr, indices, order, starts = self._structure()
+        data = self.edge_weights(weight, 1, dtype)
+        if order is not None:
+            data = data[order]
+        if starts is not None:
+            data = np.add.reduceat(data, starts)
+        data.flags.writeable = False
+        M = sparse.csr_matrix((data, indices, indptr), shape=(n, n),
+                              copy=False)
+        M.has_sorted_indices = True
+        M.has_canonical_format = True
+        return M
+
+
+def node_index(G):
+    """Returns the cached :class:`NodeIndex` of `G`.
+
+    The index is built on first use and kept on the graph until nodes or
+    edges are added or removed.  Graph views are indexed anew on every
+    call since changes to the underlying graph can not be tracked.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX graph.
+
+    Returns
+    -------
+    index : NodeIndex
+        The numbering of the nodes and the adjacency structure of `G`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(2, 1), (1, 0)])
+    >>> idx = nx.node_index(G)
+    >>> idx.nodes, list(idx.indptr), list(idx.indices)
+    ([2, 1, 0], [0, 1, 2, 2], [1, 2])
+    """
+    if hasattr(G, '_graph'):
+        return NodeIndex(G)
+    cached = G._node_index
+    if cached is not None and cached[0] == G._version:
+        return cached[1]
+    index = NodeIndex(G)
+    G._node_index = (G._version, index)
+    return index
+
+
+def _cached_node_index(G, nodelist):
+    """Returns the cached index of `G` if its node order is `nodelist`.
+
+    `nodelist` None means all nodes in graph order.  Returns None for
+    graph views and other node lists.
+    """
+    if hasattr(G, '_graph'):
+        return None
+    if nodelist is None:
+        return node_index(G)
+    if len(nodelist) != len(G):
+        return None
+    index = node_index(G)
+    if list(nodelist) != list(index.nodes):
+        return None
+    return index
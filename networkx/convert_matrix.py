@@ -30,7 +30,16 @@ __all__ = ['from_numpy_matrix', 'to_numpy_matrix',
            'from_pandas_edgelist', 'to_pandas_edgelist',
            'to_numpy_recarray',
            'from_scipy_sparse_matrix', 'to_scipy_sparse_matrix',
-           'from_numpy_array', 'to_numpy_array']
+           'to_scipy_sparse_view',
+           'from_numpy_array', 'to_numpy_array',
+           'from_edge_arrays']
+
+
+def _has_bulk_constructor(create_using):
+    """Returns True if `create_using` is a graph class that builds graphs
+    from edge arrays in bulk, such as :class:`~networkx.CSRGraph`."""
+    return (isinstance(create_using, type) and
+            hasattr(create_using, 'from_edge_arrays'))
 
 
 def to_pandas_adjacency(G, nodelist=None, dtype=None, order=None,
@@ -146,6 +155,10 @@ def from_pandas_adjacency(df, create_using=None):
     If the numpy matrix has a single data type for each matrix entry it
     will be converted to an appropriate Python data type.
 
+    If `create_using` is a CSR graph class such as :class:`networkx.CSRGraph`,
+    the graph is built from the nonzero entries in bulk, see
+    :func:`from_edge_arrays`.
+
     If the numpy matrix has a user-specified compound data type the names
     of the data fields will be used as attribute keys in the resulting
     NetworkX graph.
@@ -314,6 +327,27 @@ def from_pandas_edgelist(df, source='source', target='target', edge_attr=None,
     'red'
 
     """
+    if _has_bulk_constructor(create_using):
+        if edge_attr is None:
+            cols = []
+        elif edge_attr is True:
+            cols = [c for c in df.columns
+                    if c is not source and c is not target]
+        elif isinstance(edge_attr, (list, tuple)):
+            cols = edge_attr
+        else:
+            cols = [edge_attr]
+        if edge_attr is not None and len(cols) == 0:
+            msg = "Invalid edge_attr argument. No columns found with name: %s"
+            raise nx.NetworkXError(msg % (cols,))
+        try:
+            columns = {col: df[col].values for col in cols}
+        except (KeyError, TypeError) as e:
+            msg = "Invalid edge_attr argument: %s" % edge_attr
+            raise nx.NetworkXError(msg) from e
+        return _from_edge_arrays(df[source].values, df[target].values,
+                                 create_using, None, None, columns)
+
     g = nx.empty_graph(0, create_using)
 
     if edge_attr is None:
@@ -329,7 +363,7 @@ def from_pandas_edgelist(df, source='source', target='target', edge_attr=None,
         cols = [edge_attr]
     if len(cols) == 0:
         msg = "Invalid edge_attr argument. No columns found with name: %s"
-        raise nx.NetworkXError(msg % cols)
+        raise nx.NetworkXError(msg % (cols,))
 
     try:
         eattrs = zip(*[df[col] for col in cols])
@@ -486,6 +520,10 @@ def from_numpy_matrix(A, parallel_edges=False, create_using=None):
     If the numpy matrix has a single data type for each matrix entry it
     will be converted to an appropriate Python data type.
 
+    If `create_using` is a CSR graph class such as :class:`networkx.CSRGraph`,
+    the graph is built from the nonzero entries in bulk, see
+    :func:`from_edge_arrays`.
+
     If the numpy matrix has a user-specified compound data type the names
     of the data fields will be used as attribute keys in the resulting
     NetworkX graph.
@@ -544,7 +582,10 @@ def from_numpy_matrix(A, parallel_edges=False, create_using=None):
                            'S': str,
                            'V': 'void'}
     kind_to_python_type['U'] = str
-    G = nx.empty_graph(0, create_using)
+    if _has_bulk_constructor(create_using):
+        G = None
+    else:
+        G = nx.empty_graph(0, create_using)
     n, m = A.shape
     if n != m:
         raise nx.NetworkXError("Adjacency matrix is not square.",
@@ -555,6 +596,21 @@ def from_numpy_matrix(A, parallel_edges=False, create_using=None):
     except Exception:
         raise TypeError("Unknown numpy data type: %s" % dt)
 
+    if G is None:
+        # Build the whole graph from arrays without per-edge tuples.
+        A = np.asarray(A)
+        row, col = A.nonzero()
+        if python_type == 'void':
+            columns = {name: A[name][row, col] for name in dt.names}
+        elif python_type is int and issubclass(create_using, nx.MultiGraph) \
+                and parallel_edges:
+            counts = A[row, col]
+            row, col = np.repeat(row, counts), np.repeat(col, counts)
+            columns = {'weight': np.ones(len(row), dtype=int)}
+        else:
+            columns = {'weight': A[row, col]}
+        return _from_adjacency_arrays(create_using, n, row, col, columns)
+
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
     # Get a list of all the entries in the matrix with nonzero entries. These
@@ -758,12 +814,26 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
        https://docs.scipy.org/doc/scipy/reference/sparse.html
     """
     from scipy import sparse
+    from networkx.classes.nodeindex import _cached_node_index
     if nodelist is None:
-        nodelist = list(G)
-    nlen = len(nodelist)
+        nlen = len(G)
+    else:
+        nlen = len(nodelist)
     if nlen == 0:
         raise nx.NetworkXError("Graph has no nodes or edges")
 
+    # All nodes in graph order: use the cached adjacency structure
+    cached = _cached_node_index(G, nodelist)
+    if cached is not None:
+        M = cached.adjacency(weight, dtype)
+        try:
+            return M.asformat(format)
+        except (AttributeError, ValueError):
+            raise nx.NetworkXError("Unknown sparse matrix format: %s" % format)
+
+    if nodelist is None:
+        nodelist = list(G)
+
     if len(nodelist) != len(set(nodelist)):
         msg = "Ambiguous ordering: `nodelist` contained duplicates."
         raise nx.NetworkXError(msg)
@@ -805,6 +875,73 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
         raise nx.NetworkXError("Unknown sparse matrix format: %s" % format)
 
 
+def to_scipy_sparse_view(G, weight='weight', dtype=None):
+    """Returns the adjacency matrix of `G` as a read-only SciPy CSR matrix.
+
+    Unlike :func:`to_scipy_sparse_matrix`, the row pointer and column
+    index arrays of the matrix are not built anew on each call: they are
+    kept with the cached numbering of the nodes of `G` (see
+    :func:`~networkx.node_index`) and shared by every matrix returned
+    until nodes or edges are added or removed.  For CSR graphs they are,
+    when possible, the arrays stored by the graph itself.
+
+    Parameters
+    ----------
+    G : graph
+        The NetworkX graph.
+
+    weight : string or None, optional (default='weight')
+        The edge attribute that holds the numerical value used for
+        the edge weight.  If None then all edge weights are 1.
+
+    dtype : NumPy data-type, optional
+        A valid NumPy dtype used for the entries.  If None, it is
+        inferred from the edge weights.
+
+    Returns
+    -------
+    M : SciPy csr_matrix
+       Graph adjacency matrix, with rows and columns in the order of
+       ``list(G)``.  Its arrays are not writeable; use ``M.copy()`` to
+       get a matrix that can be modified.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` has no nodes.
+
+    See Also
+    --------
+    to_scipy_sparse_matrix
+    node_index
+
+    Notes
+    -----
+    The matrix entries are the same as those of
+    :func:`to_scipy_sparse_matrix` with the default `nodelist`: parallel
+    edges are summed and self-loops appear once on the diagonal.  Edge
+    weights are read from the edge data on each call.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> M = nx.to_scipy_sparse_view(G)
+    >>> print(M.todense())
+    [[0 1 0]
+     [1 0 1]
+     [0 1 0]]
+    >>> M.indptr is nx.to_scipy_sparse_view(G).indptr
+    True
+    >>> M.data[0] = 5
+    Traceback (most recent call last):
+    ...
+    ValueError: assignment destination is read-only
+    """
+    if len(G) == 0:
+        raise nx.NetworkXError("Graph has no nodes or edges")
+    return nx.node_index(G).csr_view(weight, dtype)
+
+
 def _csr_gen_triples(A):
     """Converts a SciPy sparse matrix in **Compressed Sparse Row** format to
     an iterable of weighted edge triples.
@@ -903,6 +1040,10 @@ def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
     indicated by the upper triangle of the matrix `A` will be added to the
     graph.
 
+    If `create_using` is a CSR graph class such as :class:`networkx.CSRGraph`,
+    the graph is built from the arrays of `A` in bulk, see
+    :func:`from_edge_arrays`.
+
     Examples
     --------
     >>> import scipy as sp
@@ -929,6 +1070,21 @@ def from_scipy_sparse_matrix(A, parallel_edges=False, create_using=None,
     AtlasView({0: {'weight': 1}, 1: {'weight': 1}})
 
     """
+    if _has_bulk_constructor(create_using):
+        import numpy as np
+        n, m = A.shape
+        if n != m:
+            raise nx.NetworkXError(
+                "Adjacency matrix is not square. nx,ny=%s" % (A.shape,))
+        # Build the whole graph from the coordinate arrays of `A`.
+        A = A.tocoo()
+        row, col, data = A.row, A.col, A.data
+        if A.dtype.kind in ('i', 'u') and parallel_edges and \
+                issubclass(create_using, nx.MultiGraph):
+            row, col = np.repeat(row, data), np.repeat(col, data)
+            data = np.ones(len(row), dtype=A.dtype)
+        return _from_adjacency_arrays(create_using, n, row, col,
+                                      {edge_attribute: data})
     G = nx.empty_graph(0, create_using)
     n, m = A.shape
     if n != m:
@@ -1061,6 +1217,22 @@ def to_numpy_array(G, nodelist=None, dtype=None, order=None,
 
     """
     import numpy as np
+    from networkx.classes.nodeindex import _cached_node_index
+
+    if G.is_multigraph():
+        operator = {sum: np.nansum, min: np.nanmin, max: np.nanmax}
+        try:
+            op = operator[multigraph_weight]
+        except Exception:
+            raise ValueError('multigraph_weight must be sum, min, or max')
+
+    # All nodes in graph order: use the cached adjacency structure
+    cached = _cached_node_index(G, nodelist)
+    if cached is not None:
+        A = _cached_numpy_array(cached, multigraph_weight, weight, order)
+        if A is not None:
+            A[np.isnan(A)] = nonedge
+            return np.asarray(A, dtype=dtype)
 
     if nodelist is None:
         nodelist = list(G)
@@ -1109,12 +1281,6 @@ def to_numpy_array(G, nodelist=None, dtype=None, order=None,
         # Handle MultiGraphs and MultiDiGraphs
         A = np.full((nlen, nlen), np.nan, order=order)
         # use numpy nan-aware operations
-        operator = {sum: np.nansum, min: np.nanmin, max: np.nanmax}
-        try:
-            op = operator[multigraph_weight]
-        except Exception:
-            raise ValueError('multigraph_weight must be sum, min, or max')
-
         for u, v, attrs in G.edges(data=True):
             if (u in nodeset) and (v in nodeset):
                 i, j = index[u], index[v]
@@ -1139,6 +1305,32 @@ def to_numpy_array(G, nodelist=None, dtype=None, order=None,
     return A
 
 
+def _cached_numpy_array(index, multigraph_weight, weight, order):
+    """Returns the adjacency array of `to_numpy_array` from a `NodeIndex`.
+
+    Nonedges are nan.  Returns None if the result would differ from the
+    edge by edge construction, i.e. for nan weights of multigraph edges.
+    """
+    import numpy as np
+    n = len(index)
+    rows = index.rows()
+    cols = index.indices
+    data = index.edge_weights(weight, 1, float)
+    A = np.full((n, n), np.nan, order=order)
+    if not index.multigraph:
+        A[rows, cols] = data
+        return A
+    if np.isnan(data).any():
+        return None
+    ufunc, initial = {sum: (np.add, 0.0), min: (np.minimum, np.inf),
+                      max: (np.maximum, -np.inf)}[multigraph_weight]
+    flat = rows * n + cols
+    reduced = np.full(n * n, initial)
+    ufunc.at(reduced, flat, data)
+    A.flat[flat] = reduced[flat]
+    return A
+
+
 def from_numpy_array(A, parallel_edges=False, create_using=None):
     """Returns a graph from NumPy array.
 
@@ -1229,3 +1421,142 @@ def from_numpy_array(A, parallel_edges=False, create_using=None):
     """
     return from_numpy_matrix(A, parallel_edges=parallel_edges,
                              create_using=create_using)
+
+
+def from_edge_arrays(src, dst, create_using=None, nodes=None, dedup=None,
+                     **attr_columns):
+    """Returns a graph from arrays of edge endpoints and edge attributes.
+
+    Parameters
+    ----------
+    src, dst : array_like
+        One-dimensional arrays of the same length holding the source and
+        target node of each edge.
+
+    create_using : NetworkX graph constructor, optional (default=nx.Graph)
+       Graph type to create. If graph instance, then cleared before populated.
+
+    nodes : list, range or array_like, optional (default=None)
+        The nodes of the graph, in order.  It must contain every node of
+        `src` and `dst` and may contain isolated nodes.  If None, the nodes
+        are the distinct values of `src` and `dst` in sorted order.
+
+    dedup : bool, optional (default=None)
+        If True, repeated edges are merged into one edge holding the
+        attributes of the last of them.  If False, multigraphs get one
+        edge per entry of the arrays.  If None, repeated edges are merged
+        for graphs and kept for multigraphs.
+
+    attr_columns : keyword arguments, optional
+        Edge attributes as ``name=values`` where `values` is an array with
+        one entry per edge.
+
+    Returns
+    -------
+    G : graph
+        A graph of the type given by `create_using`.
+
+    Raises
+    ------
+    NetworkXError
+        If `src`, `dst` and the attribute arrays do not have the same
+        length, or if `nodes` holds duplicates or lacks a node of `src`
+        or `dst`.
+
+    Notes
+    -----
+    If `create_using` is one of the CSR graph classes, e.g.
+    :class:`~networkx.CSRGraph`, the graph is built by
+    :meth:`~networkx.CSRGraph.from_edge_arrays` in a few vectorized passes
+    without creating any Python object per edge.  This is by far the
+    fastest and most compact way to load a large edge list.  Other graph
+    classes store a dict per edge; the arrays are converted to lists and
+    their edges added by :meth:`~networkx.Graph.add_edges_from`.
+
+    See Also
+    --------
+    from_scipy_sparse_matrix, from_pandas_edgelist
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> src = np.array([0, 1, 2])
+    >>> dst = np.array([1, 2, 0])
+    >>> G = nx.from_edge_arrays(src, dst, weight=np.array([0.5, 1.0, 2.0]))
+    >>> G[2][0]
+    {'weight': 2.0}
+    >>> C = nx.from_edge_arrays(src, dst, create_using=nx.CSRDiGraph,
+    ...                         nodes=range(4))
+    >>> list(C.edges)
+    [(0, 1), (1, 2), (2, 0)]
+    >>> list(C.nodes)
+    [0, 1, 2, 3]
+    """
+    return _from_edge_arrays(src, dst, create_using, nodes, dedup,
+                             attr_columns)
+
+
+def _from_edge_arrays(src, dst, create_using, nodes, dedup, columns):
+    """Builds the graph of `from_edge_arrays`.
+
+    `columns` is a dict of edge attribute arrays, so that attribute names
+    need not be strings.
+    """
+    if _has_bulk_constructor(create_using):
+        return create_using._from_arrays(src, dst, nodes, dedup, columns)
+    import numpy as np
+    from networkx.classes.csrgraph import _label_indices, _sorted_edges
+    G = nx.empty_graph(0, create_using)
+    src = np.asarray(src)
+    dst = np.asarray(dst)
+    if src.ndim != 1 or src.shape != dst.shape:
+        msg = "src and dst must be one-dimensional and of equal length"
+        raise nx.NetworkXError(msg)
+    columns = {name: np.asarray(values) for name, values in columns.items()}
+    for name, values in columns.items():
+        if values.shape != src.shape:
+            msg = "Edge attribute %r must have one value per edge"
+            raise nx.NetworkXError(msg % (name,))
+    if nodes is None:
+        nodes = np.unique(np.concatenate([src, dst])).tolist()
+        rows = cols = None
+    else:
+        # endpoints missing from nodes raise as in the CSR classes
+        rows = _label_indices(nodes, src)
+        cols = _label_indices(nodes, dst)
+        nodes = list(nodes)
+    G.add_nodes_from(nodes)
+    if dedup and G.is_multigraph():
+        if rows is None:
+            rows = _label_indices(nodes, src)
+            cols = _label_indices(nodes, dst)
+        perm = _sorted_edges(rows, cols, len(nodes), G.is_directed(),
+                             True)[0]
+        perm.sort()
+        src = src[perm]
+        dst = dst[perm]
+        columns = {name: values[perm] for name, values in columns.items()}
+    if columns:
+        names = list(columns)
+        data = zip(*(columns[name].tolist() for name in names))
+        edges = zip(src.tolist(), dst.tolist(),
+                    map(dict, map(zip, itertools.repeat(names), data)))
+    else:
+        edges = zip(src.tolist(), dst.tolist())
+    G.add_edges_from(edges)
+    return G
+
+
+def _from_adjacency_arrays(create_using, n, row, col, columns):
+    """Returns a graph on nodes ``0 .. n-1`` with the edges of the nonzero
+    adjacency matrix entries at `row`, `col`.
+
+    For undirected multigraphs only the upper triangle is used.
+    """
+    if issubclass(create_using, nx.MultiGraph) and \
+            not issubclass(create_using, nx.DiGraph):
+        upper = row <= col
+        row = row[upper]
+        col = col[upper]
+        columns = {name: values[upper] for name, values in columns.items()}
+    return _from_edge_arrays(row, col, create_using, range(n), None, columns)
@@ -466,7 +466,7 @@ def fruchterman_reingold_layout(G,
         # Sparse matrix
         if len(G) < 500:  # sparse solver for large graphs
             raise ValueError
-        A = nx.to_scipy_sparse_matrix(G, weight=weight, dtype='f')
+        A = nx.to_scipy_sparse_view(G, weight=weight, dtype='f')
         if k is None and fixed is not None:
             # We must adjust k by domain size for layouts not near 1x1
             nnodes, _ = A.shape
@@ -572,11 +572,12 @@ def _sparse_fruchterman_reingold(A, k=None, pos=None, fixed=None,
     except ImportError:
         msg = "_sparse_fruchterman_reingold() scipy numpy: http://scipy.org/ "
         raise ImportError(msg)
-    # make sure we have a LIst of Lists representation
+    # make sure we have a Compressed Sparse Row representation; a CSR
+    # matrix, possibly read-only, is used as is
     try:
-        A = A.tolil()
+        A = A.tocsr()
     except:
-        A = (coo_matrix(A)).tolil()
+        A = (coo_matrix(A)).tocsr()
 
     if pos is None:
         # random initial positions
@@ -613,7 +614,9 @@ def _sparse_fruchterman_reingold(A, k=None, pos=None, fixed=None,
             # enforce minimum distance of 0.01
             distance = np.where(distance < 0.01, 0.01, distance)
             # the adjacency matrix row
-            Ai = np.asarray(A.getrowview(i).toarray())
+            Ai = np.zeros(nnodes, dtype=A.dtype)
+            start, stop = A.indptr[i], A.indptr[i + 1]
+            np.add.at(Ai, A.indices[start:stop], A.data[start:stop])
             # displacement "force"
             displacement[:, i] +=\
                 (delta * (k * k / distance**2 - Ai * distance / k)).sum(axis=1)
@@ -4,31 +4,6 @@ import math
 import networkx as nx
 from networkx.utils import py_random_state
 
-# Accommodates for both SciPy and non-SciPy implementations..
-try:
-    from scipy.special import zeta as _zeta
-
-    def zeta(x, q, tolerance):
-        return _zeta(x, q)
-except ImportError:
-    def zeta(x, q, tolerance):
-        """The Hurwitz zeta function, or the Riemann zeta function of two
-        arguments.
-
-        ``x`` must be greater than one and ``q`` must be positive.
-
-        This function repeatedly computes subsequent partial sums until
-        convergence, as decided by ``tolerance``.
-        """
-        z = 0
-        z_prev = -float('inf')
-        k = 0
-        while abs(z - z_prev) > tolerance:
-            z_prev = z
-            z += 1 / ((k + q) ** x)
-            k += 1
-        return z
-
 __all__ = ['caveman_graph', 'connected_caveman_graph',
            'relaxed_caveman_graph', 'random_partition_graph',
            'planted_partition_graph', 'gaussian_random_partition_graph',
@@ -36,6 +11,32 @@ __all__ = ['caveman_graph', 'connected_caveman_graph',
            'LFR_benchmark_graph']
 
 
+def zeta(x, q, tolerance):
+    """The Hurwitz zeta function, or the Riemann zeta function of two
+    arguments.
+
+    ``x`` must be greater than one and ``q`` must be positive.
+
+    SciPy is used when available.  Otherwise this function repeatedly
+    computes subsequent partial sums until convergence, as decided by
+    ``tolerance``.
+    """
+    try:
+        from scipy.special import zeta as _zeta
+    except ImportError:
+        pass
+    else:
+        return _zeta(x, q)
+    z = 0
+    z_prev = -float('inf')
+    k = 0
+    while abs(z - z_prev) > tolerance:
+        z_prev = z
+        z += 1 / ((k + q) ** x)
+        k += 1
+    return z
+
+
 def caveman_graph(l, k):
     """Returns a caveman graph of `l` cliques of size `k`.
 
@@ -9,12 +9,6 @@ from itertools import (
 )
 from math import sqrt
 import math
-try:
-    from scipy.spatial import cKDTree as KDTree
-except ImportError:
-    _is_scipy_available = False
-else:
-    _is_scipy_available = True
 
 import networkx as nx
 from networkx.utils import nodes_or_number, py_random_state
@@ -34,12 +28,26 @@ def euclidean(x, y):
     return sqrt(sum((a - b) ** 2 for a, b in zip(x, y)))
 
 
+def _is_scipy_available():
+    """Returns True if the KDTree of SciPy can be used.
+
+    SciPy is only imported when a geometric graph is built, so that
+    importing NetworkX does not load it.
+    """
+    try:
+        import scipy.spatial
+    except ImportError:
+        return False
+    return True
+
+
 def _fast_edges(G, radius, p):
     """Returns edge list of node pairs within `radius` of each other
        using scipy KDTree and Minkowski distance metric `p`
 
     Requires scipy to be installed.
     """
+    from scipy.spatial import cKDTree as KDTree
     pos = nx.get_node_attributes(G, 'pos')
     nodes, coords = list(zip(*pos.items()))
     kdtree = KDTree(coords)  # Cannot provide generator.
@@ -150,7 +158,7 @@ def random_geometric_graph(n, radius, dim=2, pos=None, p=2, seed=None):
         pos = {v: [seed.random() for i in range(dim)] for v in nodes}
     nx.set_node_attributes(G, pos, 'pos')
 
-    if _is_scipy_available:
+    if _is_scipy_available():
         edges = _fast_edges(G, radius, p)
     else:
         edges = _slow_edges(G, radius, p)
@@ -291,7 +299,7 @@ def soft_random_geometric_graph(n, radius, dim=2, pos=None, p=2, p_dist=None,
         else:
             return False
 
-    if _is_scipy_available:
+    if _is_scipy_available():
         edges = _fast_edges(G, radius, p)
         G.add_edges_from(filter(should_join, edges))
     else:
@@ -777,7 +785,7 @@ def thresholded_random_geometric_graph(n, radius, theta, dim=2,
         else:
             return False
 
-    if _is_scipy_available:
+    if _is_scipy_available():
         edges = _fast_edges(G, radius, p)
         G.add_edges_from(filter(should_join, edges))
     else:
@@ -2,7 +2,6 @@
 Generators for random intersection graphs.
 """
 import networkx as nx
-from networkx.algorithms import bipartite
 from networkx.utils import py_random_state
 
 __all__ = ['uniform_random_intersection_graph',
@@ -40,7 +39,7 @@ def uniform_random_intersection_graph(n, m, p, seed=None):
        An equivalence theorem relating the evolution of the g(n, m, p)
        and g(n, p) models. Random Struct. Algorithms 16, 2 (2000), 156–176.
     """
-    G = bipartite.random_graph(n, m, p, seed)
+    G = nx.bipartite.random_graph(n, m, p, seed)
     return nx.projected_graph(G, range(n))
 
 
@@ -15,9 +15,8 @@ be found about `Triangular Tiling`_, and `Square, Hex and Triangle Grids`_
 
 from math import sqrt
 
+import networkx as nx
 from networkx.classes import set_node_attributes
-from networkx.algorithms.minors import contracted_nodes
-from networkx.algorithms.operators.product import cartesian_product
 from networkx.exception import NetworkXError
 from networkx.relabel import relabel_nodes
 from networkx.utils import flatten
@@ -122,7 +121,7 @@ def grid_graph(dim, periodic=False):
     G = func(dim[0])
     for current_dim in dim[1:]:
         Gnew = func(current_dim)
-        G = cartesian_product(Gnew, G)
+        G = nx.cartesian_product(Gnew, G)
     # graph G is done but has labels of the form (1, (2, (3, 1))) so relabel
     H = relabel_nodes(G, flatten)
     return H
@@ -231,9 +230,9 @@ def triangular_lattice_graph(m, n, periodic=False, with_positions=True,
     # identify boundary nodes if periodic
     if periodic is True:
         for i in cols:
-            H = contracted_nodes(H, (i, 0), (i, m))
+            H = nx.contracted_nodes(H, (i, 0), (i, m))
         for j in rows[:m]:
-            H = contracted_nodes(H, (0, j), (N, j))
+            H = nx.contracted_nodes(H, (0, j), (N, j))
     elif n % 2:
         # remove extra nodes
         H.remove_nodes_from(((N, j) for j in rows[1::2]))
@@ -325,11 +324,11 @@ def hexagonal_lattice_graph(m, n, periodic=False, with_positions=True,
     # identify boundary nodes if periodic
     if periodic:
         for i in cols[:n]:
-            G = contracted_nodes(G, (i, 0), (i, M))
+            G = nx.contracted_nodes(G, (i, 0), (i, M))
         for i in cols[1:]:
-            G = contracted_nodes(G, (i, 1), (i, M + 1))
+            G = nx.contracted_nodes(G, (i, 1), (i, M + 1))
         for j in rows[1:M]:
-            G = contracted_nodes(G, (0, j), (n, j))
+            G = nx.contracted_nodes(G, (0, j), (n, j))
         G.remove_node((n, M))
 
     # calc position in embedded space
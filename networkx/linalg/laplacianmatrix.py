@@ -46,9 +46,10 @@ def laplacian_matrix(G, nodelist=None, weight='weight'):
     """
     import scipy.sparse
     if nodelist is None:
-        nodelist = list(G)
-    A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  format='csr')
+        A = nx.to_scipy_sparse_view(G, weight=weight)
+    else:
+        A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                      format='csr')
     n, m = A.shape
     diags = A.sum(axis=1)
     D = scipy.sparse.spdiags(diags.flatten(), [0], m, n, format='csr')
@@ -110,9 +111,10 @@ def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
     import scipy
     import scipy.sparse
     if nodelist is None:
-        nodelist = list(G)
-    A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  format='csr')
+        A = nx.to_scipy_sparse_view(G, weight=weight)
+    else:
+        A = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
+                                      format='csr')
     n, m = A.shape
     diags = A.sum(axis=1).flatten()
     D = scipy.sparse.spdiags(diags, [0], m, n, format='csr')
@@ -0,0 +1,703 @@
+"""
+*************
+Binary Graphs
+*************
+Read and write graphs in a compact binary format that is memory mapped
+when read.
+
+Unlike pickles, which store the nested dicts of a graph object by object,
+the binary format stores a graph the way the CSR graph classes (see
+:mod:`networkx.classes.csrgraph`) hold it: the nodes, the adjacency in
+compressed sparse row form and one typed column per node or edge
+attribute, each as a flat array.  Reading maps the file into memory and
+builds a CSR graph directly on top of these arrays, so that opening a
+large graph takes a fraction of a second and only the parts of the file
+that are used are ever read from disk.
+
+Only plain data is stored, and it is read back without executing any
+code, so that files from untrusted sources can be read safely.  Node
+labels, attribute names and values that are not ints, floats or strings
+must be Python literals (tuples, lists, dicts, ``None``, booleans, bytes,
+complex numbers...) that :func:`ast.literal_eval` can read back.
+
+Examples
+--------
+>>> G = nx.Graph()
+>>> G.add_edge('a', 'b', weight=0.5)
+>>> G.add_edge('b', 'c', weight=1.5, color='red')
+>>> nx.write_binary(G, 'test.nxb')
+>>> H = nx.read_binary('test.nxb')
+>>> type(H).__name__
+'CSRGraph'
+>>> sorted(H.edges(data='weight'))
+[('a', 'b', 0.5), ('b', 'c', 1.5)]
+>>> H['b']['c']['color']
+'red'
+
+Format
+------
+All integers are stored in the byte order of the writing machine, which
+is recorded in the header.
+
+- 8 bytes: the magic string ``b'NXBIN1\\r\\n'``.
+- Sections, each starting at a multiple of 64 bytes: the arrays of the
+  graph, stored as raw machine values.
+- The header: the UTF-8 encoded text of a Python dict literal giving
+  the kind of graph, its graph attributes and the offset, length and
+  type of each array.
+- 24 bytes: the offset and length of the header as two unsigned 64 bit
+  integers, followed by the magic string again.
+
+The arrays are those of the CSR graph classes: ``indptr`` and
+``indices`` for the adjacency (and ``edge_ids`` mapping the slots of
+undirected graphs to edge numbers), the same arrays for the predecessors
+of directed graphs, the node labels unless the nodes are ``0 .. n-1``,
+the edge keys of multigraphs and the attribute columns.  Int and float
+columns are stored as 64 bit values with an optional byte mask of the
+rows holding a value.  Other columns store the UTF-8 text of each value
+(for strings) or of its representation (for other literals) followed by
+an array of offsets into that text.
+"""
+from array import array
+import ast
+import math
+import struct
+import sys
+
+import networkx as nx
+from networkx.classes.columns import AttributeColumns, _typecode_for
+from networkx.classes.csrgraph import _CSR, _RangeIndex, _index_typecode
+from networkx.utils import open_file
+
+__all__ = ['read_binary', 'write_binary']
+
+_MAGIC = b'NXBIN1\r\n'
+_VERSION = 1
+_ALIGN = 64
+# number of values packed into an array before it is written
+_CHUNK = 1 << 16
+_TRAILER = struct.Struct('<QQ')
+
+_MISSING = object()
+
+
+def _is_literal(value, top=True):
+    """Returns True if ``ast.literal_eval(repr(value)) == value``.
+
+    Non-finite floats have no literal; they are accepted at the top level
+    only, where they are handled by `_decode_literal`.
+    """
+    t = type(value)
+    if t in (str, bytes, int, bool, type(None)):
+        return True
+    if t is float:
+        return top or math.isfinite(value)
+    if t is complex:
+        return math.isfinite(value.real) and math.isfinite(value.imag)
+    if t in (tuple, list) or (t is set and value):
+        return all(_is_literal(v, False) for v in value)
+    if t is dict:
+        return all(_is_literal(k, False) and _is_literal(v, False)
+                   for k, v in value.items())
+    return False
+
+
+def _check_literal(value, what):
+    if not _is_literal(value):
+        msg = "%s %r can not be stored in the binary format."
+        raise nx.NetworkXError(msg % (what, value))
+
+
+_SPECIAL_FLOATS = {'nan': float('nan'), 'inf': float('inf'),
+                   '-inf': float('-inf')}
+
+
+def _decode_literal(text):
+    try:
+        return _SPECIAL_FLOATS[text]
+    except KeyError:
+        return ast.literal_eval(text)
+
+
+def _kind_of(value):
+    """Returns how a column holding `value` is stored."""
+    typecode = _typecode_for(value)
+    if typecode is not None:
+        return typecode
+    if type(value) is str:
+        return 'str'
+    return 'literal'
+
+
+class _EncodedValues(object):
+    """Read-only sequence decoding the values of a text column on access."""
+    __slots__ = ('_offsets', '_data', '_literal')
+
+    def __init__(self, offsets, data, literal):
+        self._offsets = offsets
+        self._data = data
+        self._literal = literal
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        text = str(self._data[self._offsets[row]:self._offsets[row + 1]],
+                   'utf-8')
+        if self._literal:
+            return _decode_literal(text)
+        return text
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+
+class _ColumnScan(object):
+    """Finds the storage kind of each attribute from its values."""
+
+    def __init__(self):
+        self.kinds = {}
+        self.counts = {}
+
+    def add(self, data):
+        kinds = self.kinds
+        for name, value in data.items():
+            kind = kinds.get(name)
+            if kind is None:
+                _check_literal(name, 'Attribute name')
+                kind = _kind_of(value)
+                self.counts[name] = 0
+            elif kind != 'literal' and kind != _kind_of(value):
+                kind = 'literal'
+            if kind == 'literal':
+                _check_literal(value, 'Attribute value')
+            kinds[name] = kind
+            self.counts[name] += 1
+
+
+class _Writer(object):
+    """Writes the sections of a binary graph file one after the other."""
+
+    def __init__(self, fobj):
+        self.fobj = fobj
+        self.pos = 0
+        self.sections = []
+        self._write(_MAGIC)
+
+    def _write(self, data):
+        self.fobj.write(data)
+        self.pos += memoryview(data).nbytes
+
+    def _align(self):
+        pad = -self.pos % _ALIGN
+        if pad:
+            self._write(bytes(pad))
+
+    def buffers(self, typecode, buffers):
+        """Writes the buffers as one section; returns its descriptor."""
+        self._align()
+        start = self.pos
+        for buf in buffers:
+            self._write(buf)
+        return (start, self.pos - start, typecode)
+
+    def values(self, typecode, values):
+        """Writes an iterable of numbers as one typed section."""
+        return self.buffers(typecode, _chunks(typecode, values))
+
+    def text(self, values, literal):
+        """Writes an iterable of strings (or literals) as a text column.
+
+        Returns the descriptors of the offsets and of the text.
+        """
+        offsets = array('q', [0])
+        self._align()
+        start = self.pos
+        chunk = []
+        size = 0
+        for value in values:
+            if literal:
+                value = repr(value)
+            data = value.encode('utf-8')
+            chunk.append(data)
+            size += len(data)
+            offsets.append(size)
+            if len(chunk) == _CHUNK:
+                self._write(b''.join(chunk))
+                chunk = []
+        self._write(b''.join(chunk))
+        text = (start, self.pos - start, 'B')
+        return self.buffers('q', [offsets]), text
+
+    def finish(self, header):
+        self._align()
+        data = repr(header).encode('utf-8')
+        start = self.pos
+        self._write(data)
+        self._write(_TRAILER.pack(start, len(data)) + _MAGIC)
+
+
+def _chunks(typecode, values):
+    """Packs an iterable of numbers into typed arrays of bounded size."""
+    chunk = array(typecode)
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == _CHUNK:
+            yield chunk
+            chunk = array(typecode)
+    yield chunk
+
+
+def _write_column(writer, kind, values, complete):
+    """Writes a column and returns its descriptor.
+
+    `values` is a function returning an iterator over the value of each
+    row, with `_MISSING` for rows without the attribute; it is called
+    once more to write the mask of rows holding a value unless
+    `complete` is True.
+    """
+    mask = None if complete else writer.buffers('B', _mask_chunks(values()))
+    if kind in ('d', 'q'):
+        zero = 0.0 if kind == 'd' else 0
+        data = writer.values(kind, (zero if v is _MISSING else v
+                                    for v in values()))
+        return (kind, data, mask)
+    if kind == 'str':
+        offsets, text = writer.text(('' if v is _MISSING else v
+                                     for v in values()), False)
+    else:
+        offsets, text = writer.text((None if v is _MISSING else v
+                                     for v in values()), True)
+    return (kind, offsets, text, mask)
+
+
+def _mask_chunks(values):
+    chunk = bytearray()
+    for value in values:
+        chunk.append(value is not _MISSING)
+        if len(chunk) == _CHUNK:
+            yield chunk
+            chunk = bytearray()
+    yield chunk
+
+
+def _write_buffer_column(writer, columns, name, rows):
+    """Writes column `name` of a CSR graph, copying typed buffers as is."""
+    values, present = columns.column(name)
+    kind = columns.typecode(name)
+    size = min(len(values), rows)
+    if kind is not None:
+        if present is not None:
+            mask = bytearray(memoryview(present)[:size])
+            mask.extend(bytes(rows - size))
+            mask = writer.buffers('B', [mask])
+        elif size < rows:
+            mask = writer.buffers('B', [b'\x01' * size, bytes(rows - size)])
+        else:
+            mask = None
+        pad = array(kind, bytes((rows - size) * 8))
+        data = writer.buffers(kind, [memoryview(values)[:size], pad])
+        return (kind, data, mask)
+    scan = _ColumnScan()
+    for row in range(rows):
+        value = columns.get(row, name, _MISSING)
+        if value is not _MISSING:
+            scan.add({name: value})
+    kind = scan.kinds.get(name, 'literal')
+    complete = scan.counts.get(name, 0) == rows
+    return _write_column(writer, kind, lambda: (columns.get(row, name,
+                                                            _MISSING)
+                                                for row in range(rows)),
+                         complete)
+
+
+def _write_labels(writer, nodes):
+    """Writes the node labels unless they are ``0 .. n-1``."""
+    if isinstance(nodes, range) and nodes.start == 0 and nodes.step == 1:
+        return None
+    kind = None
+    for n in nodes:
+        k = _kind_of(n)
+        if kind is None:
+            kind = k
+        elif kind != k:
+            kind = 'literal'
+        if kind == 'literal':
+            _check_literal(n, 'Node')
+    if kind == 'q' and all(i == n for i, n in enumerate(nodes)):
+        return None
+    if kind in ('q', 'd'):
+        return (kind, writer.values(kind, nodes), None)
+    return (kind,) + writer.text(nodes, kind == 'literal') + (None,)
+
+
+def _sorted_items(nbrs, index, multigraph):
+    """Returns the ``(j, [(key, data), ...])`` of a row sorted by `j`."""
+    items = [(index[v], d) for v, d in nbrs.items()]
+    items.sort(key=lambda item: item[0])
+    if multigraph:
+        return [(j, list(d.items())) for j, d in items]
+    return [(j, [(None, d)]) for j, d in items]
+
+
+def _write_dict_graph(writer, G, header):
+    """Streams the sections of a graph stored in dicts.
+
+    Each section is produced by its own pass over the graph, so that
+    besides the graph only the node numbering and a few arrays of one
+    number per node are kept in memory.
+    """
+    directed = G.is_directed()
+    multigraph = G.is_multigraph()
+    nodes = list(G)
+    index = {n: i for i, n in enumerate(nodes)}
+    n = len(nodes)
+    adj = G._succ if directed else G._adj
+
+    def rows(adj):
+        for u in nodes:
+            yield _sorted_items(adj[u], index, multigraph)
+
+    # first pass: degrees, edge count and attribute kinds
+    node_scan = _ColumnScan()
+    for data in G._node.values():
+        node_scan.add(data)
+    edge_scan = _ColumnScan()
+    key_scan = _ColumnScan()
+    degrees = array('q')
+    # number of slots of row i holding edges numbered from row i
+    own = array('q')
+    for i, row in enumerate(rows(adj)):
+        degree = count = 0
+        for j, items in row:
+            degree += len(items)
+            if directed or j >= i:
+                count += len(items)
+                for key, d in items:
+                    edge_scan.add(d)
+                    if multigraph:
+                        key_scan.add({'key': key})
+        degrees.append(degree)
+        own.append(count)
+    nnz = sum(degrees)
+    m = sum(own)
+    typecode = _index_typecode(max(n, nnz) + 1)
+
+    def indptr(counts):
+        total = 0
+        yield total
+        for c in counts:
+            total += c
+            yield total
+
+    def indices(adj):
+        for row in rows(adj):
+            for j, items in row:
+                for _ in items:
+                    yield j
+
+    def first_ids():
+        # the first edge number of each row, following `own`
+        return array('q', indptr(own))
+
+    sections = header['sections']
+    sections['indptr'] = writer.values(typecode, indptr(degrees))
+    sections['indices'] = writer.values(typecode, indices(adj))
+    if directed:
+        # Edge k is slot k of the successors.  Walking the predecessors
+        # of v in increasing order also walks the rows of these in
+        # increasing order, so `cursor[u]` is the slot of edge u -> v.
+        def pred_ids():
+            cursor = first_ids()
+            for v, row in enumerate(rows(G._pred)):
+                for u, items in row:
+                    for _ in items:
+                        yield cursor[u]
+                        cursor[u] += 1
+
+        in_degrees = (sum(len(d) for d in G._pred[v].values())
+                      if multigraph else len(G._pred[v]) for v in nodes)
+        sections['pred_indptr'] = writer.values(typecode, indptr(in_degrees))
+        sections['pred_indices'] = writer.values(typecode, indices(G._pred))
+        sections['pred_edge_ids'] = writer.values(typecode, pred_ids())
+    else:
+        # Edges are numbered row by row from their smaller endpoint.
+        # Later rows k meet row i in increasing order, which is the order
+        # of the edges numbered from row i after its self-loops, so
+        # `cursor[i]` is the number of edge i - k.
+        def edge_ids():
+            cursor = first_ids()
+            for i, row in enumerate(rows(adj)):
+                p = cursor[i]
+                for j, items in row:
+                    for _ in items:
+                        if j >= i:
+                            yield p
+                            p += 1
+                        else:
+                            yield cursor[j]
+                            cursor[j] += 1
+                    if j == i:
+                        cursor[i] = p
+
+        sections['edge_ids'] = writer.values(typecode, edge_ids())
+
+    def edge_data():
+        for i, row in enumerate(rows(adj)):
+            for j, items in row:
+                if directed or j >= i:
+                    for key, d in items:
+                        yield key, d
+
+    header['labels'] = _write_labels(writer, nodes)
+
+    def node_values(name):
+        return lambda: (d.get(name, _MISSING) for d in G._node.values())
+
+    def edge_values(name):
+        return lambda: (d.get(name, _MISSING) for _, d in edge_data())
+
+    header['node_columns'] = [
+        (name, _write_column(writer, kind, node_values(name),
+                             node_scan.counts[name] == n))
+        for name, kind in node_scan.kinds.items()]
+    header['edge_columns'] = [
+        (name, _write_column(writer, kind, edge_values(name),
+                             edge_scan.counts[name] == m))
+        for name, kind in edge_scan.kinds.items()]
+    if multigraph:
+        kind = key_scan.kinds.get('key', 'q')
+        header['keys'] = _write_column(
+            writer, kind, lambda: (key for key, _ in edge_data()), True)
+    header['nodes'] = n
+    header['edges'] = m
+
+
+def _write_csr_graph(writer, G, header):
+    """Writes the arrays of a CSR graph as they are stored."""
+    n = len(G._nodelist)
+    m = G._num_edges
+    sections = header['sections']
+    csr = G._csr
+    typecode = _format(csr.indptr)
+    sections['indptr'] = writer.buffers(typecode, [csr.indptr])
+    sections['indices'] = writer.buffers(typecode, [csr.indices])
+    if G.is_directed():
+        pred = G._pred_csr
+        sections['pred_indptr'] = writer.buffers(typecode, [pred.indptr])
+        sections['pred_indices'] = writer.buffers(typecode, [pred.indices])
+        sections['pred_edge_ids'] = writer.buffers(typecode, [pred.edge_ids])
+    else:
+        sections['edge_ids'] = writer.buffers(typecode, [csr.edge_ids])
+    header['labels'] = _write_labels(writer, G._nodelist)
+    header['node_columns'] = [
+        (name, _write_buffer_column(writer, G.node_columns, name, n))
+        for name in G.node_columns]
+    header['edge_columns'] = [
+        (name, _write_buffer_column(writer, G.edge_columns, name, m))
+        for name in G.edge_columns]
+    if G.is_multigraph():
+        keys = G._edge_keys
+        kind = 'q'
+        for key in keys:
+            if kind != 'literal' and _kind_of(key) != 'q':
+                kind = 'literal'
+            if kind == 'literal':
+                _check_literal(key, 'Edge key')
+        header['keys'] = _write_column(writer, kind, lambda: iter(keys), True)
+    header['nodes'] = n
+    header['edges'] = m
+
+
+def _format(buf):
+    try:
+        return buf.typecode
+    except AttributeError:
+        return buf.format
+
+
+@open_file(1, mode='wb')
+def write_binary(G, path):
+    """Writes graph `G` in the NetworkX binary format.
+
+    The graph is written section by section.  The arrays of CSR graphs
+    are written as they are; other graphs are walked once per section,
+    so that the graph is never held in memory in a second form.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph.  Node labels, graph attributes and attribute
+       names and values that are not ints, floats or strings must be
+       Python literals.
+
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed; compressed
+       files can not be memory mapped when read.
+
+    Raises
+    ------
+    NetworkXError
+        If a node, key, attribute name or value is not a Python literal.
+
+    See Also
+    --------
+    read_binary
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, 'test.nxb')
+    """
+    for name, value in G.graph.items():
+        _check_literal(name, 'Attribute name')
+        _check_literal(value, 'Attribute value')
+    header = {'version': _VERSION, 'byteorder': sys.byteorder,
+              'directed': G.is_directed(), 'multigraph': G.is_multigraph(),
+              'graph': dict(G.graph), 'sections': {}}
+    writer = _Writer(path)
+    if getattr(G, '_csr', None) is not None and not hasattr(G, '_graph'):
+        _write_csr_graph(writer, G, header)
+    else:
+        _write_dict_graph(writer, G, header)
+    writer.finish(header)
+
+
+def _open_buffer(fobj, memory_map):
+    """Returns a read-only byte memoryview of the content of `fobj`."""
+    if memory_map and hasattr(fobj, 'raw'):
+        import mmap
+        try:
+            fileno = fobj.fileno()
+        except Exception:
+            pass
+        else:
+            data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            return memoryview(data)
+    return memoryview(fobj.read())
+
+
+@open_file(0, mode='rb')
+def read_binary(path, memory_map=True):
+    """Reads a graph in the NetworkX binary format.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+
+    memory_map : bool, optional (default=True)
+       If True, an uncompressed file is mapped into memory and the arrays
+       of the graph are read from disk as they are used.  If False, the
+       whole file is read into memory.
+
+    Returns
+    -------
+    G : CSRGraph, CSRDiGraph, CSRMultiGraph or CSRMultiDiGraph
+       The graph, whose structure is frozen.  Use e.g. ``nx.Graph(G)``
+       to get a graph that can be modified.
+
+    Raises
+    ------
+    NetworkXError
+        If the file is not in the binary format or was written on a
+        machine of different byte order.
+
+    Notes
+    -----
+    The arrays of the adjacency and the int and float attribute columns
+    are used in place.  Node labels (unless the nodes are ``0 .. n-1``)
+    and the keys of multigraphs are read into memory when the file is
+    opened.  Attribute values of other types are decoded when accessed.
+    Changing an attribute value copies its column into memory.
+
+    A memory mapped file must not be modified while the graph is in use.
+
+    See Also
+    --------
+    write_binary
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, 'test.nxb')
+    >>> H = nx.read_binary('test.nxb')
+    >>> list(H.edges)
+    [(0, 1), (1, 2), (2, 3)]
+    """
+    buf = _open_buffer(path, memory_map)
+    size = buf.nbytes
+    end = _TRAILER.size + len(_MAGIC)
+    if size < len(_MAGIC) + end or bytes(buf[:len(_MAGIC)]) != _MAGIC or \
+            bytes(buf[size - len(_MAGIC):]) != _MAGIC:
+        raise nx.NetworkXError("Not a NetworkX binary graph file.")
+    start, length = _TRAILER.unpack(bytes(buf[size - end:size - len(_MAGIC)]))
+    try:
+        header = ast.literal_eval(str(buf[start:start + length], 'utf-8'))
+    except (ValueError, SyntaxError, UnicodeDecodeError):
+        raise nx.NetworkXError("Corrupted NetworkX binary graph file.")
+    if header.get('version') != _VERSION:
+        msg = "Unsupported NetworkX binary format version %r."
+        raise nx.NetworkXError(msg % header.get('version'))
+    if header['byteorder'] != sys.byteorder:
+        msg = "The file was written on a machine of different byte order."
+        raise nx.NetworkXError(msg)
+
+    def section(desc):
+        offset, nbytes, typecode = desc
+        return buf[offset:offset + nbytes].cast(typecode)
+
+    def column(desc):
+        kind = desc[0]
+        if kind in ('d', 'q'):
+            values = section(desc[1])
+        else:
+            values = _EncodedValues(section(desc[1]), section(desc[2]),
+                                    kind == 'literal')
+        mask = desc[-1]
+        return values, None if mask is None else section(mask)
+
+    n = header['nodes']
+    m = header['edges']
+    if header['labels'] is None:
+        nodes = range(n)
+        index = _RangeIndex(n)
+    else:
+        nodes = list(column(header['labels'])[0])
+        index = {node: i for i, node in enumerate(nodes)}
+    node_columns = AttributeColumns()
+    for name, desc in header['node_columns']:
+        node_columns.set_column(name, *column(desc))
+    edge_columns = AttributeColumns()
+    for name, desc in header['edge_columns']:
+        edge_columns.set_column(name, *column(desc))
+    sections = header['sections']
+    keys = None
+    if header['multigraph']:
+        keys = list(column(header['keys'])[0])
+    directed = header['directed']
+    pred_csr = None
+    if directed:
+        csr = _CSR(section(sections['indptr']), section(sections['indices']))
+        pred_csr = _CSR(section(sections['pred_indptr']),
+                        section(sections['pred_indices']),
+                        section(sections['pred_edge_ids']))
+    else:
+        csr = _CSR(section(sections['indptr']), section(sections['indices']),
+                   section(sections['edge_ids']))
+    if header['multigraph']:
+        cls = nx.CSRMultiDiGraph if directed else nx.CSRMultiGraph
+    else:
+        cls = nx.CSRDiGraph if directed else nx.CSRGraph
+    G = cls()
+    G.graph.update(header['graph'])
+    G._set_storage(nodes, index, node_columns, csr, edge_columns, m, keys,
+                   pred_csr)
+    return G
@@ -0,0 +1,63 @@
+import random
+import unittest
+import networkx as nx
+
+
+class TestApproximateBetweenness(unittest.TestCase):
+    def assertWithin(self, G, epsilon, **kwargs):
+        n = len(G)
+        exact = nx.betweenness_centrality(G, weight=kwargs.get('weight'))
+        approx = nx.approximate_betweenness_centrality(
+            G, epsilon=epsilon, seed=1, **kwargs)
+        self.assertEqual(list(approx), list(G))
+        for v in G:
+            self.assertLessEqual(abs(approx[v] - exact[v]),
+                                 epsilon * n / (n - 2))
+
+    def test_error_bound(self):
+        self.assertWithin(nx.karate_club_graph(), 0.05)
+        self.assertWithin(nx.gnm_random_graph(100, 300, seed=2), 0.05)
+        self.assertWithin(nx.gnm_random_graph(80, 300, seed=3,
+                                              directed=True), 0.05)
+        G = nx.gnm_random_graph(80, 200, seed=4)
+        rnd = random.Random(4)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rnd.randint(1, 4)
+        self.assertWithin(G, 0.05, weight='weight')
+        # several components
+        self.assertWithin(nx.disjoint_union(nx.path_graph(10),
+                                            nx.star_graph(8)), 0.05)
+
+    def test_unnormalized(self):
+        G = nx.path_graph(5)
+        approx = nx.approximate_betweenness_centrality(
+            G, epsilon=0.05, normalized=False, seed=1)
+        exact = nx.betweenness_centrality(G, normalized=False)
+        for v in G:
+            self.assertLessEqual(abs(approx[v] - exact[v]), 0.05 * 10)
+
+    def test_top_k(self):
+        G = nx.barbell_graph(15, 4)
+        top = nx.approximate_betweenness_centrality(G, top_k=2, seed=1)
+        self.assertEqual(list(top), [16, 17])
+        G = nx.star_graph(30)
+        top = nx.approximate_betweenness_centrality(G, top_k=1, seed=1)
+        self.assertEqual(list(top), [0])
+
+    def test_small_graphs(self):
+        for G in (nx.empty_graph(2), nx.complete_graph(5)):
+            self.assertEqual(nx.approximate_betweenness_centrality(G),
+                             dict.fromkeys(G, 0.0))
+
+    def test_arguments(self):
+        G = nx.path_graph(4)
+        self.assertRaises(ValueError, nx.approximate_betweenness_centrality,
+                          G, epsilon=0)
+        self.assertRaises(ValueError, nx.approximate_betweenness_centrality,
+                          G, delta=1)
+        self.assertRaises(ValueError, nx.approximate_betweenness_centrality,
+                          G, top_k=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import networkx as nx
+from networkx.algorithms.shortest_paths import unweighted
+
+try:
+    import numpy as np
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+@unittest.skipUnless(numpy, 'numpy not available')
+class TestShortestPathLengthRows(unittest.TestCase):
+    def graphs(self):
+        G = nx.gnm_random_graph(150, 300, seed=3)
+        G = nx.relabel_nodes(G, {n: ('n', n) for n in G})
+        yield G
+        yield nx.gnp_random_graph(120, 0.03, seed=2, directed=True)
+        yield nx.MultiDiGraph([(0, 1), (0, 1), (1, 1), (1, 2), (3, 0)])
+        yield nx.path_graph(100)
+        yield nx.CSRGraph(nx.grid_2d_graph(6, 7))
+        yield nx.empty_graph(3)
+        yield nx.Graph()
+
+    def test_same_as_bfs(self):
+        length = unweighted.single_source_shortest_path_length
+        for G in self.graphs():
+            nodes = list(G)
+            for cutoff in (None, 0, 3):
+                for batch_size in (64, 7, 130):
+                    rows = nx.shortest_path_length_rows(
+                        G, cutoff=cutoff, batch_size=batch_size)
+                    sources = []
+                    for batch, lengths in rows:
+                        self.assertLessEqual(len(batch), batch_size)
+                        self.assertEqual(lengths.shape,
+                                         (len(batch), len(nodes)))
+                        for s, row in zip(batch, lengths):
+                            expected = length(G, s, cutoff)
+                            self.assertEqual(
+                                {nodes[i]: d for i, d in enumerate(row)
+                                 if d >= 0}, expected)
+                        sources.extend(batch)
+                    self.assertEqual(sources, nodes)
+                self.assertEqual(
+                    dict(nx.all_pairs_shortest_path_length(G, cutoff)),
+                    {s: length(G, s, cutoff) for s in G})
+
+    def test_sources(self):
+        G = nx.path_graph(4)
+        (batch, lengths), = nx.shortest_path_length_rows(G, [3, 0, 3])
+        self.assertEqual(batch, [3, 0, 3])
+        np.testing.assert_array_equal(lengths, [[3, 2, 1, 0], [0, 1, 2, 3],
+                                                [3, 2, 1, 0]])
+        self.assertEqual(lengths.dtype, np.int32)
+        rows = nx.shortest_path_length_rows(G, [0, 9])
+        self.assertRaises(nx.NodeNotFound, list, rows)
+        self.assertRaises(ValueError, nx.shortest_path_length_rows, G,
+                          batch_size=0)
+
+    def test_consumers(self):
+        G = nx.gnm_random_graph(100, 150, seed=4)
+        D = nx.gnp_random_graph(80, 0.06, seed=5, directed=True)
+        C = nx.DiGraph(nx.complete_graph(4))
+        harmonic = nx.harmonic_centrality(D)
+        closeness = nx.closeness_centrality(G)
+        eccentricity = nx.eccentricity(C)
+        wiener = nx.wiener_index(nx.cycle_graph(9))
+        # the same values computed one source at a time
+        self.assertEqual(harmonic, {
+            u: sum(1 / d if d > 0 else 0 for d in
+                   nx.single_source_shortest_path_length(D.reverse(), u)
+                   .values()) for u in D})
+        self.assertEqual(closeness, nx.closeness_centrality(G, distance='w'))
+        self.assertEqual(eccentricity, {n: 1 for n in C})
+        self.assertEqual(wiener, 9 * 2 * (1 + 2 + 3 + 4) / 2)
+        self.assertRaises(nx.NetworkXError, nx.eccentricity, D)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import networkx as nx
+
+try:
+    import numpy as np
+    import scipy.sparse
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+def edge_set(G):
+    if G.is_multigraph():
+        edges = G.edges(keys=True, data=True)
+    else:
+        edges = G.edges(data=True)
+    return sorted(repr(e[:-1] + (sorted(e[-1].items()),)) for e in edges)
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph.nxb')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def graph(self, cls):
+        G = cls(name='test', pos=(1.0, 2.0))
+        G.add_nodes_from(['a', ('b', 1), 3], color='red')
+        G.add_node('a', size=2.5)
+        G.add_edge('a', ('b', 1), weight=0.5, label='x')
+        G.add_edge(3, 'a', weight=2)
+        G.add_edge(3, 3, weight=1.5, tags=[1, 2])
+        G.add_edge(('b', 1), 3)
+        if G.is_multigraph():
+            G.add_edge('a', ('b', 1), key='k', weight=4.0)
+        return G
+
+    def assertRoundTrip(self, G, H):
+        self.assertEqual(G.is_directed(), H.is_directed())
+        self.assertEqual(G.is_multigraph(), H.is_multigraph())
+        self.assertEqual(H.graph, G.graph)
+        self.assertEqual(list(H.nodes(data=True)), list(G.nodes(data=True)))
+        self.assertEqual(edge_set(H), edge_set(G))
+
+    def test_round_trip(self):
+        for cls in (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph):
+            G = self.graph(cls)
+            nx.write_binary(G, self.path)
+            for memory_map in (True, False):
+                H = nx.read_binary(self.path, memory_map=memory_map)
+                self.assertRoundTrip(G, H)
+            # CSR graphs are written from their arrays
+            C = {nx.Graph: nx.CSRGraph, nx.DiGraph: nx.CSRDiGraph,
+                 nx.MultiGraph: nx.CSRMultiGraph,
+                 nx.MultiDiGraph: nx.CSRMultiDiGraph}[cls](G)
+            nx.write_binary(C, self.path)
+            H = nx.read_binary(self.path)
+            self.assertRoundTrip(G, H)
+            self.assertEqual(list(H._csr.indices), list(C._csr.indices))
+
+    def test_same_edge_numbering_as_csr_graph(self):
+        G = nx.MultiGraph(nx.gnm_random_graph(40, 120, seed=1))
+        G.add_edges_from([(5, 5), (5, 5), (0, 39), (7, 3)])
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        C = nx.CSRMultiGraph(G)
+        self.assertEqual(list(H._csr.edge_ids), list(C._csr.edge_ids))
+        D = nx.gnp_random_graph(30, 0.2, seed=2, directed=True)
+        D.add_edge(4, 4)
+        nx.write_binary(D, self.path)
+        H = nx.read_binary(self.path)
+        C = nx.CSRDiGraph(D)
+        self.assertEqual(list(H._pred_csr.edge_ids),
+                         list(C._pred_csr.edge_ids))
+
+    def test_integer_nodes(self):
+        G = nx.path_graph(5)
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        self.assertEqual(list(H), list(range(5)))
+        self.assertIn(4, H)
+        self.assertNotIn(5, H)
+        self.assertNotIn('a', H)
+        self.assertEqual(nx.shortest_path(H, 0, 4), [0, 1, 2, 3, 4])
+
+    def test_missing_and_special_values(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, weight=float('nan'))
+        G.add_edge(1, 2, weight=float('inf'), other=None)
+        G.add_edge(2, 3)
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        self.assertNotEqual(H[0][1]['weight'], H[0][1]['weight'])
+        self.assertEqual(H[1][2], {'weight': float('inf'), 'other': None})
+        self.assertEqual(H[2][3], {})
+
+    def test_compressed(self):
+        G = self.graph(nx.DiGraph)
+        path = self.path + '.gz'
+        nx.write_binary(G, path)
+        self.assertRoundTrip(G, nx.read_binary(path))
+
+    def test_modify_loaded_graph(self):
+        G = self.graph(nx.Graph)
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        H['a'][('b', 1)]['weight'] = 7.0
+        H.nodes[3]['color'] = 'blue'
+        self.assertEqual(H[('b', 1)]['a']['weight'], 7.0)
+        self.assertEqual(H.nodes[3]['color'], 'blue')
+        self.assertRoundTrip(G, nx.read_binary(self.path))
+
+    def test_pickle_and_copy(self):
+        G = self.graph(nx.MultiDiGraph)
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        for K in (pickle.loads(pickle.dumps(H)), H.copy()):
+            self.assertRoundTrip(G, K)
+
+    @unittest.skipUnless(numpy, 'numpy and scipy not available')
+    def test_scipy_view(self):
+        G = nx.grid_2d_graph(4, 5)
+        for u, v in G.edges:
+            G[u][v]['weight'] = 1.5
+        nx.write_binary(G, self.path)
+        H = nx.read_binary(self.path)
+        A = nx.to_scipy_sparse_view(H)
+        B = nx.to_scipy_sparse_matrix(G)
+        self.assertTrue(scipy.sparse.isspmatrix_csr(A))
+        np.testing.assert_array_equal(A.toarray(), B.toarray())
+
+    def test_errors(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, data=object())
+        self.assertRaises(nx.NetworkXError, nx.write_binary, G, self.path)
+        G = nx.Graph([(object(), 1)])
+        self.assertRaises(nx.NetworkXError, nx.write_binary, G, self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'not a graph' * 10)
+        self.assertRaises(nx.NetworkXError, nx.read_binary, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+import networkx as nx
+from networkx.algorithms.shortest_paths.buckets import _dial_multisource
+from networkx.algorithms.shortest_paths.weighted import (
+    _dijkstra_multisource, _weight_function)
+
+try:
+    import numpy  # noqa
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+
+def hide_some(u, v, d):
+    return None if d.get('weight', 1) == 2 else d.get('weight', 1)
+
+
+class TestBuckets(unittest.TestCase):
+    def setUp(self):
+        rnd = random.Random(1)
+        G = nx.gnm_random_graph(150, 500, seed=1)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rnd.randint(0, 5)
+        D = nx.gnp_random_graph(100, 0.04, seed=2, directed=True)
+        for u, v, d in D.edges(data=True):
+            d['weight'] = rnd.choice([1, 2, 2.5, 7])
+        M = nx.MultiDiGraph(D)
+        M.add_edges_from((u, v, {'weight': 0}) for u, v in list(D.edges)[::3])
+        self.graphs = [G, D, M, nx.CSRGraph(G)]
+
+    def test_dial_same_as_dijkstra(self):
+        for G in self.graphs:
+            for s in list(G)[:10]:
+                for weight in ('weight', hide_some):
+                    for cutoff in (None, 3):
+                        w = _weight_function(G, weight)
+                        expected = ({s: [s]}, {s: []})
+                        result = ({s: [s]}, {s: []})
+                        dist = _dijkstra_multisource(G, [s], w, expected[1],
+                                                     expected[0], cutoff)
+                        self.assertEqual(
+                            _dial_multisource(G, [s], w, result[1],
+                                              result[0], cutoff), dist)
+                        self.assertEqual(result, expected)
+                t = list(G)[-1]
+                try:
+                    expected = nx.single_source_dijkstra(G, s, t)
+                except nx.NetworkXNoPath:
+                    self.assertRaises(nx.NetworkXNoPath,
+                                      nx.single_source_dial, G, s, t)
+                else:
+                    self.assertEqual(nx.single_source_dial(G, s, t), expected)
+
+    def test_dial_errors(self):
+        D = nx.DiGraph([(0, 1, {'weight': 3}), (0, 2, {'weight': 1}),
+                        (1, 2, {'weight': -5})])
+        self.assertRaises(ValueError, nx.single_source_dial, D, 0)
+        self.assertRaises(nx.NodeNotFound, nx.single_source_dial, D, 9)
+        self.assertEqual(nx.single_source_dial(D, 2, 2), (0, [2]))
+
+    @unittest.skipUnless(has_numpy, 'numpy not available')
+    def test_delta_stepping(self):
+        for G in self.graphs:
+            for s in list(G)[:10]:
+                for weight in ('weight', hide_some):
+                    for delta in (None, 0.5, 3, 100):
+                        for cutoff in (None, 3):
+                            length = nx.delta_stepping_path_length(
+                                G, s, delta, cutoff, weight)
+                            self.assertEqual(
+                                length, nx.single_source_dijkstra_path_length(
+                                    G, s, cutoff, weight))
+                            self.assertEqual(list(length.values()),
+                                             sorted(length.values()))
+
+    @unittest.skipUnless(has_numpy, 'numpy not available')
+    def test_delta_stepping_rounding(self):
+        # 13 // 2.6 == 4.0 although 13 / 2.6 == 5.0
+        D = nx.DiGraph()
+        D.add_edge(0, 1, weight=13)
+        self.assertEqual(nx.delta_stepping_path_length(D, 0, delta=2.6),
+                         {0: 0, 1: 13})
+        for G in self.graphs:
+            for delta in (0.1, 0.3, 2.6):
+                self.assertEqual(nx.delta_stepping_path_length(G, 0, delta),
+                                 nx.single_source_dijkstra_path_length(G, 0))
+
+    @unittest.skipUnless(has_numpy, 'numpy not available')
+    def test_delta_stepping_errors(self):
+        D = nx.DiGraph([(0, 1, {'weight': 2}), (1, 2, {'weight': -1})])
+        self.assertRaises(ValueError, nx.delta_stepping_path_length, D, 0)
+        self.assertRaises(ValueError, nx.delta_stepping_path_length,
+                          nx.path_graph(3), 0, 0)
+        self.assertRaises(nx.NodeNotFound, nx.delta_stepping_path_length,
+                          D, 9)
+        self.assertEqual(nx.delta_stepping_path_length(nx.empty_graph(2), 1),
+                         {1: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import gc
+import unittest
+import networkx as nx
+from networkx.utils import memoize_on_graph, result_cache
+from networkx.utils.cache import GraphResultCache
+
+
+class TestMemoizeOnGraph(unittest.TestCase):
+    def setUp(self):
+        result_cache.cache_clear()
+        result_cache.resize(16)
+
+    def tearDown(self):
+        result_cache.resize(0)
+        result_cache.cache_clear()
+
+    def test_hits_and_invalidation(self):
+        G = nx.karate_club_graph()
+        cn = nx.core_number(G)
+        cn[0] = -1
+        self.assertNotEqual(nx.core_number(G)[0], -1)
+        self.assertEqual(result_cache.cache_info('core_number')[:2], (1, 1))
+        G.add_edge(0, 9)
+        nx.core_number(G)
+        self.assertEqual(result_cache.cache_info('core_number')[:2], (1, 2))
+        self.assertEqual(result_cache.cache_info().currsize, 1)
+
+    def test_arguments_are_keys(self):
+        G = nx.karate_club_graph()
+        nx.pagerank(G, alpha=0.85)
+        nx.pagerank(G, alpha=0.9)
+        nx.pagerank(G, 0.9)
+        self.assertEqual(result_cache.cache_info('pagerank')[:2], (1, 2))
+        # unhashable arguments are not cached
+        nx.pagerank(G, personalization={0: 1})
+        self.assertEqual(result_cache.cache_info('pagerank')[:2], (1, 2))
+
+    def test_cacheable(self):
+        calls = []
+
+        @memoize_on_graph(cacheable=lambda args: args['seed'] is not None)
+        def sample(G, seed=None):
+            calls.append(seed)
+            return list(G)
+
+        G = nx.path_graph(3)
+        sample(G)
+        sample(G)
+        self.assertEqual(result_cache.cache_info()[:2], (0, 0))
+        sample(G, seed=1)
+        sample(G, 1)
+        self.assertEqual(calls, [None, None, 1])
+        self.assertEqual(result_cache.cache_info()[:2], (1, 1))
+
+    def test_generator(self):
+        G = nx.path_graph(4)
+        first = dict(nx.all_pairs_shortest_path_length(G))
+        first[0][3] = 99
+        second = dict(nx.all_pairs_shortest_path_length(G))
+        self.assertEqual(second[0][3], 3)
+        self.assertEqual(result_cache.cache_info()[:2], (1, 1))
+
+    def test_views_and_eviction(self):
+        G = nx.path_graph(4)
+        H = G.subgraph([0, 1])
+        nx.core_number(H)
+        nx.core_number(H)
+        self.assertEqual(result_cache.cache_info()[:2], (0, 0))
+        result_cache.resize(2)
+        graphs = [nx.path_graph(i) for i in range(3)]
+        for g in graphs:
+            nx.core_number(g)
+        self.assertEqual(result_cache.cache_info().currsize, 2)
+        del graphs, g
+        gc.collect()
+        self.assertEqual(result_cache.cache_info().currsize, 0)
+
+    def test_private_cache(self):
+        cache = GraphResultCache(maxsize=4)
+        calls = []
+
+        @memoize_on_graph(cache=cache)
+        def order(G):
+            calls.append(1)
+            return len(G)
+
+        G = nx.path_graph(3)
+        self.assertEqual(order(G) + order(G), 6)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(result_cache.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
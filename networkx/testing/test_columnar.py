@@ -0,0 +1,87 @@
+import pickle
+from array import array
+import unittest
+import networkx as nx
+from networkx.classes.columns import AttributeColumns
+
+try:
+    import numpy as np
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+class TestAttributeColumns(unittest.TestCase):
+    def test_typed_and_object_columns(self):
+        cols = AttributeColumns()
+        cols.set(0, 'weight', 1.5)
+        cols.set(2, 'weight', 2.5)
+        self.assertEqual(cols.typecode('weight'), 'd')
+        self.assertEqual(cols.get(1, 'weight', 'missing'), 'missing')
+        self.assertFalse(cols.has(1, 'weight'))
+        # a value of another type keeps the exact Python value
+        cols.set(1, 'weight', 3)
+        self.assertIsNone(cols.typecode('weight'))
+        self.assertEqual(cols.get(1, 'weight'), 3)
+        self.assertEqual(cols.get(2, 'weight'), 2.5)
+
+    def test_rows(self):
+        cols = AttributeColumns()
+        row = cols.row(cols.new_row())
+        row.update({'a': 1}, b='x')
+        self.assertEqual(row, {'a': 1, 'b': 'x'})
+        del row['a']
+        self.assertNotIn('a', row)
+        cols.release_row(row.row)
+        self.assertEqual(len(row), 0)
+        self.assertEqual(cols.new_row(), row.row)
+
+    @unittest.skipUnless(numpy, 'numpy not available')
+    def test_gather(self):
+        cols = AttributeColumns()
+        cols.set(0, 'w', 0.5)
+        cols.set(2, 'w', 4.0)
+        np.testing.assert_array_equal(cols.gather('w', [2, 1, 0, 9]),
+                                      [4.0, 1.0, 0.5, 1.0])
+        np.testing.assert_array_equal(cols.gather('x', [0, 1], default=7),
+                                      [7, 7])
+
+
+class TestColumnarGraph(unittest.TestCase):
+    def test_edge_data(self):
+        G = nx.ColumnarGraph()
+        G.add_weighted_edges_from([(0, 1, 0.5), (1, 2, 2.0)])
+        G.add_edge(0, 1, color='red')
+        self.assertEqual(G[1][0], {'weight': 0.5, 'color': 'red'})
+        self.assertEqual(G.edge_columns.typecode('weight'), 'd')
+        G.edges[1, 2]['weight'] = 3.0
+        self.assertEqual(nx.dijkstra_path_length(G, 0, 2), 3.5)
+
+    def test_rows_are_reused(self):
+        G = nx.ColumnarDiGraph([(0, 1, {'w': 1}), (1, 2, {'w': 2})])
+        row = G[0][1].row
+        G.remove_edge(0, 1)
+        G.add_edge(5, 6, w=3)
+        self.assertEqual(G[5][6].row, row)
+        self.assertEqual(G[5][6], {'w': 3})
+
+    def test_append_after_set_column(self):
+        G = nx.ColumnarGraph([(0, 1), (1, 2)])
+        G.edge_columns.set_column('w', array('d', [0.5, 1.5]))
+        G.add_edge(2, 3, w=2.5)
+        self.assertEqual(list(G.edges(data='w')),
+                         [(0, 1, 0.5), (1, 2, 1.5), (2, 3, 2.5)])
+        G.add_edge(3, 4, color='red')
+        self.assertEqual(G[3][4], {'color': 'red'})
+
+    def test_copies(self):
+        G = nx.ColumnarMultiGraph([(0, 1, {'w': 1}), (0, 1, {'w': 2})])
+        for H in (G.copy(), pickle.loads(pickle.dumps(G))):
+            self.assertEqual(sorted(H.edges(data='w')), [(0, 1, 1), (0, 1, 2)])
+            H.add_edge(0, 1, w=5)
+            self.assertEqual(H.number_of_edges(), 3)
+        self.assertEqual(G.number_of_edges(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import networkx as nx
+
+
+def path_length(G, path, weight='weight'):
+    return sum(min(d.get(weight, 1) for d in G[u][v].values())
+               if G.is_multigraph() else G[u][v].get(weight, 1)
+               for u, v in zip(path, path[1:]))
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    def assertQueries(self, G, ch, pairs=200, seed=1):
+        rng = random.Random(seed)
+        nodes = list(G)
+        for _ in range(pairs):
+            s, t = rng.choice(nodes), rng.choice(nodes)
+            try:
+                expected = nx.dijkstra_path_length(G, s, t)
+            except nx.NetworkXNoPath:
+                self.assertRaises(nx.NetworkXNoPath, ch.query, s, t)
+                continue
+            length, path = ch.query(s, t)
+            self.assertAlmostEqual(length, expected)
+            self.assertEqual((path[0], path[-1]), (s, t))
+            self.assertAlmostEqual(path_length(G, path), expected)
+
+    def test_undirected(self):
+        rng = random.Random(2)
+        G = nx.gnm_random_graph(150, 400, seed=2)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.randint(1, 20)
+        self.assertQueries(G, nx.contraction_hierarchy(G))
+
+    def test_directed(self):
+        rng = random.Random(3)
+        G = nx.gnm_random_graph(150, 600, seed=3, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.random()
+        self.assertQueries(G, nx.contraction_hierarchy(G))
+
+    def test_grid(self):
+        G = nx.grid_2d_graph(12, 12)
+        ch = nx.contraction_hierarchy(G)
+        self.assertEqual(ch.query((0, 0), (11, 11))[0], 22)
+        self.assertEqual(ch.shortest_path((3, 4), (3, 4)), [(3, 4)])
+        self.assertQueries(G, ch)
+
+    def test_multigraph_and_weight_function(self):
+        M = nx.MultiGraph([(0, 1, {'w': 3}), (0, 1, {'w': 1}),
+                           (1, 2, {'w': 0}), (2, 3, {'w': 2}), (4, 5)])
+        ch = nx.contraction_hierarchy(M, 'w')
+        self.assertEqual(ch.query(0, 3), (3, [0, 1, 2, 3]))
+        self.assertRaises(nx.NetworkXNoPath, ch.query, 0, 4)
+        self.assertRaises(nx.NodeNotFound, ch.query, 0, 9)
+
+        def weight(u, v, d):
+            return None if {u, v} == {1, 2} else d['w']
+        G = nx.Graph([(0, 1, {'w': 1}), (1, 2, {'w': 1}), (0, 2, {'w': 5})])
+        ch = nx.contraction_hierarchy(G, weight)
+        self.assertEqual(ch.query(1, 2), (6, [1, 0, 2]))
+        G[0][1]['w'] = -1
+        self.assertRaises(ValueError, nx.contraction_hierarchy, G, 'w')
+
+    def test_read_write(self):
+        G = nx.grid_2d_graph(8, 8)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = u[0] + v[1] + 1
+        ch = nx.contraction_hierarchy(G)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'ch.nxb')
+            nx.write_contraction_hierarchy(ch, path)
+            self.assertQueries(G, nx.read_contraction_hierarchy(path))
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
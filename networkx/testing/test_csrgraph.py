@@ -0,0 +1,176 @@
+import pickle
+import unittest
+import networkx as nx
+
+try:
+    import numpy as np
+    import scipy.sparse
+    numpy = True
+except ImportError:
+    numpy = False
+
+try:
+    import pandas as pd
+    pandas = True
+except ImportError:
+    pandas = False
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.G = nx.karate_club_graph()
+        for u, v in self.G.edges:
+            self.G[u][v]['weight'] = u + 0.5 * v
+        self.C = nx.CSRGraph(self.G)
+
+    def test_views(self):
+        G, C = self.G, self.C
+        self.assertEqual(list(C), list(G))
+        self.assertEqual(C.number_of_edges(), G.number_of_edges())
+        self.assertEqual(set(map(frozenset, C.edges)),
+                         set(map(frozenset, G.edges)))
+        self.assertEqual(dict(C.degree), dict(G.degree))
+        self.assertEqual(dict(C.degree(weight='weight')),
+                         dict(G.degree(weight='weight')))
+        for u in G:
+            self.assertEqual(dict(C[u]), dict(G[u]))
+        self.assertEqual(C.nodes[0], G.nodes[0])
+        self.assertTrue(C.has_edge(0, 1))
+        self.assertFalse(C.has_edge(0, 9))
+        self.assertFalse(C.has_node('missing'))
+
+    def test_frozen(self):
+        self.assertTrue(nx.is_frozen(self.C))
+        with self.assertRaises(nx.NetworkXError):
+            self.C.add_edge(0, 9)
+        with self.assertRaises(nx.NetworkXError):
+            self.C.remove_node(0)
+
+    def test_attributes_writable(self):
+        self.C.edges[0, 1]['weight'] = 7
+        self.assertEqual(self.C[1][0]['weight'], 7)
+        self.C.nodes[0]['color'] = 'red'
+        self.assertEqual(self.C.nodes[0], {'club': 'Mr. Hi', 'color': 'red'})
+
+    def test_algorithms(self):
+        G, C = self.G, self.C
+        self.assertEqual(nx.single_source_dijkstra_path_length(C, 0),
+                         nx.single_source_dijkstra_path_length(G, 0))
+        self.assertEqual(nx.betweenness_centrality(C),
+                         nx.betweenness_centrality(G))
+
+    def test_copy_and_pickle(self):
+        H = self.C.copy()
+        H.edges[0, 1]['weight'] = -1
+        self.assertNotEqual(self.C.edges[0, 1]['weight'], -1)
+        H = pickle.loads(pickle.dumps(self.C))
+        self.assertEqual(set(H.edges), set(self.C.edges))
+        self.assertEqual(H.edges[0, 1], self.C.edges[0, 1])
+
+    def test_directed(self):
+        D = nx.gnp_random_graph(30, 0.2, directed=True, seed=42)
+        D.add_edge(3, 3)
+        C = nx.CSRDiGraph(D)
+        self.assertEqual(set(C.edges), set(D.edges))
+        self.assertEqual(set(C.in_edges), set(D.in_edges))
+        self.assertEqual(dict(C.in_degree), dict(D.in_degree))
+        self.assertEqual(set(C.reverse().edges), set(D.reverse().edges))
+
+    def test_multigraph(self):
+        M = nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 2)])
+        M.add_edge(2, 2, key='x', w=3)
+        C = nx.CSRMultiGraph(M)
+        self.assertEqual(sorted(C.edges(keys=True), key=str),
+                         sorted(M.edges(keys=True), key=str))
+        self.assertEqual(dict(C.degree), dict(M.degree))
+        self.assertEqual(C[2][2]['x'], {'w': 3})
+        self.assertEqual(C.number_of_edges(0, 1), 2)
+
+        MD = nx.MultiDiGraph([(0, 1), (0, 1), (1, 0)])
+        CD = nx.CSRMultiDiGraph(MD)
+        self.assertEqual(sorted(CD.in_edges(keys=True)),
+                         sorted(MD.in_edges(keys=True)))
+
+    def test_conversion(self):
+        C = nx.CSRGraph([(0, 1), (1, 2)], name='path')
+        self.assertEqual(C.name, 'path')
+        D = nx.CSRDiGraph(C)
+        self.assertEqual(set(D.edges), {(0, 1), (1, 0), (1, 2), (2, 1)})
+        self.assertEqual(len(nx.CSRGraph()), 0)
+
+
+@unittest.skipUnless(numpy, 'numpy and scipy not available')
+class TestFromEdgeArrays(unittest.TestCase):
+    def edges(self, G):
+        edges = G.edges(data='weight')
+        if not G.is_directed():
+            edges = ((min(u, v), max(u, v), w) for u, v, w in edges)
+        return sorted(edges)
+
+    def test_matches_base_classes(self):
+        rng = np.random.RandomState(42)
+        A = rng.randint(0, 3, (20, 20)) * (rng.rand(20, 20) < 0.3)
+        for cls, base in [(nx.CSRGraph, nx.Graph),
+                          (nx.CSRDiGraph, nx.DiGraph),
+                          (nx.CSRMultiGraph, nx.MultiGraph),
+                          (nx.CSRMultiDiGraph, nx.MultiDiGraph)]:
+            for parallel in (False, True):
+                S = scipy.sparse.csr_matrix(A)
+                C = nx.from_scipy_sparse_matrix(S, parallel, cls)
+                G = nx.from_scipy_sparse_matrix(S, parallel, base)
+                self.assertIsInstance(C, cls)
+                self.assertEqual(list(C), list(G))
+                self.assertEqual(self.edges(C), self.edges(G))
+                self.assertEqual(dict(C.degree(weight='weight')),
+                                 dict(G.degree(weight='weight')))
+                C = nx.from_numpy_array(A, parallel, cls)
+                G = nx.from_numpy_array(A, parallel, base)
+                self.assertEqual(self.edges(C), self.edges(G))
+                if C.is_directed():
+                    self.assertEqual(dict(C.in_degree), dict(G.in_degree))
+
+    def test_labels_and_dedup(self):
+        src = np.array(['a', 'b', 'a', 'b'])
+        dst = np.array(['b', 'a', 'c', 'a'])
+        w = np.array([1.0, 2.0, 3.0, 4.0])
+        G = nx.from_edge_arrays(src, dst, create_using=nx.CSRGraph, w=w)
+        self.assertEqual(list(G), ['a', 'b', 'c'])
+        self.assertEqual(G['a']['b'], {'w': 4.0})
+        self.assertEqual(G.edge_columns.typecode('w'), 'd')
+        M = nx.CSRMultiDiGraph.from_edge_arrays(src, dst, nodes=['c', 'b',
+                                                                'a', 'z'])
+        self.assertEqual(list(M), ['c', 'b', 'a', 'z'])
+        self.assertEqual(sorted(M.edges(keys=True)),
+                         [('a', 'b', 0), ('a', 'c', 0),
+                          ('b', 'a', 0), ('b', 'a', 1)])
+        M = nx.CSRMultiDiGraph.from_edge_arrays(src, dst, dedup=True)
+        self.assertEqual(M.number_of_edges(), 3)
+        D = nx.from_edge_arrays(src, dst, create_using=nx.MultiGraph,
+                                dedup=True, w=w)
+        self.assertEqual(sorted(D.edges(data='w')),
+                         [('a', 'b', 4.0), ('a', 'c', 3.0)])
+        self.assertRaises(nx.NetworkXError, nx.CSRGraph.from_edge_arrays,
+                          src, dst, nodes=['a', 'b'])
+        self.assertRaises(nx.NetworkXError, nx.CSRGraph.from_edge_arrays,
+                          src, dst[:2])
+        for cls in (nx.Graph, nx.MultiDiGraph):
+            self.assertRaises(nx.NetworkXError, nx.from_edge_arrays, src,
+                              dst, create_using=cls, nodes=['a', 'b'])
+        G = nx.from_edge_arrays(src, dst, nodes=['c', 'b', 'a', 'z'])
+        self.assertEqual(list(G), ['c', 'b', 'a', 'z'])
+
+    @unittest.skipUnless(pandas, 'pandas not available')
+    def test_from_pandas_edgelist(self):
+        df = pd.DataFrame({'source': [0, 1], 'target': [1, 2],
+                           'w': [0.5, 1.5]})
+        for cls in (nx.Graph, nx.CSRGraph):
+            G = nx.from_pandas_edgelist(df, edge_attr='w', create_using=cls)
+            self.assertEqual(sorted(G.edges(data='w')),
+                             [(0, 1, 0.5), (1, 2, 1.5)])
+            for edge_attr in ([], (), 'missing'):
+                self.assertRaises(nx.NetworkXError, nx.from_pandas_edgelist,
+                                  df, edge_attr=edge_attr, create_using=cls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import networkx as nx
+
+
+class TestDirectionOptimizingBFS(unittest.TestCase):
+    def graphs(self):
+        # dense enough for the search to go bottom-up
+        yield nx.barabasi_albert_graph(400, 5, seed=1)
+        yield nx.gnp_random_graph(200, 0.04, seed=2, directed=True)
+        yield nx.MultiGraph(nx.watts_strogatz_graph(100, 6, 0.2, seed=3))
+        yield nx.CSRDiGraph(nx.gnp_random_graph(100, 0.08, seed=4,
+                                               directed=True))
+        yield nx.path_graph(20)
+        yield nx.DiGraph([(0, 0), (0, 1)])
+
+    def test_lengths(self):
+        for G in self.graphs():
+            for source in list(G)[:10]:
+                for cutoff in (None, 0, 2):
+                    self.assertEqual(
+                        nx.single_source_shortest_path_length(
+                            G, source, cutoff, direction_optimizing=True),
+                        nx.single_source_shortest_path_length(G, source,
+                                                              cutoff))
+                for distance in (-1, 0, 1, 2, 5):
+                    self.assertEqual(
+                        nx.descendants_at_distance(G, source, distance,
+                                                   direction_optimizing=True),
+                        nx.descendants_at_distance(G, source, distance))
+
+    def test_bfs_tree(self):
+        for G in self.graphs():
+            for reverse in (False, True):
+                H = G.reverse() if reverse and G.is_directed() else G
+                for source in list(G)[:10]:
+                    T = nx.bfs_tree(G, source, reverse, depth_limit=3,
+                                    direction_optimizing=True)
+                    depth = nx.single_source_shortest_path_length(H, source,
+                                                                  3)
+                    self.assertEqual(set(T), set(depth))
+                    self.assertEqual(T.number_of_edges(), len(T) - 1)
+                    for u, v in T.edges:
+                        self.assertTrue(H.has_edge(u, v))
+                        self.assertEqual(depth[v], depth[u] + 1)
+
+    def test_missing_source(self):
+        G = nx.path_graph(3)
+        self.assertRaises(nx.NodeNotFound,
+                          nx.single_source_shortest_path_length, G, 5,
+                          direction_optimizing=True)
+        self.assertRaises(nx.NetworkXError, nx.descendants_at_distance, G, 5,
+                          1, direction_optimizing=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
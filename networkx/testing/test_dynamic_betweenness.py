@@ -0,0 +1,87 @@
+import random
+import unittest
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import (
+    _single_source_shortest_path_basic, _accumulate_basic,
+    _accumulate_endpoints, _rescale)
+
+
+def sampled_betweenness(G, sources, endpoints):
+    betweenness = dict.fromkeys(G, 0.0)
+    accumulate = _accumulate_endpoints if endpoints else _accumulate_basic
+    for s in sources:
+        S, P, sigma = _single_source_shortest_path_basic(G, s)
+        accumulate(betweenness, S, P, sigma, s)
+    return _rescale(betweenness, len(G), True, G.is_directed(), len(sources),
+                    endpoints)
+
+
+class TestDynamicBetweenness(unittest.TestCase):
+    def assertClose(self, bc, expected):
+        self.assertEqual(bc.keys(), expected.keys())
+        for v in bc:
+            self.assertAlmostEqual(bc[v], expected[v], places=9)
+
+    def test_initial_values(self):
+        G = nx.gnm_random_graph(30, 60, seed=1)
+        for kwargs in ({}, {'normalized': False}, {'endpoints': True}):
+            self.assertEqual(nx.DynamicBetweenness(G, **kwargs).betweenness,
+                             nx.betweenness_centrality(G, **kwargs))
+        self.assertEqual(nx.DynamicBetweenness(G, k=10, seed=2).betweenness,
+                         nx.betweenness_centrality(G, k=10, seed=2))
+        self.assertRaises(ValueError, nx.DynamicBetweenness, G, k=31)
+
+    def test_random_changes(self):
+        for seed, cls in enumerate((nx.Graph, nx.DiGraph) * 3):
+            rnd = random.Random(seed)
+            G = cls(nx.gnm_random_graph(25, 40, seed=seed,
+                                        directed=cls().is_directed()))
+            nx.enable_journal(G)
+            endpoints = seed % 3 == 1
+            bc = nx.DynamicBetweenness(G, endpoints=endpoints)
+            for step in range(30):
+                for _ in range(rnd.randint(1, 3)):
+                    if rnd.random() < 0.5:
+                        G.add_edge(rnd.randrange(25), rnd.randrange(25))
+                    elif G.number_of_edges():
+                        G.remove_edge(*rnd.choice(list(G.edges)))
+                bc.sync()
+                self.assertClose(bc.betweenness, nx.betweenness_centrality(
+                    G, endpoints=endpoints))
+
+    def test_sampled_sources(self):
+        G = nx.gnm_random_graph(30, 50, seed=3, directed=True)
+        bc = nx.DynamicBetweenness(G, k=6, endpoints=True, seed=4)
+        self.assertEqual(len(bc.sources), 6)
+        self.assertEqual(len(bc._dist), 6)
+        rnd = random.Random(5)
+        for step in range(20):
+            u, v = rnd.sample(range(30), 2)
+            if G.has_edge(u, v):
+                G.remove_edge(u, v)
+            else:
+                G.add_edge(u, v)
+            bc.update_edge(u, v)
+            self.assertClose(bc.betweenness,
+                             sampled_betweenness(G, bc.sources, True))
+
+    def test_node_changes(self):
+        self.assertRaises(nx.NetworkXNotImplemented, nx.DynamicBetweenness,
+                          nx.MultiGraph())
+        G = nx.cycle_graph(6)
+        nx.enable_journal(G)
+        bc = nx.DynamicBetweenness(G, normalized=False)
+        G.add_edge(0, 3)
+        G.add_edge(2, 6)
+        bc.sync()
+        self.assertClose(bc.betweenness,
+                         nx.betweenness_centrality(G, normalized=False))
+        G.remove_node(3)
+        bc.update_edges([(2, 3), (3, 4)])
+        self.assertEqual(len(bc.sources), 6)
+        self.assertClose(bc.betweenness,
+                         nx.betweenness_centrality(G, normalized=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import random
+import unittest
+import networkx as nx
+
+
+class TestDynamicShortestPaths(unittest.TestCase):
+    def assertRepaired(self, sp, G):
+        expected = nx.single_source_dijkstra_path_length(G, sp.source)
+        self.assertEqual(sp.dist, expected)
+        self.assertEqual(set(sp.pred), set(expected))
+        for v, preds in sp.pred.items():
+            for p in preds:
+                self.assertEqual(sp.dist[p] + G[p][v]['weight'], sp.dist[v])
+            path = sp.path(v)
+            self.assertEqual(sum(G[a][b]['weight']
+                                 for a, b in zip(path, path[1:])),
+                             sp.dist[v])
+
+    def test_random_changes(self):
+        for seed, cls in enumerate((nx.Graph, nx.DiGraph) * 4):
+            rnd = random.Random(seed)
+            G = cls(nx.gnm_random_graph(30, 70, seed=seed,
+                                        directed=cls().is_directed()))
+            for u, v, d in G.edges(data=True):
+                d['weight'] = rnd.randint(1, 4)
+            nx.enable_journal(G)
+            sp = nx.DynamicShortestPaths(G, 0)
+            for step in range(40):
+                reweighted = []
+                for _ in range(rnd.randint(1, 3)):
+                    edges = list(G.edges(data=True))
+                    r = rnd.random()
+                    if r < 0.4:
+                        G.add_edge(rnd.randrange(32), rnd.randrange(32),
+                                   weight=rnd.randint(1, 4))
+                    elif r < 0.8 and edges:
+                        G.remove_edge(*rnd.choice(edges)[:2])
+                    elif edges:
+                        u, v, d = rnd.choice(edges)
+                        d['weight'] = rnd.randint(1, 4)
+                        reweighted.append((u, v))
+                sp.update_edges(reweighted)
+                sp.sync()
+                self.assertRepaired(sp, G)
+
+    def test_multigraph_and_hidden_edges(self):
+        G = nx.MultiDiGraph([(0, 1, {'w': 5}), (0, 1, {'w': 1}),
+                             (1, 2, {'w': 1}), (0, 2, {'w': 3})])
+
+        def weight(u, v, keys):
+            ws = [d['w'] for d in keys.values() if not d.get('hidden')]
+            return min(ws) if ws else None
+        sp = nx.DynamicShortestPaths(G, 0, weight)
+        self.assertEqual(sp.dist, {0: 0, 1: 1, 2: 2})
+        G[0][1][1]['hidden'] = True
+        sp.update_edge(0, 1)
+        self.assertEqual(sp.dist, {0: 0, 1: 5, 2: 3})
+        self.assertEqual(sp.pred[2], [0])
+        G[0][1][0]['hidden'] = True
+        sp.update_edge(0, 1)
+        self.assertEqual(sp.dist, {0: 0, 2: 3})
+        self.assertRaises(nx.NetworkXNoPath, sp.path, 1)
+        self.assertRaises(nx.NetworkXNoPath, sp.distance, 1)
+
+    def test_without_journal_and_removed_source(self):
+        G = nx.path_graph(4)
+        sp = nx.DynamicShortestPaths(G, 0)
+        G.add_edge(0, 3)
+        sp.sync()  # recomputed from scratch
+        self.assertEqual(sp.distance(3), 1)
+        nx.enable_journal(G)
+        sp.sync()
+        G.remove_node(0)
+        sp.sync()
+        self.assertEqual((sp.dist, sp.pred), ({}, {}))
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        self.assertRaises(nx.NodeNotFound, nx.DynamicShortestPaths, G, 5)
+        sp = nx.DynamicShortestPaths(G, 0)
+        G[1][2]['weight'] = 0
+        self.assertRaises(ValueError, sp.update_edge, 1, 2)
+        self.assertRaises(ValueError, nx.DynamicShortestPaths, G, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import random
+import tempfile
+import unittest
+import networkx as nx
+
+try:
+    import numpy as np
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+def edge_weight(G, u, v):
+    if G.is_multigraph():
+        return min(d.get('weight', 1) for d in G[u][v].values())
+    return G[u][v].get('weight', 1)
+
+
+@unittest.skipUnless(numpy, 'numpy not available')
+class TestFloydWarshallBlocked(unittest.TestCase):
+    def graphs(self):
+        for seed in range(6):
+            rnd = random.Random(seed)
+            G = nx.gnp_random_graph(30, 0.1, seed=seed,
+                                    directed=bool(seed % 2))
+            for u, v, d in G.edges(data=True):
+                if rnd.random() < 0.9:
+                    d['weight'] = rnd.randint(1, 9)
+            yield G
+        M = nx.MultiDiGraph([(0, 1, {'weight': 4}), (0, 1, {'weight': 2}),
+                             (1, 2), (2, 2, {'weight': 5})])
+        M.add_node(3)
+        yield M
+
+    def test_distances_and_paths(self):
+        for G in self.graphs():
+            nodes = list(G)
+            expected = nx.floyd_warshall(G)
+            for block_size in (1, 4, 64):
+                pred, dist = nx.floyd_warshall_blocked(
+                    G, predecessors=True, block_size=block_size)
+                for i, u in enumerate(nodes):
+                    for j, v in enumerate(nodes):
+                        self.assertEqual(dist[i, j], expected[u][v])
+                        if i == j or dist[i, j] == np.inf:
+                            self.assertEqual(pred[i, j], -1)
+                            continue
+                        path = nx.reconstruct_path(i, j, pred)
+                        self.assertEqual(path[0], i)
+                        self.assertEqual(path[-1], j)
+                        length = sum(edge_weight(G, nodes[a], nodes[b])
+                                     for a, b in zip(path, path[1:]))
+                        self.assertEqual(length, dist[i, j])
+            self.assertTrue((np.asarray(nx.floyd_warshall_numpy(G)) ==
+                             nx.floyd_warshall_blocked(G)).all())
+
+    def test_zero_weight_cycles(self):
+        edges = [(0, 1, 1), (0, 6, 1), (1, 2, 0), (1, 4, 1), (1, 6, 0),
+                 (2, 1, 0), (2, 3, 0), (2, 6, 0), (3, 0, 1), (3, 1, 0),
+                 (3, 4, 0), (3, 6, 0), (4, 0, 0), (4, 3, 0), (5, 0, 1),
+                 (5, 1, 0), (5, 2, 1), (5, 3, 0), (6, 0, 1), (6, 2, 1),
+                 (6, 3, 1), (6, 5, 0)]
+        G = nx.DiGraph()
+        G.add_weighted_edges_from(edges)
+        D = nx.gnp_random_graph(60, 0.1, seed=1, directed=True)
+        rnd = random.Random(1)
+        for u, v, d in D.edges(data=True):
+            d['weight'] = rnd.randint(0, 3)
+        for H in (G, D):
+            nodes = sorted(H)
+            expected = nx.floyd_warshall(H)
+            for block_size in (1, 2, 3, 64):
+                pred, dist = nx.floyd_warshall_blocked(
+                    H, nodes, predecessors=True, block_size=block_size)
+                for i in nodes:
+                    for j in nodes:
+                        if i == j or dist[i, j] == np.inf:
+                            continue
+                        path = nx.reconstruct_path(i, j, pred)
+                        length = sum(H[a][b]['weight']
+                                     for a, b in zip(path, path[1:]))
+                        self.assertEqual(length, expected[i][j])
+        cycle = np.array([[-1, 2, 1], [-1, -1, -1], [-1, -1, -1]])
+        self.assertRaises(nx.NetworkXError, nx.reconstruct_path, 0, 1, cycle)
+
+    def test_options(self):
+        G = nx.path_graph(5)
+        dist = nx.floyd_warshall_blocked(G, nodelist=[4, 3, 0],
+                                         dtype=np.float32)
+        self.assertEqual(dist.dtype, np.float32)
+        self.assertEqual(dist.tolist(), [[0, 1, np.inf], [1, 0, np.inf],
+                                         [np.inf, np.inf, 0]])
+        self.assertRaises(ValueError, nx.floyd_warshall_blocked, G,
+                          dtype=int)
+        self.assertRaises(ValueError, nx.floyd_warshall_blocked, G,
+                          out=np.empty((4, 4)))
+        self.assertRaises(nx.NetworkXError, nx.floyd_warshall_blocked, G,
+                          nodelist=[0, 0])
+        pred = nx.floyd_warshall_blocked(nx.DiGraph([(0, 1)]),
+                                         predecessors=True)[0]
+        self.assertRaises(nx.NetworkXNoPath, nx.reconstruct_path, 1, 0, pred)
+
+    def test_memory_mapped_output(self):
+        G = nx.cycle_graph(6)
+        directory = tempfile.mkdtemp()
+        try:
+            out = os.path.join(directory, 'dist.npy')
+            pred_out = os.path.join(directory, 'pred.npy')
+            pred, dist = nx.floyd_warshall_blocked(
+                G, predecessors=True, out=out, pred_out=pred_out)
+            self.assertIsInstance(dist, np.memmap)
+            dist.flush()
+            pred.flush()
+            del dist, pred
+            self.assertEqual(np.load(out)[0].tolist(), [0, 1, 2, 3, 2, 1])
+            pred = np.load(pred_out)
+            self.assertEqual(nx.reconstruct_path(0, 3, pred), [0, 1, 2, 3])
+        finally:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import networkx as nx
+
+
+class TestGraphVersion(unittest.TestCase):
+    def test_mutators_bump_version(self):
+        for G in (nx.Graph(), nx.DiGraph(), nx.MultiGraph(),
+                  nx.MultiDiGraph()):
+            mutations = [lambda: G.add_node(0),
+                         lambda: G.add_nodes_from([1, 2]),
+                         lambda: G.add_edge(0, 1),
+                         lambda: G.add_edges_from([(1, 2)]),
+                         lambda: G.add_weighted_edges_from([(2, 3, 1.0)]),
+                         lambda: G.remove_edge(0, 1),
+                         lambda: G.remove_edges_from([(1, 2)]),
+                         lambda: G.remove_node(3),
+                         lambda: G.remove_nodes_from([2]),
+                         lambda: G.update(edges=[(5, 6)]),
+                         G.clear]
+            for mutate in mutations:
+                v = nx.graph_version(G)
+                mutate()
+                self.assertGreater(nx.graph_version(G), v)
+
+    def test_views_follow_graph(self):
+        G = nx.path_graph(3)
+        H = G.subgraph([0, 1])
+        v = nx.graph_version(H)
+        G.add_edge(5, 6)
+        self.assertGreater(nx.graph_version(H), v)
+        self.assertRaises(nx.NetworkXError, nx.enable_journal, H)
+
+
+class TestJournal(unittest.TestCase):
+    def test_graph_changes(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+        nx.enable_journal(G)
+        v = nx.graph_version(G)
+        G.add_edge(2, 3, weight=4)
+        G.remove_nodes_from([0, 'missing'])
+        changes = [c[1:] for c in nx.changes_since(G, v)]
+        self.assertEqual(changes, [('add_node', 3), ('add_edge', 2, 3),
+                                   ('remove_edge', 0, 1),
+                                   ('remove_edge', 2, 0),
+                                   ('remove_node', 0)])
+        self.assertEqual(nx.changes_since(G, nx.graph_version(G)), [])
+
+    def test_multigraph_keys(self):
+        G = nx.MultiGraph([(0, 0), (0, 1), (0, 1)])
+        nx.enable_journal(G)
+        v = nx.graph_version(G)
+        G.remove_edge(0, 1)
+        G.remove_node(0)
+        changes = [c[1:] for c in nx.changes_since(G, v)]
+        self.assertEqual(changes, [('remove_edge', 0, 1, 1),
+                                   ('remove_edge', 0, 0, 0),
+                                   ('remove_edge', 0, 1, 0),
+                                   ('remove_node', 0)])
+
+    def test_unavailable_changes(self):
+        G = nx.Graph()
+        v = nx.graph_version(G)
+        G.add_edge(0, 1)
+        self.assertRaises(nx.NetworkXError, nx.changes_since, G, v)
+        nx.enable_journal(G, maxlen=3)
+        self.assertRaises(nx.NetworkXError, nx.changes_since, G, v)
+        v = nx.graph_version(G)
+        G.add_edge(1, 2)
+        self.assertEqual(len(nx.changes_since(G, v)), 2)
+        G.add_edges_from([(2, 3), (3, 4)])
+        self.assertRaises(nx.NetworkXError, nx.changes_since, G, v)
+        v = nx.graph_version(G)
+        G.clear()
+        self.assertRaises(nx.NetworkXError, nx.changes_since, G, v)
+        self.assertEqual(nx.changes_since(G, nx.graph_version(G)), [])
+        nx.disable_journal(G)
+        self.assertRaises(nx.NetworkXError, nx.changes_since, G, v)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import unittest
+import networkx as nx
+
+
+class TestLandmarkHeuristic(unittest.TestCase):
+    def assertAdmissible(self, G, h, pairs=100, seed=1):
+        rng = random.Random(seed)
+        nodes = list(G)
+        lengths = dict(nx.all_pairs_dijkstra_path_length(G))
+        for _ in range(pairs):
+            s, t = rng.choice(nodes), rng.choice(nodes)
+            if t not in lengths[s]:
+                self.assertRaises(nx.NetworkXNoPath, nx.astar_path,
+                                  G, s, t, h)
+                continue
+            self.assertLessEqual(h(s, t), lengths[s][t] + 1e-9)
+            self.assertAlmostEqual(nx.astar_path_length(G, s, t, h),
+                                   lengths[s][t])
+            # consistency: h(u, t) <= w(u, v) + h(v, t)
+            for u, v, w in G.edges(s, data='weight'):
+                self.assertLessEqual(h(u, t), w + h(v, t) + 1e-9)
+
+    def test_strategies(self):
+        rng = random.Random(2)
+        G = nx.grid_2d_graph(12, 12)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = rng.randint(1, 5)
+        for strategy in ('farthest', 'random', 'degree'):
+            h = nx.landmark_heuristic(G, k=4, strategy=strategy, seed=3)
+            self.assertEqual(len(h.landmarks), 4)
+            self.assertAdmissible(G, h)
+        h = nx.landmark_heuristic(G, strategy=[(0, 0), (5, 5)])
+        self.assertEqual(h.landmarks, [(0, 0), (5, 5)])
+        self.assertAdmissible(G, h)
+
+    def test_farthest(self):
+        G = nx.path_graph(10)
+        nx.set_edge_attributes(G, 1, 'weight')
+        h = nx.landmark_heuristic(G, k=3, seed=4)
+        self.assertIn(0, h.landmarks)
+        self.assertIn(9, h.landmarks)
+        self.assertEqual(h(2, 7), 5)
+
+    def test_directed_and_disconnected(self):
+        rng = random.Random(5)
+        D = nx.gnm_random_graph(80, 200, seed=5, directed=True)
+        D.add_nodes_from(range(80, 85))
+        for u, v, d in D.edges(data=True):
+            d['weight'] = rng.random()
+        h = nx.landmark_heuristic(D, k=5, seed=6)
+        self.assertAdmissible(D, h)
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        self.assertRaises(ValueError, nx.landmark_heuristic, G,
+                          strategy='nearest')
+        self.assertRaises(nx.NodeNotFound, nx.landmark_heuristic, G,
+                          strategy=[7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+
+
+def run(code):
+    """Runs `code` in a fresh interpreter and returns its output."""
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return out.decode().split()
+
+
+@unittest.skipIf(sys.version_info[:2] < (3, 7), 'subpackages are imported eagerly')
+class TestLazyImport(unittest.TestCase):
+    def test_subpackages_not_imported(self):
+        out = run("import sys, networkx as nx;"
+                  "print('networkx.generators' in sys.modules);"
+                  "nx.Graph([(0, 1)]);"
+                  "print('networkx.algorithms' in sys.modules)")
+        self.assertEqual(out, ['False', 'False'])
+
+    def test_first_lookup(self):
+        out = run("import sys, networkx as nx;"
+                  "print(nx.number_connected_components(nx.path_graph(3)),"
+                  "      'networkx.drawing' in sys.modules);"
+                  "print(hasattr(nx, 'no_such_function'),"
+                  "      'networkx.drawing' in sys.modules)")
+        self.assertEqual(out, ['1', 'False', 'False', 'True'])
+
+    def test_namespace(self):
+        out = run("from networkx import *;"
+                  "print(pagerank.__module__, bipartite.__name__)")
+        self.assertEqual(out, ['networkx.algorithms.link_analysis.pagerank_alg',
+                               'networkx.algorithms.bipartite'])
+        out = run("import networkx as nx; print('shortest_path' in dir(nx))")
+        self.assertEqual(out, ['True'])
+
+    def test_threads(self):
+        # lookups from other threads wait for the subpackage being loaded
+        out = run("import threading, networkx as nx;"
+                  "barrier = threading.Barrier(8);"
+                  "found = [];"
+                  "lookup = lambda: (barrier.wait(),"
+                  "                  found.append(callable(nx.pagerank)));"
+                  "threads = [threading.Thread(target=lookup)"
+                  "           for i in range(8)];"
+                  "[t.start() for t in threads];"
+                  "[t.join() for t in threads];"
+                  "print(found.count(True))")
+        self.assertEqual(out, ['8'])
+
+
+if __name__ == '__main__':
+    unittest.main()
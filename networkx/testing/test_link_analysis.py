@@ -0,0 +1,155 @@
+import unittest
+import networkx as nx
+
+
+def iterations(f, *args, **kwargs):
+    """Returns the fewest iterations after which `f` converges."""
+    for max_iter in range(1, 1000):
+        try:
+            f(*args, max_iter=max_iter, **kwargs)
+            return max_iter
+        except nx.PowerIterationFailedConvergence:
+            pass
+
+
+class TestSparseLinkAnalysis(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        global np
+        import numpy as np
+        import scipy  # noqa: F401
+
+    def setUp(self):
+        G = nx.gnp_random_graph(60, 0.06, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u * v) % 5 + 1
+        self.G = G
+        # a slowly mixing graph
+        self.grid = nx.DiGraph(nx.grid_2d_graph(12, 12))
+
+    def assertClose(self, a, b, places=7):
+        self.assertEqual(a.keys(), b.keys())
+        for n in a:
+            self.assertAlmostEqual(a[n], b[n], places=places)
+
+    def test_pagerank(self):
+        G = self.G
+        for kwargs in ({}, {'weight': None},
+                       {'alpha': 0.9, 'personalization': {1: 2, 3: 1}},
+                       {'dangling': {2: 1, 4: 3}}):
+            expected = nx.pagerank_numpy(G, **kwargs)
+            self.assertClose(nx.pagerank(G, tol=1e-10, **kwargs), expected)
+            for acceleration in (None, 'quadratic'):
+                self.assertClose(
+                    nx.pagerank_scipy(G, tol=1e-10, acceleration=acceleration,
+                                      **kwargs), expected)
+            self.assertClose(
+                nx.pagerank_scipy(G, tol=1e-8, dtype=np.float32, **kwargs),
+                expected, places=5)
+        self.assertRaises(ValueError, nx.pagerank_scipy, G,
+                          acceleration='aitken')
+
+    def test_pagerank_acceleration(self):
+        G = self.grid
+        plain = iterations(nx.pagerank_scipy, G, alpha=0.95, tol=1e-10)
+        accelerated = iterations(nx.pagerank_scipy, G, alpha=0.95, tol=1e-10,
+                                 acceleration='quadratic')
+        self.assertLess(accelerated, plain / 2)
+
+    def test_pagerank_warm_start(self):
+        G = self.grid
+        pr = nx.pagerank_scipy(G, tol=1e-10)
+        G.add_edge((0, 0), (6, 6))
+        cold = iterations(nx.pagerank_scipy, G, tol=1e-10)
+        warm = iterations(nx.pagerank_scipy, G, tol=1e-10, nstart=pr)
+        self.assertLess(warm, cold)
+        self.assertClose(nx.pagerank_scipy(G, tol=1e-10, nstart=pr),
+                         nx.pagerank(G, tol=1e-10))
+
+    def test_hits(self):
+        G = self.G
+        hubs, authorities = nx.hits_numpy(G)
+        for kwargs in ({}, {'acceleration': 'quadratic'},
+                       {'nstart': dict.fromkeys(G, 1)}):
+            h, a = nx.hits_scipy(G, tol=1e-12, max_iter=1000, **kwargs)
+            self.assertClose(h, hubs)
+            self.assertClose(a, authorities)
+        h, a = nx.hits_scipy(G, tol=1e-5, max_iter=1000, dtype=np.float32)
+        self.assertClose(h, hubs, places=5)
+        self.assertClose(a, authorities, places=5)
+        h, a = nx.hits(G, tol=1e-12, max_iter=1000)
+        self.assertClose(h, hubs)
+        self.assertClose(a, authorities)
+        cold = iterations(nx.hits_scipy, G, tol=1e-10)
+        warm = iterations(nx.hits_scipy, G, tol=1e-10, nstart=hubs)
+        self.assertLess(warm, cold)
+
+    def test_batch_personalized_pagerank(self):
+        from scipy import sparse
+        G = self.G
+        nodes = list(G)
+        rng = np.random.RandomState(1)
+        P = rng.rand(5, len(G)) * (rng.rand(5, len(G)) < 0.1)
+        P[:, 0] += 1
+        for kwargs in ({}, {'weight': None, 'alpha': 0.9},
+                       {'dangling': {2: 1, 4: 3}}):
+            pr = nx.batch_personalized_pagerank(G, P, tol=1e-10, **kwargs)
+            self.assertEqual(pr.shape, P.shape)
+            for row, p in zip(pr, P):
+                expected = nx.pagerank_scipy(
+                    G, tol=1e-10, personalization=dict(zip(nodes, p)),
+                    **kwargs)
+                self.assertClose(dict(zip(nodes, row)), expected)
+            np.testing.assert_allclose(
+                nx.batch_personalized_pagerank(G, sparse.csr_matrix(P),
+                                               tol=1e-10, **kwargs), pr)
+            np.testing.assert_allclose(
+                nx.batch_personalized_pagerank(G, P, tol=1e-8,
+                                               dtype=np.float32, **kwargs),
+                pr, atol=1e-5)
+        cold = iterations(nx.batch_personalized_pagerank, G, P, tol=1e-10)
+        warm = iterations(nx.batch_personalized_pagerank, G, P, tol=1e-10,
+                          nstart=pr)
+        self.assertLess(warm, cold)
+        self.assertRaises(ValueError, nx.batch_personalized_pagerank, G,
+                          P[:, 1:])
+        self.assertRaises(ValueError, nx.batch_personalized_pagerank, G,
+                          P * 0)
+        self.assertRaises(ValueError, nx.batch_personalized_pagerank, G, P,
+                          nstart=P[1:])
+
+    def test_approximate_personalized_pagerank(self):
+        G = nx.Graph(self.G)
+        for u, v, d in G.edges(data=True):
+            d['weight'] = (u + v) % 3 + 1
+        # isolated nodes, one of them a personalization node
+        G.add_nodes_from(['a', 'b'])
+        personalization = {1: 2, 3: 1, 'a': 1}
+        epsilon = 1e-5
+        for weight in (None, 'weight'):
+            exact = nx.pagerank_scipy(G, personalization=personalization,
+                                      weight=weight, tol=1e-12)
+            ppr = nx.approximate_personalized_pagerank(
+                G, personalization, epsilon=epsilon, weight=weight)
+            for n, d in G.degree(weight=weight):
+                # lower bounds within epsilon times the degree
+                self.assertLessEqual(ppr.get(n, 0), exact[n] + 1e-12)
+                self.assertLessEqual(exact[n] - ppr.get(n, 0),
+                                     epsilon * d + 1e-12)
+            self.assertAlmostEqual(ppr['a'], exact['a'], places=12)
+        # only nodes near the personalization nodes are visited
+        ppr = nx.approximate_personalized_pagerank(
+            nx.grid_2d_graph(100, 100), {(0, 0): 1}, epsilon=1e-3)
+        self.assertLess(len(ppr), 200)
+        self.assertRaises(nx.NodeNotFound,
+                          nx.approximate_personalized_pagerank, G, {-1: 1})
+        self.assertRaises(ValueError, nx.approximate_personalized_pagerank,
+                          G, {1: 0})
+        for epsilon in (0, -1e-3):
+            self.assertRaises(ValueError,
+                              nx.approximate_personalized_pagerank, G,
+                              {1: 1}, epsilon=epsilon)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import networkx as nx
+
+try:
+    import numpy as np
+    import scipy
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+@unittest.skipUnless(numpy, 'numpy and scipy not available')
+class TestNodeIndex(unittest.TestCase):
+    def test_cached_until_structural_change(self):
+        G = nx.path_graph(4)
+        idx = nx.node_index(G)
+        self.assertIs(nx.node_index(G), idx)
+        G.nodes[0]['color'] = 'red'
+        G[0][1]['weight'] = 5
+        self.assertIs(nx.node_index(G), idx)
+        for mutate in (lambda: G.add_edge(0, 3), lambda: G.remove_node(3),
+                       lambda: G.add_nodes_from([7]), G.clear):
+            mutate()
+            self.assertIsNot(nx.node_index(G), idx)
+            idx = nx.node_index(G)
+
+    def test_weights_are_read_live(self):
+        G = nx.DiGraph([(0, 1, {'weight': 2}), (1, 2, {'weight': 3})])
+        A = nx.to_scipy_sparse_matrix(G)
+        G[0][1]['weight'] = 7
+        B = nx.to_scipy_sparse_matrix(G)
+        self.assertEqual(A[0, 1], 2)
+        self.assertEqual(B[0, 1], 7)
+        B[0, 1] = 1
+        self.assertEqual(nx.to_scipy_sparse_matrix(G)[0, 1], 7)
+
+    def test_views_not_cached(self):
+        G = nx.path_graph(4)
+        H = G.subgraph([0, 1, 2])
+        self.assertIsNot(nx.node_index(H), nx.node_index(H))
+        G.remove_edge(1, 2)
+        self.assertEqual(nx.to_numpy_array(H).sum(), 2)
+
+    def test_matrices(self):
+        M = nx.MultiGraph([(0, 1, {'w': 1}), (0, 1, {'w': 4}), (1, 1)])
+        for G in (M, nx.CSRMultiGraph(M)):
+            np.testing.assert_array_equal(
+                nx.to_numpy_array(G, weight='w', multigraph_weight=max),
+                [[0, 4], [4, 1]])
+            np.testing.assert_array_equal(
+                nx.to_scipy_sparse_matrix(G, weight='w').todense(),
+                [[0, 5], [5, 1]])
+            np.testing.assert_array_equal(
+                nx.to_scipy_sparse_matrix(G, nodelist=[1, 0],
+                                          weight='w').todense(),
+                [[1, 5], [5, 0]])
+
+
+@unittest.skipUnless(numpy, 'numpy and scipy not available')
+class TestIndexedDijkstra(unittest.TestCase):
+    def generic(self, G, source, cutoff=None, weight='w'):
+        from networkx.algorithms.shortest_paths.weighted import \
+            _dijkstra_multisource, _weight_function
+        paths = {source: [source]}
+        dist = _dijkstra_multisource(G, [source], _weight_function(G, weight),
+                                     paths=paths, cutoff=cutoff)
+        return dist, paths
+
+    def assertSameResults(self, G, weight='w'):
+        nx.node_index(G)
+        for source in G:
+            for cutoff in (None, 4):
+                expected = self.generic(G, source, cutoff, weight)
+                result = nx.single_source_dijkstra(G, source, cutoff=cutoff,
+                                                   weight=weight)
+                self.assertEqual(result, expected)
+                # nodes are settled in the same order
+                self.assertEqual(list(result[0]), list(expected[0]))
+                # and paths are in the order in which nodes were reached
+                self.assertEqual(list(result[1]), list(expected[1]))
+        lengths = dict(nx.all_pairs_dijkstra_path_length(G, weight=weight))
+        paths = dict(nx.all_pairs_dijkstra_path(G, weight=weight))
+        for source in G:
+            dist, path = self.generic(G, source, weight=weight)
+            self.assertEqual(lengths[source], dist)
+            self.assertEqual(paths[source], path)
+            self.assertEqual(list(paths[source]), list(path))
+
+    def test_same_as_generic(self):
+        G = nx.gnm_random_graph(30, 80, seed=1)
+        G = nx.relabel_nodes(G, {n: ('n', n) for n in G})
+        for i, (u, v, d) in enumerate(G.edges(data=True)):
+            d['w'] = i % 4 + 1 if i % 3 else (i % 5) / 2 + 0.5
+        D = nx.DiGraph(G.edges(data=True))
+        M = nx.MultiGraph(G)
+        M.add_edges_from((u, v, {'w': 0.25}) for u, v in list(G.edges)[::4])
+        M.add_edge(('n', 0), ('n', 1))  # default weight
+        for H in (G, D, M):
+            self.assertSameResults(H)
+            self.assertSameResults(nx.CSRGraph(H) if not H.is_multigraph()
+                                   else nx.CSRMultiGraph(H))
+        self.assertSameResults(G, weight='missing')
+
+    def test_multi_source(self):
+        G = nx.path_graph(6)
+        nx.node_index(G)
+        dist, paths = nx.multi_source_dijkstra(G, {0, 5})
+        self.assertEqual(dist, {0: 0, 5: 0, 1: 1, 4: 1, 2: 2, 3: 2})
+        self.assertEqual(paths[3], [5, 4, 3])
+        self.assertEqual(nx.multi_source_dijkstra_path_length(G, {4}),
+                         {4: 0, 3: 1, 5: 1, 2: 2, 1: 3, 0: 4})
+        self.assertRaises(nx.NodeNotFound, nx.single_source_dijkstra, G, 9)
+
+    def test_negative_weights(self):
+        G = nx.DiGraph([(0, 1, {'weight': 3}), (0, 2, {'weight': 1}),
+                        (1, 2, {'weight': -5})])
+        nx.node_index(G)
+        self.assertRaises(ValueError, nx.single_source_dijkstra, G, 0)
+        self.assertRaises(ValueError, dict, nx.all_pairs_dijkstra_path(G))
+
+
+@unittest.skipUnless(numpy, 'numpy and scipy not available')
+class TestScipySparseView(unittest.TestCase):
+    def test_shared_read_only_structure(self):
+        G = nx.CSRDiGraph(nx.gnp_random_graph(30, 0.2, directed=True, seed=3))
+        idx = nx.node_index(G)
+        A = nx.to_scipy_sparse_view(G)
+        B = nx.to_scipy_sparse_view(G, dtype=float)
+        self.assertTrue(np.shares_memory(A.indices, B.indices))
+        self.assertTrue(np.shares_memory(A.indices, idx.indices))
+        self.assertFalse(A.data.flags.writeable)
+        self.assertFalse(A.indptr.flags.writeable)
+        np.testing.assert_array_equal(A.todense(),
+                                      nx.to_numpy_array(nx.DiGraph(G)))
+
+    def test_matches_matrix(self):
+        M = nx.MultiDiGraph([(2, 0, {'w': 2}), (0, 2), (0, 1), (0, 2),
+                             (1, 1, {'w': 3}), (1, 1)])
+        for G in (M, nx.CSRMultiDiGraph(M), nx.Graph(M), nx.ColumnarGraph(M)):
+            A = nx.to_scipy_sparse_view(G, weight='w')
+            self.assertTrue(A.has_canonical_format)
+            B = nx.to_scipy_sparse_matrix(G, weight='w')
+            self.assertEqual(abs(A - B).sum(), 0)
+        G[0][1]['w'] = 5
+        # nodes are in the order 2, 0, 1
+        self.assertEqual(nx.to_scipy_sparse_view(G, weight='w')[1, 2], 5)
+        G.add_edge(0, 3)
+        self.assertEqual(nx.to_scipy_sparse_view(G).shape, (4, 4))
+        self.assertRaises(nx.NetworkXError, nx.to_scipy_sparse_view,
+                          nx.Graph())
+
+
+if __name__ == '__main__':
+    unittest.main()
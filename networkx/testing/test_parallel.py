@@ -0,0 +1,143 @@
+import os
+import unittest
+import networkx as nx
+from networkx.utils import GraphSnapshot, effective_n_jobs, map_over_sources
+
+try:
+    import numpy as np
+    numpy = True
+except ImportError:
+    numpy = False
+
+
+def _out_degree(arrays, nodes, source):
+    indptr, indices, weights = arrays
+    return nodes[source], indptr[source + 1] - indptr[source]
+
+
+def path_weight(G, path, weight):
+    return sum(G[u][v][weight] for u, v in zip(path, path[1:]))
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        G = nx.gnm_random_graph(40, 120, seed=1)
+        self.G = nx.relabel_nodes(G, {n: ('n', n) for n in G})
+        for i, (u, v, d) in enumerate(self.G.edges(data=True)):
+            d['w'] = i % 7 + 1
+        # negative weights without negative cycles
+        self.D = nx.DiGraph((u, v) if u < v else (v, u)
+                            for u, v in self.G.edges)
+        for i, (u, v, d) in enumerate(self.D.edges(data=True)):
+            d['w'] = (i * 5) % 11 - 2
+
+    def test_effective_n_jobs(self):
+        self.assertEqual(effective_n_jobs(None), 1)
+        self.assertEqual(effective_n_jobs(3), 3)
+        self.assertEqual(effective_n_jobs(-1), os.cpu_count() or 1)
+        self.assertRaises(ValueError, effective_n_jobs, 0)
+
+    def test_snapshot(self):
+        with GraphSnapshot(self.G) as snapshot:
+            path = snapshot.path
+            result = list(map_over_sources(snapshot, _out_degree, self.G, 2))
+        self.assertEqual(result, list(self.G.degree))
+        self.assertFalse(os.path.exists(path))
+
+    def test_ordered_snapshot(self):
+        G = nx.Graph()
+        G.add_nodes_from([0, 1, 2, 3])
+        G.add_edges_from([(0, 3, {'w': 3}), (0, 1, {'w': 1.5}), (2, 1)])
+        with GraphSnapshot(G, weight='w', ordered=True) as snapshot:
+            indptr, indices, weights = snapshot.arrays()
+        self.assertEqual(list(indices), [3, 1, 0, 2, 1, 0])
+        self.assertEqual(list(weights), [3, 1.5, 1.5, 1, 1, 3])
+
+    def test_shortest_path_length(self):
+        for G in (self.G, self.D):
+            for cutoff in (None, 2):
+                self.assertEqual(
+                    list(nx.all_pairs_shortest_path_length(G, cutoff,
+                                                           n_jobs=2)),
+                    list(nx.all_pairs_shortest_path_length(G, cutoff)))
+
+    def test_dijkstra_path_length(self):
+        G = self.G
+        self.assertEqual(
+            list(nx.all_pairs_dijkstra_path_length(G, weight='w', n_jobs=2)),
+            list(nx.all_pairs_dijkstra_path_length(G, weight='w')))
+
+        def weight(u, v, d):
+            return None if d['w'] == 3 else d['w'] / 2
+        self.assertEqual(
+            list(nx.all_pairs_dijkstra_path_length(G, 10, weight, n_jobs=2)),
+            list(nx.all_pairs_dijkstra_path_length(G, 10, weight)))
+        M = nx.MultiGraph([(0, 1, {'w': 3}), (0, 1, {'w': 1}), (1, 2)])
+        self.assertEqual(
+            dict(nx.all_pairs_dijkstra_path_length(M, weight='w', n_jobs=2)),
+            dict(nx.all_pairs_dijkstra_path_length(M, weight='w')))
+
+    def test_no_edges(self):
+        # edgeless graphs and graphs whose edges are all hidden
+        def hidden(u, v, d):
+            return None
+        for G, weight in ((nx.empty_graph(4), 'weight'),
+                          (nx.empty_graph(4, nx.DiGraph), 'weight'),
+                          (self.G, hidden), (self.D, hidden)):
+            self.assertEqual(
+                list(nx.all_pairs_dijkstra_path_length(G, weight=weight,
+                                                       n_jobs=2)),
+                list(nx.all_pairs_dijkstra_path_length(G, weight=weight)))
+            with GraphSnapshot(G, weight=weight) as snapshot:
+                self.assertEqual(len(snapshot.arrays()[2]), 0)
+
+    def test_betweenness(self):
+        # identical floating point results, also for another order of
+        # the neighbors than that of the node numbers
+        G = nx.Graph()
+        G.add_nodes_from(reversed(list(self.G)))
+        G.add_edges_from(reversed(list(self.G.edges(data=True))))
+        for kwargs in ({}, {'weight': 'w'}, {'endpoints': True},
+                       {'k': 10, 'seed': 1, 'weight': 'w'}):
+            self.assertEqual(
+                list(nx.betweenness_centrality(G, n_jobs=2,
+                                               **kwargs).items()),
+                list(nx.betweenness_centrality(G, **kwargs).items()))
+        for G in (G, self.D):
+            for kwargs in ({}, {'weight': 'w'}, {'k': 10, 'seed': 1}):
+                self.assertEqual(
+                    list(nx.edge_betweenness_centrality(G, n_jobs=2,
+                                                        **kwargs).items()),
+                    list(nx.edge_betweenness_centrality(G, **kwargs).items()))
+
+    @unittest.skipUnless(numpy, 'numpy not available')
+    def test_numpy_weights(self):
+        G = nx.Graph()
+        for u, v, w in self.G.edges(data='w'):
+            G.add_edge(u, v, weight=np.float64(w / 2), hops=np.int64(w))
+        for weight in ('weight', 'hops'):
+            self.assertEqual(
+                dict(nx.all_pairs_dijkstra_path_length(G, weight=weight,
+                                                       n_jobs=2)),
+                dict(nx.all_pairs_dijkstra_path_length(G, weight=weight)))
+        self.assertEqual(
+            nx.betweenness_centrality(G, weight='weight', n_jobs=2),
+            nx.betweenness_centrality(G, weight='weight'))
+        with GraphSnapshot(G, weight='hops') as snapshot:
+            self.assertEqual(snapshot.arrays()[2].format, 'q')
+
+    def test_johnson(self):
+        D = self.D
+        serial = nx.johnson(D, weight='w')
+        parallel = nx.johnson(D, weight='w', n_jobs=2)
+        self.assertEqual(serial.keys(), parallel.keys())
+        for u, paths in serial.items():
+            self.assertEqual(paths.keys(), parallel[u].keys())
+            # shortest paths of equal length may differ
+            for v, path in paths.items():
+                self.assertEqual(path_weight(D, parallel[u][v], 'w'),
+                                 path_weight(D, path, 'w'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from itertools import islice
+
+import networkx as nx
+
+
+def simple_path_lengths(G, source, target, weight):
+    """Lengths of all simple paths from source to target, in order."""
+    lengths = []
+    for path in nx.all_simple_paths(G, source, target):
+        lengths.append(sum(G[u][v].get(weight, 1) if weight else 1
+                           for u, v in zip(path, path[1:])))
+    return sorted(lengths)
+
+
+def path_length(G, path, weight):
+    return sum(G[u][v].get(weight, 1) if weight else 1
+               for u, v in zip(path, path[1:]))
+
+
+class TestShortestSimplePaths(unittest.TestCase):
+    def test_all_paths_in_order(self):
+        for seed in range(40):
+            rnd = random.Random(seed)
+            G = nx.gnp_random_graph(8, 0.4, seed=seed,
+                                    directed=bool(seed % 2))
+            for u, v, d in G.edges(data=True):
+                d['w'] = rnd.randint(0, 3)
+            for weight in (None, 'w'):
+                expected = simple_path_lengths(G, 0, 7, weight)
+                if not expected:
+                    paths = nx.shortest_simple_paths(G, 0, 7, weight)
+                    self.assertRaises(nx.NetworkXNoPath, next, paths)
+                    continue
+                paths = list(nx.shortest_simple_paths(G, 0, 7, weight))
+                self.assertEqual([path_length(G, p, weight) for p in paths],
+                                 expected)
+                self.assertEqual(len(set(map(tuple, paths))), len(paths))
+                for path in paths:
+                    self.assertTrue(nx.is_simple_path(G, path))
+
+    def test_max_candidates(self):
+        G = nx.grid_2d_graph(5, 5)
+        for i, (u, v, d) in enumerate(G.edges(data=True)):
+            d['w'] = i % 4 + 1
+        expected = [path_length(G, p, 'w') for p in
+                    islice(nx.shortest_simple_paths(G, (0, 0), (4, 4), 'w'),
+                           50)]
+        for k in (1, 3, 10):
+            paths = nx.shortest_simple_paths(G, (0, 0), (4, 4), 'w',
+                                             max_candidates=k)
+            lengths = [path_length(G, p, 'w') for p in islice(paths, 50)]
+            self.assertEqual(lengths[:k + 1], expected[:k + 1])
+            self.assertEqual(lengths, sorted(lengths))
+        self.assertRaises(ValueError, next,
+                          nx.shortest_simple_paths(G, (0, 0), (4, 4),
+                                                   max_candidates=0))
+
+    def test_path_buffer_eviction(self):
+        buffer = nx.algorithms.simple_paths.PathBuffer(2)
+        for cost, path in [(3, [0, 3]), (1, [0, 1]), (3, [0, 4]), (2, [0, 2])]:
+            buffer.push(cost, path)
+        self.assertEqual(buffer.evicted, 2)
+        self.assertEqual([buffer.pop(), buffer.pop()], [[0, 1], [0, 2]])
+        # an evicted path can be pushed again
+        buffer.push(3, [0, 4])
+        self.assertEqual(buffer.pop(), [0, 4])
+
+    def test_source_is_target(self):
+        G = nx.path_graph(3)
+        self.assertEqual(list(nx.shortest_simple_paths(G, 1, 1)), [[1]])
+
+    def test_hidden_edges(self):
+        G = nx.cycle_graph(5)
+        G[0][1]['w'] = 10
+
+        def weight(u, v, d):
+            return None if d.get('w') == 10 else 1
+        self.assertEqual(list(nx.shortest_simple_paths(G, 0, 1, weight)),
+                         [[0, 4, 3, 2, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 from networkx.utils.misc import *
+from networkx.utils.cache import *
 from networkx.utils.decorators import *
 from networkx.utils.random_sequence import *
 from networkx.utils.union_find import *
 from networkx.utils.rcm import *
 from networkx.utils.heaps import *
+from networkx.utils.parallel import *
 from networkx.utils.contextmanagers import *
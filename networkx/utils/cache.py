@@ -0,0 +1,187 @@
+"""
+Cache of algorithm results for unchanged graphs.
+
+Functions decorated with :func:`~networkx.utils.decorators.memoize_on_graph`
+store their results in a :class:`GraphResultCache`, keyed on the graph,
+its version (see :func:`~networkx.graph_version`) and the other
+arguments.  Calling such a function again on a graph that has not been
+modified through its methods returns a copy of the stored result instead
+of recomputing it.
+
+The version of a graph does not change when attribute dicts are modified
+in place, e.g. by ``G[u][v]['weight'] = 3``.  Caching is therefore off
+until it is enabled by giving the cache a size.
+
+Examples
+--------
+>>> from networkx.utils import result_cache
+>>> result_cache.resize(64)
+>>> G = nx.karate_club_graph()
+>>> bc = nx.betweenness_centrality(G)
+>>> bc = nx.betweenness_centrality(G)
+>>> result_cache.cache_info()
+CacheInfo(hits=1, misses=1, maxsize=64, currsize=1)
+>>> G.add_edge(0, 9)
+>>> bc = nx.betweenness_centrality(G)  # recomputed
+>>> result_cache.cache_info().misses
+2
+>>> result_cache.resize(0)  # disable caching again
+"""
+import weakref
+from collections import OrderedDict, namedtuple
+
+__all__ = ['CacheInfo', 'GraphResultCache', 'result_cache']
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class GraphResultCache(object):
+    """Least recently used store of results of functions of graphs.
+
+    Entries are kept per graph and dropped as soon as the graph is
+    modified or garbage collected.  At most `maxsize` entries are kept
+    over all graphs; the least recently used one is evicted first.
+
+    Parameters
+    ----------
+    maxsize : int, optional (default=0)
+        The maximum number of results stored.  0 disables caching.
+    """
+
+    def __init__(self, maxsize=0):
+        self._maxsize = maxsize
+        # (id(G), func name, key) -> result, in least recently used order
+        self._entries = OrderedDict()
+        # id(G) -> [weakref to G, version, set of entry keys]
+        self._graphs = {}
+        self._stats = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        """The maximum number of results stored; 0 means disabled."""
+        return self._maxsize
+
+    def resize(self, maxsize):
+        """Sets the maximum number of results stored, evicting as needed.
+
+        A `maxsize` of 0 disables caching and empties the cache.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self._maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._evict()
+
+    def cache_info(self, name=None):
+        """Returns hit and miss statistics.
+
+        Parameters
+        ----------
+        name : string, optional (default=None)
+            If given, the statistics of the function of that name only.
+
+        Returns
+        -------
+        info : CacheInfo
+            A named tuple ``(hits, misses, maxsize, currsize)``.
+        """
+        if name is None:
+            return CacheInfo(self.hits, self.misses, self._maxsize,
+                             len(self._entries))
+        hits, misses = self._stats.get(name, (0, 0))
+        currsize = sum(1 for entry in self._entries if entry[1] == name)
+        return CacheInfo(hits, misses, self._maxsize, currsize)
+
+    def cache_clear(self):
+        """Removes all results and resets the statistics."""
+        self._entries.clear()
+        self._graphs.clear()
+        self._stats.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def clear_graph(self, G):
+        """Removes the results stored for graph `G`."""
+        record = self._graphs.pop(id(G), None)
+        if record is not None:
+            for entry in record[2]:
+                self._entries.pop(entry, None)
+
+    def _count(self, name, hit):
+        hits, misses = self._stats.get(name, (0, 0))
+        if hit:
+            self.hits += 1
+            self._stats[name] = (hits + 1, misses)
+        else:
+            self.misses += 1
+            self._stats[name] = (hits, misses + 1)
+
+    def _record(self, G):
+        """Returns the bookkeeping record of `G`, dropping stale results."""
+        gid = id(G)
+        record = self._graphs.get(gid)
+        if record is not None and record[0]() is not G:
+            # a collected graph whose id was reused
+            self.clear_graph(G)
+            record = None
+        if record is None:
+            ref = weakref.ref(G, self._collected(gid))
+            record = self._graphs[gid] = [ref, G._version, set()]
+        elif record[1] != G._version:
+            for entry in record[2]:
+                self._entries.pop(entry, None)
+            record[1] = G._version
+            record[2] = set()
+        return record
+
+    def _collected(self, gid):
+        selfref = weakref.ref(self)
+
+        def callback(ref):
+            cache = selfref()
+            if cache is not None:
+                record = cache._graphs.get(gid)
+                if record is not None and record[0] is ref:
+                    del cache._graphs[gid]
+                    for entry in record[2]:
+                        cache._entries.pop(entry, None)
+        return callback
+
+    def _evict(self):
+        entry, _ = self._entries.popitem(last=False)
+        record = self._graphs.get(entry[0])
+        if record is not None:
+            record[2].discard(entry)
+
+    def lookup(self, G, name, key):
+        """Returns ``(True, result)`` for a stored result, else
+        ``(False, None)``, and updates the statistics."""
+        # drops the results of an older version of G
+        self._record(G)
+        entry = (id(G), name, key)
+        try:
+            result = self._entries[entry]
+        except KeyError:
+            self._count(name, False)
+            return False, None
+        self._entries.move_to_end(entry)
+        self._count(name, True)
+        return True, result
+
+    def store(self, G, name, key, result):
+        """Stores `result` for graph `G`, function `name` and `key`."""
+        if self._maxsize <= 0:
+            return
+        record = self._record(G)
+        entry = (id(G), name, key)
+        self._entries[entry] = result
+        self._entries.move_to_end(entry)
+        record[2].add(entry)
+        while len(self._entries) > self._maxsize:
+            self._evict()
+
+
+#: The cache used by functions decorated with `memoize_on_graph`.
+result_cache = GraphResultCache()
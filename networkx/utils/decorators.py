@@ -1,4 +1,6 @@
 from collections import defaultdict
+from copy import copy
+from inspect import isgeneratorfunction, signature
 from os.path import splitext
 from contextlib import contextmanager
 from pathlib import Path
@@ -6,6 +8,7 @@ from pathlib import Path
 import networkx as nx
 from decorator import decorator
 from networkx.utils import create_random_state, create_py_random_state
+from networkx.utils.cache import result_cache
 
 __all__ = [
     'not_implemented_for',
@@ -15,6 +18,7 @@ __all__ = [
     'random_state',
     'np_random_state',
     'py_random_state',
+    'memoize_on_graph',
 ]
 
 
@@ -455,3 +459,88 @@ def py_random_state(random_state_index):
         new_args[random_state_index] = random_state
         return func(*new_args, **kwargs)
     return _random_state
+
+
+def memoize_on_graph(cacheable=None, copy_result=copy, cache=None):
+    """Decorator to reuse the results of a function of an unchanged graph.
+
+    The first argument of the decorated function must be a graph.  Results
+    are stored in a :class:`~networkx.utils.cache.GraphResultCache` keyed
+    on the graph, its version and the other arguments, and a copy of the
+    stored result is returned when the function is called again with the
+    same arguments on a graph that has not been modified since.
+
+    Calls on graph views, calls with unhashable arguments and calls for
+    which `cacheable` returns False always run the function.
+
+    Parameters
+    ----------
+    cacheable : function, optional (default=None)
+        Called with a dict of argument names to values (defaults
+        included); returns False if the result of the call must not be
+        reused, e.g. because it is random.
+
+    copy_result : function, optional (default=copy.copy)
+        Copies a result before it is returned, so that callers can modify
+        it without altering the stored result.  For generator functions it
+        is applied to each generated item; all items are generated and
+        stored by the first call.
+
+    cache : GraphResultCache, optional (default=None)
+        The cache to use.  If None, the shared
+        :data:`networkx.utils.cache.result_cache` is used.  Caching is
+        disabled while the size of the cache is 0 (the default).
+
+    Returns
+    -------
+    _memoize : function
+        The decorated function.
+
+    Examples
+    --------
+    Decorate functions like this::
+
+        @memoize_on_graph()
+        def total_degree(G, weight=None):
+            return sum(d for n, d in G.degree(weight=weight))
+
+        @memoize_on_graph(cacheable=lambda args: args['seed'] is not None)
+        def sampled_degree(G, k, seed=None):
+            ...
+
+    See Also
+    --------
+    networkx.utils.cache.GraphResultCache
+    networkx.graph_version
+    """
+    def _memoize_on_graph(func):
+        names = list(signature(func).parameters)[1:]
+        name = func.__name__
+        generator = isgeneratorfunction(func)
+
+        def _memoize(func, G, *args, **kwargs):
+            store = result_cache if cache is None else cache
+            if store.maxsize <= 0 or hasattr(G, '_graph') or \
+                    not hasattr(G, '_version'):
+                return func(G, *args, **kwargs)
+            if cacheable is not None:
+                arguments = dict(zip(names, args))
+                arguments.update(kwargs)
+                if not cacheable(arguments):
+                    return func(G, *args, **kwargs)
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return func(G, *args, **kwargs)
+            found, result = store.lookup(G, name, key)
+            if not found:
+                result = func(G, *args, **kwargs)
+                if generator:
+                    result = list(result)
+                store.store(G, name, key, result)
+            if generator:
+                return (copy_result(item) for item in result)
+            return copy_result(result)
+        return decorator(_memoize, func)
+    return _memoize_on_graph
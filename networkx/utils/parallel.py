@@ -0,0 +1,298 @@
+"""
+Running per-source computations on a pool of processes.
+
+Many algorithms repeat an independent computation from every node of a
+graph, e.g. a shortest path search.  :func:`map_over_sources` spreads
+the sources over a :class:`multiprocessing.Pool` and yields the results
+in source order as they arrive.
+
+Workers do not receive a pickled copy of the graph.  The structure of the
+graph and the edge weights are written once to a temporary file in the
+binary graph format (see :func:`~networkx.write_binary`) by
+:class:`GraphSnapshot`, and every worker memory maps that file, so that
+the operating system shares a single copy of the graph between all of
+them.
+
+Functions computing all pairs shortest paths take an `n_jobs` argument
+to run on a pool:
+
+>>> G = nx.grid_2d_graph(3, 3)
+>>> lengths = dict(nx.all_pairs_shortest_path_length(G, n_jobs=2))
+>>> lengths[(0, 0)][(2, 2)]
+4
+"""
+from array import array
+from numbers import Integral
+import os
+import tempfile
+
+import networkx as nx
+from networkx.classes.columns import AttributeColumns
+from networkx.classes.csrgraph import _CSR, _RangeIndex, _index_typecode
+
+__all__ = ['GraphSnapshot', 'map_over_sources', 'effective_n_jobs']
+
+
+def effective_n_jobs(n_jobs):
+    """Returns the number of processes to use for `n_jobs`.
+
+    None and 1 mean no parallelism.  Negative values count back from the
+    number of CPUs: -1 means all of them, -2 all but one, and so on.
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is 0.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+class GraphSnapshot(object):
+    """Read-only copy of a graph in a file shared by worker processes.
+
+    The snapshot holds the nodes numbered ``0 .. n-1`` in the order of
+    ``list(G)`` and the adjacency as a directed graph, with two opposite
+    edges for each edge of an undirected graph, so that the out-edges of
+    node ``i`` are the slots ``indptr[i]:indptr[i + 1]`` of its CSR
+    arrays (see :meth:`arrays`).  The file is deleted by :meth:`close`,
+    or on leaving a ``with`` block.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : None, string or function, optional (default=None)
+        If None, no edge data is stored.  Otherwise the edge weights, as
+        computed by the shortest path functions (see
+        :func:`~networkx.dijkstra_path`): the function is called once
+        per edge, and once per pair of adjacent nodes of multigraphs.
+        Edges whose weight is None are left out.  Weights are stored as
+        Python ints if they are all integers, as floats otherwise.  For
+        undirected graphs it is called with the endpoints in the order of
+        ``list(G)``, so weight functions must be symmetric.
+
+    ordered : bool, optional (default=False)
+        If True, the position of each neighbor in the adjacency of `G` is
+        stored as well, and the out-edges of each node are returned by
+        :meth:`arrays` in the order in which `G` lists them instead of by
+        node number.  Computations can then visit the nodes in the same
+        order as on `G`, at the cost of a copy of the arrays in each
+        process.
+
+    Attributes
+    ----------
+    path : string
+        The name of the snapshot file.
+    nodes : list
+        The nodes of `G`; node ``i`` of the snapshot is ``nodes[i]``.
+    """
+
+    def __init__(self, G, weight=None, ordered=False):
+        from networkx.algorithms.shortest_paths.weighted import \
+            _weight_function
+        self.nodes = nodes = list(G)
+        index = {n: i for i, n in enumerate(nodes)}
+        n = len(nodes)
+        directed = G.is_directed()
+        if weight is not None:
+            weight = _weight_function(G, weight)
+        # The CSR arrays are filled row by row straight from the adjacency
+        # of `G`, so that the graph is never held as a second graph object.
+        typecode = _index_typecode(max(n, sum(map(len, G._adj.values())))
+                                   + 1)
+        indptr = array(typecode, [0])
+        indices = array(typecode)
+        values = []
+        ranks = array('q')
+        # Undirected edges are weighed once, from the endpoint that comes
+        # first in `nodes`, and the weight is queued for the other one.
+        # Later rows i meet row j in increasing order, so `queue[head[j]]`
+        # is the weight of the next edge from j to a later row.
+        queue = []
+        head = array('q')
+        for i, u in enumerate(nodes):
+            head.append(len(queue))
+            row = sorted((index[v], rank, d)
+                         for rank, (v, d) in enumerate(G._adj[u].items()))
+            for j, rank, d in row:
+                if weight is not None:
+                    if directed or j >= i:
+                        w = weight(u, nodes[j], d)
+                        if not directed and j > i:
+                            queue.append(w)
+                    else:
+                        w = queue[head[j]]
+                        head[j] += 1
+                    if w is None:
+                        continue
+                    values.append(w)
+                indices.append(j)
+                if ordered:
+                    ranks.append(rank)
+            indptr.append(len(indices))
+        del queue, head
+        edge_columns = AttributeColumns()
+        if weight is not None:
+            edge_columns.set_column('weight', _weight_array(values))
+        del values
+        if ordered:
+            edge_columns.set_column('rank', ranks)
+        H = nx.CSRDiGraph()
+        H._set_storage(range(n), _RangeIndex(n), AttributeColumns(),
+                       _CSR(indptr, indices), edge_columns, len(indices))
+        fd, self.path = tempfile.mkstemp(suffix='.nxb')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                nx.write_binary(H, f)
+        except BaseException:
+            os.remove(self.path)
+            raise
+
+    def load(self):
+        """Returns the snapshot as a memory mapped CSR directed graph."""
+        return nx.read_binary(self.path)
+
+    def arrays(self):
+        """Returns the memory mapped CSR arrays of the snapshot.
+
+        Returns
+        -------
+        indptr, indices, weights : sequences
+            Slot `k` holds an edge to node ``indices[k]`` of weight
+            ``weights[k]``.  `weights` is None if the snapshot was taken
+            without weights; it is empty if it has no edges.
+        """
+        return _arrays(self.load())
+
+    def close(self):
+        """Deletes the snapshot file."""
+        if self.path is not None:
+            os.remove(self.path)
+            self.path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _arrays(H):
+    csr = H._csr
+    indptr, indices = csr.indptr, csr.indices
+    weights = None
+    if 'weight' in H.edge_columns:
+        weights = H.edge_columns.column('weight')[0]
+    if 'rank' in H.edge_columns:
+        # rows in the order of the original graph
+        rank = H.edge_columns.column('rank')[0]
+        order = []
+        for i in range(len(indptr) - 1):
+            order.extend(sorted(range(indptr[i], indptr[i + 1]),
+                                key=rank.__getitem__))
+        indices = _take(indices, order)
+        if weights is not None:
+            weights = _take(weights, order)
+    return indptr, indices, weights
+
+
+def _weight_array(values):
+    """Returns the weights as ints if they are all integers, else floats.
+
+    Weights of other numeric types, e.g. NumPy scalars, are converted.
+    Integers too large for a typed array are kept in a list.
+    """
+    if all(isinstance(w, Integral) for w in values):
+        try:
+            return array('q', map(int, values))
+        except OverflowError:
+            return [int(w) for w in values]
+    return array('d', map(float, values))
+
+
+def _take(values, order):
+    items = [values[k] for k in order]
+    if isinstance(values, memoryview):
+        return array(values.format, items)
+    return items
+
+
+# the snapshot arrays and the node labels of each worker process
+_worker = None
+
+
+def _init_worker(path, nodes):
+    global _worker
+    _worker = (_arrays(nx.read_binary(path)), nodes)
+
+
+def _run(task):
+    func, source, args = task
+    arrays, nodes = _worker
+    return func(arrays, nodes, source, *args)
+
+
+def map_over_sources(snapshot, func, sources, n_jobs=-1, args=(),
+                     chunksize=None):
+    """Yields ``func(arrays, nodes, i, *args)`` for each source on a pool.
+
+    Parameters
+    ----------
+    snapshot : GraphSnapshot
+        The graph shared by the workers.
+
+    func : function
+        A function defined at the top level of a module, so that it can
+        be sent to the workers.  It is called with the CSR arrays
+        ``(indptr, indices, weights)`` of the snapshot (see
+        :meth:`GraphSnapshot.arrays`), in which node ``i`` stands for
+        ``nodes[i]``, the list of nodes, the number of a source and
+        `args`.
+
+    sources : iterable
+        Nodes of the graph of the snapshot.
+
+    n_jobs : int, optional (default=-1)
+        The number of worker processes, see :func:`effective_n_jobs`.
+        With one job, `func` is run in the calling process.
+
+    args : tuple, optional
+        More arguments of `func`.  They are sent with every task and
+        should be small.
+
+    chunksize : int, optional
+        The number of sources sent to a worker at once.  By default the
+        sources are split into about four chunks per worker, of at most
+        64 sources.
+
+    Returns
+    -------
+    results : iterator
+        The values returned by `func`, in the order of `sources`.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    index = {n: i for i, n in enumerate(snapshot.nodes)}
+    tasks = ((func, index[s], args) for s in sources)
+    if n_jobs == 1:
+        arrays = snapshot.arrays()
+        for func, source, args in tasks:
+            yield func(arrays, snapshot.nodes, source, *args)
+        return
+    if chunksize is None:
+        chunksize = max(1, min(64, len(index) // (4 * n_jobs)))
+    import multiprocessing
+    pool = multiprocessing.Pool(n_jobs, _init_worker,
+                                (snapshot.path, snapshot.nodes))
+    try:
+        for result in pool.imap(_run, tasks, chunksize):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()